@@ -10,12 +10,17 @@ Usage:
 """
 
 import argparse
+import asyncio
+import contextlib
 import json
 import os
+import random
 import sys
 import time
 
-import requests
+import aiofiles
+import aiohttp
+import orjson
 
 # ── Config ───────────────────────────────────────────────────────────────────
 
@@ -24,146 +29,424 @@ MODEL_ID = "fal-ai/nano-banana"
 QUEUE_URL = f"https://queue.fal.run/{MODEL_ID}"
 COLLECTION_PATH = "output/full_collection.json"
 IMAGES_DIR = "output/images"
-DELAY_BETWEEN_REQUESTS = 1.0  # seconds between submitting requests
-POLL_INTERVAL = 2.0           # seconds between status polls
-MAX_POLL_ATTEMPTS = 150       # max polls per image (~5 min)
+REQUESTS_PER_SECOND = 10.0    # ceiling on calls to the queue host
+RATE_LIMIT_WINDOW = 60.0      # seconds that X-RateLimit-Limit is counted over
+RATE_LIMIT_LOW_WATER = 2      # pause until reset below this many remaining
+POLL_INTERVAL = 2.0           # seconds between status polls (stream fallback)
+MAX_WAIT = 300.0              # max seconds per image to finish, stream + polls (~5 min)
+STREAM_READ_TIMEOUT = 60.0    # max seconds of silence on the status stream
 MAX_RETRIES = 3               # retries on failure per image
+MAX_BACKOFF = 60.0            # cap on seconds between retries
+RETRYABLE_STATUSES = {408, 429}  # plus any 5xx; other errors are fatal
+CONCURRENCY = 16              # images in flight at once
+CONNECTION_HEADROOM = 8       # spare pooled connections beyond one per worker
+DOWNLOAD_CHUNK_SIZE = 65536   # bytes written per chunk when saving images
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_TRAILER = b"\x00\x00\x00\x00IEND\xaeB`\x82"  # empty IEND chunk ending every PNG
+
+API_TIMEOUT = aiohttp.ClientTimeout(total=30)
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=120)
+
+# Cleared the first time the queue rejects the status stream endpoint, so later
+# images go straight to polling instead of spending a request on it.
+status_stream_available = True
+
+# ── Rate limiting ────────────────────────────────────────────────────────────
+
+class RateLimiter:
+    """Token bucket shared by every worker talking to the queue host.
+
+    Refills at `rate` tokens per second. Responses feed their X-RateLimit-*
+    headers back in via update(), which can lower the rate or pause dispatch
+    until the server's window resets.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent, then consume a token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+                await asyncio.sleep(wait)
+
+    def update(self, headers):
+        """Adjust to the server's advertised limits, if it sent any."""
+        try:
+            limit = headers.get("X-RateLimit-Limit")
+            if limit is not None:
+                self.rate = min(self.max_rate, max(float(limit), 1.0) / RATE_LIMIT_WINDOW)
+
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = headers.get("X-RateLimit-Reset")
+            if remaining is not None and reset is not None and float(remaining) < RATE_LIMIT_LOW_WATER:
+                reset = float(reset)
+                # Either seconds until reset or an absolute epoch timestamp
+                delay = reset - time.time() if reset > 1e9 else reset
+                delay = min(max(delay, 0.0), MAX_BACKOFF)
+                self.paused_until = max(self.paused_until, time.monotonic() + delay)
+        except ValueError:
+            pass  # malformed header; keep the current settings
 
-# ── Helpers ──────────────────────────────────────────────────────────────────
-
-def headers():
-    return {
-        "Authorization": f"Key {FAL_KEY}",
-        "Content-Type": "application/json",
-    }
 
+# ── Helpers ──────────────────────────────────────────────────────────────────
 
-def auth_headers():
-    return {"Authorization": f"Key {FAL_KEY}"}
+# Built once and shared by every request. Image downloads go to the CDN and
+# deliberately carry no key.
+AUTH_HEADERS = {"Authorization": f"Key {FAL_KEY}"}
+JSON_HEADERS = {**AUTH_HEADERS, "Content-Type": "application/json"}
+
+# Request fields that are the same for every image; only the prompt varies
+PAYLOAD_BASE = {
+    "aspect_ratio": "1:1",
+    "output_format": "png",
+    "num_images": 1,
+}
+
+
+@contextlib.asynccontextmanager
+async def queue_call(
+    session: aiohttp.ClientSession,
+    limiter: RateLimiter,
+    method: str,
+    url: str,
+    headers: dict = AUTH_HEADERS,
+    **kwargs,
+):
+    """Make a rate-limited, authenticated call to the queue host."""
+    await limiter.acquire()
+    async with session.request(method, url, headers=headers, **kwargs) as resp:
+        limiter.update(resp.headers)
+        resp.raise_for_status()
+        yield resp
 
 
-def submit_request(prompt: str) -> dict:
+async def submit_request(session: aiohttp.ClientSession, limiter: RateLimiter, prompt: str) -> dict:
     """Submit an image generation request to the fal.ai queue."""
-    payload = {
-        "prompt": prompt,
-        "aspect_ratio": "1:1",
-        "output_format": "png",
-        "num_images": 1,
-    }
-    resp = requests.post(QUEUE_URL, headers=headers(), json=payload, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
-
-
-def poll_until_done(status_url: str) -> str:
-    """Poll the queue until the request completes. Returns the response URL status."""
-    for attempt in range(MAX_POLL_ATTEMPTS):
-        resp = requests.get(
-            status_url,
-            headers=auth_headers(),
-            params={"logs": 1},
-            timeout=30,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        status = data.get("status", "UNKNOWN")
+    payload = orjson.dumps({**PAYLOAD_BASE, "prompt": prompt})
+    async with queue_call(
+        session,
+        limiter,
+        "POST",
+        QUEUE_URL,
+        headers=JSON_HEADERS,
+        data=payload,
+        timeout=API_TIMEOUT,
+    ) as resp:
+        return orjson.loads(await resp.read())
+
+
+def check_status(data: dict) -> bool:
+    """Return True if a queue status payload is COMPLETED, raise if it failed."""
+    status = data.get("status", "UNKNOWN")
+    if status in ("FAILED", "CANCELLED"):
+        error_msg = data.get("error", "Unknown error")
+        raise RuntimeError(f"Request {status}: {error_msg}")
+    return status == "COMPLETED"
+
+
+async def stream_status(
+    session: aiohttp.ClientSession,
+    limiter: RateLimiter,
+    status_url: str,
+    timeout: float,
+) -> bool:
+    """Follow the queue's server-sent status stream for up to `timeout` seconds.
+    Returns True once COMPLETED, False if the stream closed before a final
+    status arrived."""
+    async with queue_call(
+        session,
+        limiter,
+        "GET",
+        f"{status_url}/stream",
+        params={"logs": 0},
+        timeout=aiohttp.ClientTimeout(total=timeout, sock_read=STREAM_READ_TIMEOUT),
+    ) as resp:
+        async for line in resp.content:
+            line = line.strip()
+            if line.startswith(b"data:") and check_status(orjson.loads(line[5:])):
+                return True
+    return False
 
-        if status == "COMPLETED":
-            return "COMPLETED"
-        elif status in ("FAILED", "CANCELLED"):
-            error_msg = data.get("error", "Unknown error")
-            raise RuntimeError(f"Request {status}: {error_msg}")
 
-        time.sleep(POLL_INTERVAL)
+async def poll_until_done(session: aiohttp.ClientSession, limiter: RateLimiter, status_url: str) -> str:
+    """Wait up to MAX_WAIT seconds for the request to complete. Returns the
+    response URL status.
 
-    raise TimeoutError(f"Request did not complete after {MAX_POLL_ATTEMPTS} polls")
+    The status stream holds one connection open and is pushed every status
+    change, so a typical image costs one request instead of ~15 polls. If the
+    stream is unavailable or drops early, fall back to interval polling for
+    whatever is left of the same deadline.
+    """
+    global status_stream_available
 
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + MAX_WAIT
 
-def fetch_result(response_url: str) -> dict:
-    """Fetch the final result from the queue."""
-    resp = requests.get(response_url, headers=auth_headers(), timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    if status_stream_available:
+        try:
+            if await stream_status(session, limiter, status_url, MAX_WAIT):
+                return "COMPLETED"
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            if (
+                isinstance(e, aiohttp.ClientResponseError)
+                and 400 <= e.status < 500
+                and e.status not in RETRYABLE_STATUSES
+            ):
+                if status_stream_available:
+                    status_stream_available = False
+                    print(f"    [!] Status stream unavailable ({e}), polling from now on")
+            elif loop.time() < deadline:
+                print(f"    [!] Status stream interrupted ({e}), polling instead")
+
+    while loop.time() < deadline:
+        async with queue_call(
+            session,
+            limiter,
+            "GET",
+            status_url,
+            params={"logs": 0},
+            timeout=API_TIMEOUT,
+        ) as resp:
+            data = orjson.loads(await resp.read())
+
+        if check_status(data):
+            return "COMPLETED"
 
+        await asyncio.sleep(POLL_INTERVAL)
 
-def download_image(image_url: str, dest_path: str):
-    """Download an image from URL to local file."""
-    resp = requests.get(image_url, timeout=120)
-    resp.raise_for_status()
-    with open(dest_path, "wb") as f:
-        f.write(resp.content)
+    raise TimeoutError(f"Request did not complete within {MAX_WAIT:.0f}s")
 
 
-def generate_single(token_id: int, prompt: str, force: bool = False) -> bool:
+async def fetch_result(session: aiohttp.ClientSession, limiter: RateLimiter, response_url: str) -> dict:
+    """Fetch the final result from the queue."""
+    async with queue_call(session, limiter, "GET", response_url, timeout=API_TIMEOUT) as resp:
+        return orjson.loads(await resp.read())
+
+
+async def download_image(session: aiohttp.ClientSession, image_url: str, dest_path: str):
+    """Download an image from URL to local file.
+
+    Writes to a .part file and renames it into place only once complete, so an
+    interrupted download never leaves a truncated PNG under the final name.
+    """
+    tmp_path = dest_path + ".part"
+    try:
+        async with session.get(image_url, timeout=DOWNLOAD_TIMEOUT) as resp:
+            resp.raise_for_status()
+            # Stream to disk so memory stays at one chunk per in-flight download
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    await f.write(chunk)
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def is_complete_image(path: str) -> bool:
+    """True if path is a whole PNG: it starts with the signature and ends with
+    the IEND chunk, so a truncated download is not mistaken for a finished one."""
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(PNG_SIGNATURE)) != PNG_SIGNATURE:
+                return False
+            f.seek(-len(PNG_TRAILER), os.SEEK_END)
+            return f.read() == PNG_TRAILER
+    except OSError:
+        return False
+
+
+def is_retryable(error: Exception) -> bool:
+    """Only throttling, server errors, timeouts and dropped connections (including
+    a body cut off mid-download) are worth retrying. Anything else (a 4xx, a
+    FAILED generation, a malformed response) is likely to fail the same way
+    again."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRYABLE_STATUSES or error.status >= 500
+    return isinstance(
+        error,
+        (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError, TimeoutError),
+    )
+
+
+def retry_delay(retry: int, error: Exception) -> float:
+    """Exponential backoff with equal jitter, honoring Retry-After on a 429."""
+    if isinstance(error, aiohttp.ClientResponseError) and error.status == 429 and error.headers:
+        try:
+            return min(MAX_BACKOFF, float(error.headers.get("Retry-After")))
+        except (TypeError, ValueError):
+            pass  # missing or an HTTP-date; use the normal backoff
+    return min(MAX_BACKOFF, 2 ** retry + random.uniform(0, 1))
+
+
+def scan_completed_images(wanted: set) -> set:
+    """Return the filenames from `wanted` that are finished PNGs in IMAGES_DIR.
+
+    One directory scan replaces a pair of stat calls per token; only wanted
+    files that actually exist are opened to check their contents.
+    """
+    try:
+        with os.scandir(IMAGES_DIR) as it:
+            return {
+                entry.name
+                for entry in it
+                if entry.name in wanted and entry.is_file() and is_complete_image(entry.path)
+            }
+    except FileNotFoundError:
+        return set()
+
+
+async def generate_single(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    limiter: RateLimiter,
+    token_id: int,
+    prompt: str,
+) -> bool:
     """Generate a single image. Returns True on success, False on failure."""
     filename = f"{token_id:04d}.png"
     dest_path = os.path.join(IMAGES_DIR, filename)
 
-    # Resume capability: skip if already exists (unless force/redo)
-    if not force and os.path.exists(dest_path) and os.path.getsize(dest_path) > 0:
-        return True  # already done
-
-    for retry in range(MAX_RETRIES):
-        try:
-            # Step 1: Submit to queue
-            queue_resp = submit_request(prompt)
-            request_id = queue_resp.get("request_id", "?")
-            status_url = queue_resp.get("status_url")
-            response_url = queue_resp.get("response_url")
-
-            if not status_url or not response_url:
-                raise RuntimeError(f"Missing status/response URLs in queue response: {queue_resp}")
-
-            # Step 2: Poll until done
-            poll_until_done(status_url)
-
-            # Step 3: Fetch result
-            result = fetch_result(response_url)
-
-            # Step 4: Extract image URL and download
-            images = result.get("images", [])
-            if not images:
-                # Some models return output.images or data.images
-                output = result.get("output", result.get("data", {}))
-                if isinstance(output, dict):
-                    images = output.get("images", [])
-
-            if not images:
-                raise RuntimeError(f"No images in response: {json.dumps(result)[:500]}")
-
-            image_url = images[0].get("url") if isinstance(images[0], dict) else images[0]
-            if not image_url:
-                raise RuntimeError(f"No URL in image data: {images[0]}")
-
-            download_image(image_url, dest_path)
-            return True
-
-        except Exception as e:
-            wait = 2 ** (retry + 1)
-            print(f"    [!] Attempt {retry + 1}/{MAX_RETRIES} failed: {e}")
-            if retry < MAX_RETRIES - 1:
-                print(f"    [!] Retrying in {wait}s...")
-                time.sleep(wait)
+    async with sem:
+        for retry in range(MAX_RETRIES):
+            try:
+                # Step 1: Submit to queue
+                queue_resp = await submit_request(session, limiter, prompt)
+                request_id = queue_resp.get("request_id", "?")
+                status_url = queue_resp.get("status_url")
+                response_url = queue_resp.get("response_url")
+
+                if not status_url or not response_url:
+                    raise RuntimeError(f"Missing status/response URLs in queue response: {queue_resp}")
+
+                # Step 2: Poll until done
+                await poll_until_done(session, limiter, status_url)
+
+                # Step 3: Fetch result
+                result = await fetch_result(session, limiter, response_url)
+
+                # Step 4: Extract image URL and download
+                images = result.get("images", [])
+                if not images:
+                    # Some models return output.images or data.images
+                    output = result.get("output", result.get("data", {}))
+                    if isinstance(output, dict):
+                        images = output.get("images", [])
+
+                if not images:
+                    raise RuntimeError(f"No images in response: {orjson.dumps(result).decode()[:500]}")
+
+                image_url = images[0].get("url") if isinstance(images[0], dict) else images[0]
+                if not image_url:
+                    raise RuntimeError(f"No URL in image data: {images[0]}")
+
+                await download_image(session, image_url, dest_path)
+                return True
+
+            except Exception as e:
+                print(f"    [!] #{token_id:04d} attempt {retry + 1}/{MAX_RETRIES} failed: {e}")
+                if not is_retryable(e):
+                    print(f"    [!] #{token_id:04d} not retryable, giving up")
+                    break
+                if retry < MAX_RETRIES - 1:
+                    wait = retry_delay(retry, e)
+                    print(f"    [!] #{token_id:04d} retrying in {wait:.1f}s...")
+                    await asyncio.sleep(wait)
 
     return False
 
 
+async def generate_all(
+    to_generate: list,
+    agents_by_id: dict,
+    concurrency: int,
+    rate: float,
+) -> list:
+    """Generate all requested images concurrently. Returns the list of failed token IDs."""
+    sem = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate, burst=concurrency)
+    # One pooled, keep-alive connector for the whole run: polls and fetches reuse
+    # warm TLS connections to queue.fal.run instead of reconnecting per call.
+    # Each worker holds at most one connection at a time (a status stream stays
+    # open for a whole generation), so the pool is sized from the concurrency.
+    # A smaller pool would leave submits and fetches queued for a connection
+    # until API_TIMEOUT expires.
+    pool_size = concurrency + CONNECTION_HEADROOM
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        limit_per_host=pool_size,
+        keepalive_timeout=60,
+        ttl_dns_cache=300,
+    )
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def run(tid: int):
+            ok = await generate_single(session, sem, limiter, tid, agents_by_id[tid]["prompt"])
+            return tid, ok
+
+        failed_ids = []
+        tasks = [run(tid) for tid in to_generate]
+        for i, finished in enumerate(asyncio.as_completed(tasks)):
+            tid, ok = await finished
+            progress = f"[{i + 1}/{len(to_generate)}]"
+            print(f"{progress} #{tid:04d} ({agents_by_id[tid]['rarity']})... {'OK' if ok else 'FAILED'}")
+            if not ok:
+                failed_ids.append(tid)
+
+    return sorted(failed_ids)
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    n = int(value)
+    if n <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return n
+
+
+def positive_float(value: str) -> float:
+    """argparse type for rates that must be above zero."""
+    x = float(value)
+    if not x > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return x
+
+
 # ── Main ─────────────────────────────────────────────────────────────────────
 
 def main():
-    global QUEUE_URL, DELAY_BETWEEN_REQUESTS
+    global QUEUE_URL
 
     parser = argparse.ArgumentParser(description="Generate NFT images via fal.ai")
     parser.add_argument("--start", type=int, default=1, help="First token ID (default: 1)")
     parser.add_argument("--end", type=int, default=2000, help="Last token ID (default: 2000)")
     parser.add_argument("--redo", type=str, default="", help="Comma-separated token IDs to regenerate")
-    parser.add_argument("--delay", type=float, default=DELAY_BETWEEN_REQUESTS, help="Delay between requests in seconds")
+    parser.add_argument("--rate", type=positive_float, default=REQUESTS_PER_SECOND, help=f"Max queue API calls per second (default: {REQUESTS_PER_SECOND})")
+    parser.add_argument("--concurrency", type=positive_int, default=CONCURRENCY, help=f"Images generated in parallel (default: {CONCURRENCY})")
     parser.add_argument("--model", type=str, default=MODEL_ID, help=f"fal.ai model ID (default: {MODEL_ID})")
     args = parser.parse_args()
 
     if args.model != MODEL_ID:
         QUEUE_URL = f"https://queue.fal.run/{args.model}"
-    DELAY_BETWEEN_REQUESTS = args.delay
 
     if not FAL_KEY:
         print("ERROR: FAL_KEY environment variable not set.")
@@ -188,15 +471,18 @@ def main():
 
     os.makedirs(IMAGES_DIR, exist_ok=True)
 
-    # Count already done (for resume display)
+    # Resume capability: skip images already on disk (unless force/redo)
+    if force:
+        done = set()
+    else:
+        done = scan_completed_images({f"{tid:04d}.png" for tid in token_ids})
     already_done = 0
     to_generate = []
     for tid in token_ids:
         if tid not in agents_by_id:
             print(f"WARNING: Token ID {tid} not found in collection, skipping")
             continue
-        dest = os.path.join(IMAGES_DIR, f"{tid:04d}.png")
-        if not force and os.path.exists(dest) and os.path.getsize(dest) > 0:
+        if f"{tid:04d}.png" in done:
             already_done += 1
         else:
             to_generate.append(tid)
@@ -204,35 +490,17 @@ def main():
     print(f"Already completed: {already_done}")
     print(f"To generate: {len(to_generate)}")
     print(f"Model: {args.model}")
-    print(f"Delay between requests: {DELAY_BETWEEN_REQUESTS}s")
+    print(f"Concurrency: {args.concurrency}")
+    print(f"Rate limit: {args.rate} req/s")
     print("-" * 50)
 
     if not to_generate:
         print("Nothing to generate — all images already exist!")
         return
 
-    successes = 0
-    failures = 0
-    failed_ids = []
-
-    for i, tid in enumerate(to_generate):
-        agent = agents_by_id[tid]
-        progress = f"[{i + 1}/{len(to_generate)}]"
-        print(f"{progress} #{tid:04d} ({agent['rarity']})...", end=" ", flush=True)
-
-        ok = generate_single(tid, agent["prompt"], force=force)
-
-        if ok:
-            successes += 1
-            print("OK")
-        else:
-            failures += 1
-            failed_ids.append(tid)
-            print("FAILED")
-
-        # Rate limiting delay (skip after last one)
-        if i < len(to_generate) - 1:
-            time.sleep(DELAY_BETWEEN_REQUESTS)
+    failed_ids = asyncio.run(generate_all(to_generate, agents_by_id, args.concurrency, args.rate))
+    failures = len(failed_ids)
+    successes = len(to_generate) - failures
 
     # ── Summary ──────────────────────────────────────────────────────────────
     print()
@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """Generate 2000 unique chibi agent NFT trait combinations."""
 
-import json
 import os
 import random
+import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import orjson
 
 random.seed(42)
+rng = np.random.default_rng(42)
 
 # ── Trait pools ──────────────────────────────────────────────────────────────
 
@@ -140,6 +145,22 @@ RARITY_LABELS = {
     4: "Legendary",
 }
 
+PROMPT_HEAD = "Chibi agent, oversized head, large glossy black eyes with white highlights"
+PROMPT_TAIL = "kawaii digital art, NFT collectible card style"
+
+# Every agent gets one trait from each of these, in this column order
+BASE_CATEGORIES = [
+    ("suit_style", SUIT_STYLES),
+    ("sunglasses", SUNGLASSES),
+    ("hair_style", HAIR_STYLES),
+    ("hair_color", HAIR_COLORS),
+    ("skin_tone", SKIN_TONES),
+    ("background", BACKGROUNDS),
+    ("expression", EXPRESSIONS),
+]
+BASE_POOL_SIZES = tuple(len(pool) for _, pool in BASE_CATEGORIES)
+TOTAL_BASE_COMBOS = int(np.prod(BASE_POOL_SIZES))
+
 OPTIONAL_CATEGORIES = [
     ("accessory", ACCESSORIES),
     ("tattoo", TATTOOS),
@@ -147,57 +168,83 @@ OPTIONAL_CATEGORIES = [
     ("freckles", FRECKLES),
 ]
 
+# ── OpenSea attributes ───────────────────────────────────────────────────────
+# Keys and labels are the same in every metadata file, so intern them once and
+# share them across all 2000 attribute lists.
+
+TRAIT_TYPE = sys.intern("trait_type")
+VALUE = sys.intern("value")
+RARITY_ATTRIBUTE = sys.intern("Rarity")
+
+BASE_ATTRIBUTES = [
+    (sys.intern(label), key)
+    for label, key in [
+        ("Suit Style", "suit_style"),
+        ("Sunglasses", "sunglasses"),
+        ("Hair Style", "hair_style"),
+        ("Hair Color", "hair_color"),
+        ("Skin Tone", "skin_tone"),
+        ("Background", "background"),
+        ("Expression", "expression"),
+    ]
+]
+
+OPTIONAL_ATTRIBUTES = [
+    (sys.intern(label), key)
+    for label, key in [
+        ("Accessory", "accessory"),
+        ("Tattoo", "tattoo"),
+        ("Piercing", "piercing"),
+        ("Freckles", "freckles"),
+    ]
+]
+
 
 def pick_extras(num_extras: int) -> dict:
     """Pick which optional categories are active and select a trait from each."""
-    cats = random.sample(OPTIONAL_CATEGORIES, k=num_extras)
-    result = {}
-    for name, pool in OPTIONAL_CATEGORIES:
-        if (name, pool) in cats:
-            result[name] = random.choice(pool)
-        else:
-            result[name] = None
-    return result
-
-
-def generate_agent(token_id: int, num_extras: int) -> dict:
-    """Generate a single agent's traits."""
-    traits = {
-        "suit_style": random.choice(SUIT_STYLES),
-        "sunglasses": random.choice(SUNGLASSES),
-        "hair_style": random.choice(HAIR_STYLES),
-        "hair_color": random.choice(HAIR_COLORS),
-        "skin_tone": random.choice(SKIN_TONES),
-        "background": random.choice(BACKGROUNDS),
-        "expression": random.choice(EXPRESSIONS),
+    # Bit i set means OPTIONAL_CATEGORIES[i] is active
+    mask = sum(1 << i for i in random.sample(range(len(OPTIONAL_CATEGORIES)), k=num_extras))
+    return {
+        name: random.choice(pool) if mask & (1 << i) else None
+        for i, (name, pool) in enumerate(OPTIONAL_CATEGORIES)
     }
+
+
+def sample_base_indices(n: int) -> list:
+    """Draw n distinct base-trait combinations in one batch.
+
+    Picks n different positions in the Cartesian product of BASE_CATEGORIES
+    and decodes each into per-category pool indices, so every row is unique
+    by construction. Returns n rows, one index per BASE_CATEGORIES entry.
+    """
+    combos = rng.choice(TOTAL_BASE_COMBOS, size=n, replace=False)
+    return np.stack(np.unravel_index(combos, BASE_POOL_SIZES), axis=1).tolist()
+
+
+def generate_agent(token_id: int, num_extras: int, base_indices: list) -> dict:
+    """Generate a single agent's traits from pre-drawn base-trait indices."""
+    traits = {name: pool[i] for (name, pool), i in zip(BASE_CATEGORIES, base_indices)}
     extras = pick_extras(num_extras)
     traits.update(extras)
 
     rarity = RARITY_LABELS[num_extras]
 
-    # Build prompt
-    parts = [
-        "Chibi agent, oversized head, large glossy black eyes with white highlights",
+    # Build prompt; absent optional traits are None and dropped by filter()
+    prompt = ", ".join(filter(None, (
+        PROMPT_HEAD,
         f"{traits['hair_color']} {traits['hair_style']}",
         traits["skin_tone"],
-    ]
-    if traits.get("freckles"):
-        parts.append(traits["freckles"])
-    parts.append(traits["expression"])
-    parts.append(traits["suit_style"])
-    parts.append(traits["sunglasses"])
-    if traits.get("accessory"):
-        parts.append(traits["accessory"])
-    if traits.get("tattoo"):
-        parts.append(traits["tattoo"])
-    if traits.get("piercing"):
-        parts.append(traits["piercing"])
-    parts.append("chest-up portrait")
-    parts.append(f"{traits['background']} background")
-    parts.append("kawaii digital art, NFT collectible card style")
-
-    prompt = ", ".join(parts)
+        traits["freckles"],
+        traits["expression"],
+        traits["suit_style"],
+        traits["sunglasses"],
+        traits["accessory"],
+        traits["tattoo"],
+        traits["piercing"],
+        "chest-up portrait",
+        f"{traits['background']} background",
+        PROMPT_TAIL,
+    )))
 
     return {
         "token_id": token_id,
@@ -211,24 +258,11 @@ def generate_agent(token_id: int, num_extras: int) -> dict:
 def build_opensea_metadata(agent: dict) -> dict:
     """Build OpenSea-standard metadata JSON for a single agent."""
     t = agent["traits"]
-    attributes = [
-        {"trait_type": "Suit Style", "value": t["suit_style"]},
-        {"trait_type": "Sunglasses", "value": t["sunglasses"]},
-        {"trait_type": "Hair Style", "value": t["hair_style"]},
-        {"trait_type": "Hair Color", "value": t["hair_color"]},
-        {"trait_type": "Skin Tone", "value": t["skin_tone"]},
-        {"trait_type": "Background", "value": t["background"]},
-        {"trait_type": "Expression", "value": t["expression"]},
-        {"trait_type": "Rarity", "value": agent["rarity"]},
-    ]
-    if t.get("accessory"):
-        attributes.append({"trait_type": "Accessory", "value": t["accessory"]})
-    if t.get("tattoo"):
-        attributes.append({"trait_type": "Tattoo", "value": t["tattoo"]})
-    if t.get("piercing"):
-        attributes.append({"trait_type": "Piercing", "value": t["piercing"]})
-    if t.get("freckles"):
-        attributes.append({"trait_type": "Freckles", "value": t["freckles"]})
+    attributes = [{TRAIT_TYPE: label, VALUE: t[key]} for label, key in BASE_ATTRIBUTES]
+    attributes.append({TRAIT_TYPE: RARITY_ATTRIBUTE, VALUE: agent["rarity"]})
+    attributes.extend(
+        {TRAIT_TYPE: label, VALUE: t[key]} for label, key in OPTIONAL_ATTRIBUTES if t.get(key)
+    )
 
     tid = agent["token_id"]
     return {
@@ -239,6 +273,13 @@ def build_opensea_metadata(agent: dict) -> dict:
     }
 
 
+def write_metadata(agent: dict):
+    """Write one agent's OpenSea metadata to output/metadata/NNNN.json."""
+    path = f"output/metadata/{agent['token_id']:04d}.json"
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(build_opensea_metadata(agent), option=orjson.OPT_INDENT_2))
+
+
 def main():
     # Build the rarity schedule: a list of num_extras values, one per agent
     schedule = []
@@ -247,33 +288,19 @@ def main():
     assert len(schedule) == 2000, f"Schedule has {len(schedule)} entries, expected 2000"
     random.shuffle(schedule)
 
-    # Generate agents, ensuring uniqueness
-    seen_combos = set()
-    agents = []
-    attempts = 0
-    max_attempts = 50000
-
-    for i, num_extras in enumerate(schedule):
-        token_id = i + 1
-        while attempts < max_attempts:
-            attempts += 1
-            agent = generate_agent(token_id, num_extras)
-            # Create a hashable key from the traits
-            t = agent["traits"]
-            combo_key = (
-                t["suit_style"], t["sunglasses"], t["hair_style"],
-                t["hair_color"], t["skin_tone"], t["background"],
-                t["expression"],
-                t.get("accessory"), t.get("tattoo"),
-                t.get("piercing"), t.get("freckles"),
-            )
-            if combo_key not in seen_combos:
-                seen_combos.add(combo_key)
-                agents.append(agent)
-                break
-        else:
-            print(f"ERROR: Could not generate unique combo after {max_attempts} attempts")
-            return
+    # Generate agents. Base traits are drawn as distinct combinations, so the
+    # full trait sets are unique without any rejection sampling.
+    base_rows = sample_base_indices(len(schedule))
+    agents = [
+        generate_agent(i + 1, num_extras, base_indices)
+        for i, (num_extras, base_indices) in enumerate(zip(schedule, base_rows))
+    ]
+
+    seen_combos = {
+        tuple(a["traits"][name] for name, _ in BASE_CATEGORIES + OPTIONAL_CATEGORIES)
+        for a in agents
+    }
+    assert len(seen_combos) == len(agents), "Duplicate trait combination generated"
 
     # ── Output ───────────────────────────────────────────────────────────────
 
@@ -281,20 +308,18 @@ def main():
     os.makedirs("output/images", exist_ok=True)
 
     # full_collection.json
-    with open("output/full_collection.json", "w") as f:
-        json.dump(agents, f, indent=2)
+    with open("output/full_collection.json", "wb") as f:
+        f.write(orjson.dumps(agents, option=orjson.OPT_INDENT_2))
 
     # prompts_only.txt
     with open("output/prompts_only.txt", "w") as f:
         for agent in agents:
             f.write(agent["prompt"] + "\n")
 
-    # Individual metadata files
-    for agent in agents:
-        meta = build_opensea_metadata(agent)
-        path = f"output/metadata/{agent['token_id']:04d}.json"
-        with open(path, "w") as f:
-            json.dump(meta, f, indent=2)
+    # Individual metadata files; each is an independent small write, so
+    # overlap them across threads rather than waiting on each in turn
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(write_metadata, agents))
 
     # ── Summary ──────────────────────────────────────────────────────────────
 
@@ -306,7 +331,7 @@ def main():
     print("=" * 60)
     print(f"Total agents generated: {len(agents)}")
     print(f"Unique combinations verified: {len(seen_combos)}")
-    print(f"Generation attempts: {attempts}")
+    print(f"Possible base combinations: {TOTAL_BASE_COMBOS:,}")
     print()
     print("RARITY DISTRIBUTION:")
     print("-" * 40)
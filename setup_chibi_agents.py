@@ -12,11 +12,11 @@ import base64, os
 
 PROJECT = "chibi-agents-nft"
 FILES = {
-    "requirements.txt": "cmVxdWVzdHM+PTIuMjguMAo=",
-    "README.md": "IyBDaGliaSBBZ2VudHMgTkZUIOKAlCBJbWFnZSBHZW5lcmF0aW9uIFBpcGVsaW5lCgpBIHBpcGVsaW5lIGZvciBnZW5lcmF0aW5nIGEgMjAwMC1waWVjZSBjaGliaSBzZWNyZXQgYWdlbnQgTkZUIGNvbGxlY3Rpb24gdXNpbmcgZmFsLmFpLgoKIyMgU2V0dXAKCmBgYGJhc2gKIyBJbnN0YWxsIGRlcGVuZGVuY2llcwpwaXAgaW5zdGFsbCAtciByZXF1aXJlbWVudHMudHh0CgojIFNldCB5b3VyIGZhbC5haSBBUEkga2V5CmV4cG9ydCBGQUxfS0VZPSJ5b3VyLWZhbC1hcGkta2V5LWhlcmUiCmBgYAoKIyMgU3RlcCAxOiBHZW5lcmF0ZSBQcm9tcHRzICYgTWV0YWRhdGEKCmBgYGJhc2gKcHl0aG9uIGdlbmVyYXRlX3Byb21wdHMucHkKYGBgCgpUaGlzIGNyZWF0ZXM6Ci0gYG91dHB1dC9mdWxsX2NvbGxlY3Rpb24uanNvbmAg4oCUIGFsbCAyMDAwIGFnZW50cyB3aXRoIHByb21wdHMsIHRyYWl0cywgYW5kIHJhcml0eQotIGBvdXRwdXQvcHJvbXB0c19vbmx5LnR4dGAg4oCUIGp1c3QgcHJvbXB0cywgb25lIHBlciBsaW5lCi0gYG91dHB1dC9tZXRhZGF0YS8wMDAxLmpzb25gIHRocm91Z2ggYG91dHB1dC9tZXRhZGF0YS8yMDAwLmpzb25gIOKAlCBPcGVuU2VhLXN0YW5kYXJkIG1ldGFkYXRhCgojIyMgUmFyaXR5IERpc3RyaWJ1dGlvbgp8IFJhcml0eSAgICB8IENvdW50IHwgUGVyY2VudGFnZSB8CnwtLS0tLS0tLS0tLXwtLS0tLS0tfC0tLS0tLS0tLS0tLXwKfCBDb21tb24gICAgfCA0MDAgICB8IDIwJSAgICAgICAgfAp8IFVuY29tbW9uICB8IDc2MCAgIHwgMzglICAgICAgICB8CnwgUmFyZSAgICAgIHwgNjAwICAgfCAzMCUgICAgICAgIHwKfCBMZWdlbmRhcnkgfCAyNDAgICB8IDEyJSAgICAgICAgfAoKIyMgU3RlcCAyOiBHZW5lcmF0ZSBJbWFnZXMKCmBgYGJhc2gKIyBUZXN0IGJhdGNoIChmaXJzdCAyMCkKcHl0aG9uIGdlbmVyYXRlX2ltYWdlcy5weSAtLXN0YXJ0IDEgLS1lbmQgMjAKCiMgRnVsbCBydW4gKGFsbCAyMDAwKQpweXRob24gZ2VuZXJhdGVfaW1hZ2VzLnB5CgojIFJlZG8gc3BlY2lmaWMgaW1hZ2VzCnB5dGhvbiBnZW5lcmF0ZV9pbWFnZXMucHkgLS1yZWRvIDMsMTcsNDIKCiMgVXNlIGEgZGlmZmVyZW50IG1vZGVsCnB5dGhvbiBnZW5lcmF0ZV9pbWFnZXMucHkgLS1tb2RlbCBmYWwtYWkvbmFuby1iYW5hbmEtcHJvCgojIEFkanVzdCBkZWxheSBiZXR3ZWVuIHJlcXVlc3RzIChkZWZhdWx0IDEuMHMpCnB5dGhvbiBnZW5lcmF0ZV9pbWFnZXMucHkgLS1kZWxheSAyLjAKYGBgCgpGZWF0dXJlczoKLSAqKlJlc3VtZSBjYXBhYmlsaXR5Kiog4oCUIHJlLXJ1bm5pbmcgc2tpcHMgYWxyZWFkeS1kb3dubG9hZGVkIGltYWdlcwotICoqQmF0Y2ggc3VwcG9ydCoqIOKAlCB1c2UgYC0tc3RhcnRgIGFuZCBgLS1lbmRgIHRvIGdlbmVyYXRlIGEgcmFuZ2UKLSAqKlJlZG8gbW9kZSoqIOKAlCBgLS1yZWRvIDMsMTcsNDJgIHJlZ2VuZXJhdGVzIG9ubHkgdGhvc2UgdG9rZW4gSURzCi0gKipSYXRlIGxpbWl0aW5nKiog4oCUIGNvbmZpZ3VyYWJsZSBkZWxheSBiZXR3ZWVuIHJlcXVlc3RzCi0gKipBdXRvLXJldHJ5Kiog4oCUIDMgcmV0cmllcyBwZXIgaW1hZ2Ugd2l0aCBleHBvbmVudGlhbCBiYWNrb2ZmCi0gKipQcm9ncmVzcyB0cmFja2luZyoqIOKAlCByZXBvcnRzIHN1Y2Nlc3MvZmFpbHVyZSBjb3VudHMgYW5kIGxpc3RzIGZhaWxlZCBJRHMKCkltYWdlcyBhcmUgc2F2ZWQgdG8gYG91dHB1dC9pbWFnZXMvMDAwMS5wbmdgIHRocm91Z2ggYG91dHB1dC9pbWFnZXMvMjAwMC5wbmdgLgoKIyMgU3RlcCAzOiBVcGRhdGUgTWV0YWRhdGEgd2l0aCBJUEZTIENJRAoKQWZ0ZXIgdXBsb2FkaW5nIGltYWdlcyB0byBJUEZTOgoKYGBgYmFzaApweXRob24gdXBkYXRlX21ldGFkYXRhX2NpZC5weSBRbVlvdXJBY3R1YWxDSURIZXJlCmBgYAoKVGhpcyByZXBsYWNlcyBgWU9VUl9DSURfSEVSRWAgaW4gYWxsIDIwMDAgbWV0YWRhdGEgZmlsZXMgd2l0aCB5b3VyIHJlYWwgQ0lELgoKIyMgUHJvamVjdCBTdHJ1Y3R1cmUKCmBgYApjaGliaS1hZ2VudHMtbmZ0LwrilJzilIDilIAgZ2VuZXJhdGVfcHJvbXB0cy5weSAgICAgICMgUGhhc2UgMTogdHJhaXQgZ2VuZXJhdGlvbiAmIG1ldGFkYXRhCuKUnOKUgOKUgCBnZW5lcmF0ZV9pbWFnZXMucHkgICAgICAgIyBQaGFzZSAyOiBmYWwuYWkgaW1hZ2UgZ2VuZXJhdGlvbgrilJzilIDilIAgdXBkYXRlX21ldGFkYXRhX2NpZC5weSAgICMgUGhhc2UgMzogSVBGUyBDSUQgcmVwbGFjZW1lbnQK4pSc4pSA4pSAIHJlcXVpcmVtZW50cy50eHQK4pSc4pSA4pSAIFJFQURNRS5tZArilJTilIDilIAgb3V0cHV0LyAgICAgICAgICAgICAgICAgICMgY3JlYXRlZCBieSBzY3JpcHRzCiAgICDilJzilIDilIAgZnVsbF9jb2xsZWN0aW9uLmpzb24KICAgIOKUnOKUgOKUgCBwcm9tcHRzX29ubHkudHh0CiAgICDilJzilIDilIAgbWV0YWRhdGEvCiAgICDilIIgICDilJzilIDilIAgMDAwMS5qc29uCiAgICDilIIgICDilJTilIDilIAgLi4uCiAgICDilJTilIDilIAgaW1hZ2VzLwogICAgICAgIOKUnOKUgOKUgCAwMDAxLnBuZwogICAgICAgIOKUlOKUgOKUgCAuLi4KYGBgCg==",
-    "generate_prompts.py": "IyEvdXNyL2Jpbi9lbnYgcHl0aG9uMwoiIiJHZW5lcmF0ZSAyMDAwIHVuaXF1ZSBjaGliaSBhZ2VudCBORlQgdHJhaXQgY29tYmluYXRpb25zLiIiIgoKaW1wb3J0IGpzb24KaW1wb3J0IG9zCmltcG9ydCByYW5kb20KZnJvbSBjb2xsZWN0aW9ucyBpbXBvcnQgQ291bnRlcgoKcmFuZG9tLnNlZWQoNDIpCgojIOKUgOKUgCBUcmFpdCBwb29scyDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKClNVSVRfU1RZTEVTID0gWwogICAgImJsYWNrIHN1aXQgYmxhY2sgdGllIiwgImJsYWNrIHN1aXQgYmxhY2sgdHVydGxlbmVjayIsCiAgICAiYmxhY2sgc3VpdCBvcGVuIGNvbGxhciBibGFjayBzaGlydCIsICJibGFjayBzdWl0IHdoaXRlIHNoaXJ0IGxvb3NlIHRpZSIsCiAgICAiYmxhY2sgc3VpdCB3aGl0ZSBzaGlydCBza2lubnkgYmxhY2sgdGllIiwgImJsYWNrIGRvdWJsZS1icmVhc3RlZCBzdWl0IiwKICAgICJibGFjayB0aHJlZS1waWVjZSBzdWl0IHdpdGggdmVzdCB2aXNpYmxlIiwgImJsYWNrIHN1aXQgbWFuZGFyaW4gY29sbGFyIiwKICAgICJibGFjayBzdWl0IGJ1dHRvbmVkIGFsbCB0aGUgd2F5IHVwIiwgImJsYWNrIHN1aXQgcm9sbGVkIHNsZWV2ZXMiLAogICAgInJ1bXBsZWQgYmxhY2sgc3VpdCBubyB0aWUiLCAic2hhcnAgYmxhY2sgc3VpdCBibGFjayBzaGlydCIsCiAgICAiY3Jpc3AgYmxhY2sgc3VpdCB3aGl0ZSBzaGlydCBibGFjayB0aWUiLCAiYmxhY2sgc3VpdCB3aXRoIHBvY2tldCBzcXVhcmUiLApdCgpTVU5HTEFTU0VTID0gWwogICAgImJsYWNrIGF2aWF0b3Igc3VuZ2xhc3NlcyIsICJibGFjayB3YXlmYXJlciBzdW5nbGFzc2VzIiwKICAgICJyb3VuZCBibGFjayBzdW5nbGFzc2VzIiwgInJlY3Rhbmd1bGFyIGJsYWNrIHN1bmdsYXNzZXMiLAogICAgIndyYXBhcm91bmQgYmxhY2sgc3VuZ2xhc3NlcyIsICJibGFjayBjbHVibWFzdGVyIHN1bmdsYXNzZXMiLAogICAgImNhdC1leWUgYmxhY2sgc3VuZ2xhc3NlcyIsICJvdmFsIGJsYWNrIHN1bmdsYXNzZXMiLAogICAgImFuZ3VsYXIgYmxhY2sgc3VuZ2xhc3NlcyIsICJ0aGluIHJlY3Rhbmd1bGFyIGJsYWNrIHN1bmdsYXNzZXMiLApdCgpIQUlSX1NUWUxFUyA9IFsKICAgICJzaG9ydCBzcGlreSBoYWlyIiwgImxvbmcgc3RyYWlnaHQgaGFpciIsICJtZXNzeSBjdXJseSBoYWlyIiwKICAgICJzbGlja2VkIGJhY2sgaGFpciIsICJzaG9ydCBidXp6Y3V0IiwgImxvbmcgd2F2eSBoYWlyIHdpdGggYmFuZ3MiLAogICAgInNob3J0IHRleHR1cmVkIGhhaXIgd2l0aCB1bmRlcmN1dCIsICJtZWRpdW0gdG91c2xlZCBoYWlyIiwKICAgICJuZWF0IHNob3J0IGhhaXIgd2l0aCBzaWRlIHBhcnQiLCAic2hvcnQgY2hvcHB5IGhhaXIiLAogICAgInRpZ2h0IGJyYWlkcyBwdWxsZWQgYmFjayIsICJzaG9ydCBmbGF0LXRvcCBtaWxpdGFyeSBoYWlyY3V0IiwKICAgICJtZXNzeSBtZWRpdW0gaGFpciB3aXRoIGJhbmdzIiwgImxvbmcgaGFpciBpbiBhIGJ1biIsICJtb2hhd2siLAogICAgInNob3VsZGVyIGxlbmd0aCBzdHJhaWdodCBoYWlyIiwKXQoKSEFJUl9DT0xPUlMgPSBbCiAgICAiYmxhY2siLCAiZGFyayBicm93biIsICJsaWdodCBicm93biIsICJibG9uZGUiLCAiZGFyayBibG9uZGUiLAogICAgInBsYXRpbnVtIGJsb25kZSIsICJyZWQiLCAiZGFyayByZWQiLCAiYXVidXJuIiwgInNpbHZlci13aGl0ZSIsCiAgICAiZHVzdHkgYmx1ZSIsICJwaW5rIiwgImdyYXkiLCAiamV0IGJsYWNrIiwgInN0cmF3YmVycnkgYmxvbmRlIiwKICAgICJwdXJwbGUiLCAiZ3JlZW4tdGludGVkIGJsYWNrIiwKXQoKU0tJTl9UT05FUyA9IFsKICAgICJwYWxlIHNraW4iLCAibGlnaHQgc2tpbiIsICJmYWlyIHBpbmsgc2tpbiIsICJsaWdodCB0YW4gc2tpbiIsCiAgICAib2xpdmUgc2tpbiIsICJ3YXJtIG1lZGl1bSBza2luIiwgInRhbiBza2luIiwgIndhcm0gZ29sZGVuLWJyb3duIHNraW4iLAogICAgImJyb3duIHNraW4iLCAiZGFyayBicm93biBza2luIiwgImRlZXAgZGFyayBza2luIiwgInBhbGUgcG9yY2VsYWluIHNraW4iLApdCgpBQ0NFU1NPUklFUyA9IFsKICAgICJjb2lsZWQgY2xlYXIgZWFycGllY2UiLCAicmFkaW8gZWFycGllY2Ugd2l0aCBjb2lsZWQgY29yZCIsCiAgICAic2luZ2xlIGVhcnBpZWNlIiwgImFtZXJpY2FuIGZsYWcgbGFwZWwgcGluIiwgInNpbHZlciBsYXBlbCBwaW4iLAogICAgImJhZGdlIGxhbnlhcmQgdHVja2VkIGludG8gamFja2V0IiwgInBlbiBjbGlwcGVkIHRvIGJyZWFzdCBwb2NrZXQiLAogICAgImNsYXNzaWZpZWQgZm9sZGVyIHBlZWtpbmcgZnJvbSBqYWNrZXQiLCAiY2lnYXJldHRlIGJlaGluZCBlYXIiLAogICAgInNpbHZlciB0aWUgY2xpcCIsICJjaGFpbiBjb25uZWN0aW5nIGVhciBjdWZmIHRvIGNvbGxhciIsCiAgICAiZG9nIHRhZ3MgdHVja2VkIHVuZGVyIHNoaXJ0IiwgIndyaXN0d2F0Y2ggcGVla2luZyBmcm9tIHNsZWV2ZSIsCl0KClRBVFRPT1MgPSBbCiAgICAibmVjayB0YXR0b28gcGVla2luZyBhYm92ZSBjb2xsYXIiLCAiaGFuZCB0YXR0b29zIHZpc2libGUiLAogICAgInNsZWV2ZSB0YXR0b28gcGVla2luZyBmcm9tIGN1ZmYiLCAidGVhcmRyb3AgZmFjZSB0YXR0b28iLAogICAgInNwaWRlciB3ZWIgdGF0dG9vIG9uIG5lY2siLCAiYmFyY29kZSB0YXR0b28gb24gbmVjayIsCiAgICAiY3Jvc3MgdGF0dG9vIHVuZGVyIGV5ZSIsICJzbmFrZSB0YXR0b28gY3Jhd2xpbmcgdXAgbmVjayIsCiAgICAicm9zZSB0YXR0b28gYmVoaW5kIGVhciIsICJza3VsbCB0YXR0b28gYmVoaW5kIGVhciIsCiAgICAiZmxhbWUgdGF0dG9vIG9uIG5lY2siLCAia251Y2tsZSB0YXR0b29zIiwgInN0YXIgdGF0dG9vIGJlaGluZCBlYXIiLAogICAgImRhZ2dlciB0YXR0b28gb24gaGFuZCIsICJmb3JlYXJtIHRhdHRvb3MgdmlzaWJsZSIsCl0KClBJRVJDSU5HUyA9IFsKICAgICJnb2xkIG5vc2Ugc3R1ZCIsICJzaWx2ZXIgbm9zZSByaW5nIiwgInNlcHR1bSByaW5nIiwgImJ1bGwgbm9zZSByaW5nIiwKICAgICJleWVicm93IHBpZXJjaW5nIiwgImxpcCByaW5nIiwgImRvdWJsZSBub3NlIHJpbmciLAogICAgImluZHVzdHJpYWwgZWFyIHBpZXJjaW5nIiwgImRvdWJsZSBob29wIGVhcnJpbmciLCAiZWFyIGN1ZmYiLAogICAgImNoYWluIG5vc2UgcmluZyB0byBlYXIgY3VmZiIsICJ0b25ndWUgcGllcmNpbmciLApdCgpGUkVDS0xFUyA9IFsKICAgICJmcmVja2xlcyBvbiBub3NlIiwgInNjYXR0ZXJlZCBmcmVja2xlcyBhY3Jvc3MgY2hlZWtzIiwKICAgICJsaWdodCBmcmVja2xlcyIsICJzdWJ0bGUgZnJlY2tsZXMiLApdCgpCQUNLR1JPVU5EUyA9IFsKICAgICJncmFpbnkgc3VydmVpbGxhbmNlIGZvb3RhZ2Ugb2YgcGFya2luZyBnYXJhZ2UiLAogICAgInVuZGVyZ3JvdW5kIGJ1bmtlciB3aXRoIHJlZCBlbWVyZ2VuY3kgbGlnaHRzIiwKICAgICJjb3JrIGJvYXJkIHdpdGggcmVkIHN0cmluZyBjb25zcGlyYWN5IHdhbGwiLAogICAgImZvZ2d5IGJsYWNrIGhlbGljb3B0ZXIgdGFybWFjIiwKICAgICJlbXB0eSBpbnRlcnJvZ2F0aW9uIHJvb20gc2luZ2xlIGxpZ2h0YnVsYiIsCiAgICAicmVkYWN0ZWQgZG9jdW1lbnRzIHNjYXR0ZXJlZCBkZXNrIiwKICAgICJzaGFkb3d5IGhhbGx3YXkgd2l0aCBmbGlja2VyaW5nIGZsdW9yZXNjZW50IGxpZ2h0cyIsCiAgICAiZGVzZXJ0IGhpZ2h3YXkgQXJlYSA1MSBzZWFyY2hsaWdodHMiLAogICAgInNlY3JldCB1bmRlcmdyb3VuZCBsYWIgd2l0aCBncmVlbiBnbG93aW5nIHR1YmVzIiwKICAgICJyYWlueSBuaWdodCBlbWJhc3N5IHJvb2Z0b3Agd2l0aCBzYXRlbGxpdGUgZGlzaGVzIiwKICAgICJsb25nIGRhcmsgY29ycmlkb3Igd2l0aCBzaW5nbGUgcmVkIGV4aXQgc2lnbiIsCiAgICAiZm9nZ3kgYnJpZGdlIGF0IG1pZG5pZ2h0IHdpdGggZGlzdGFudCBoZWFkbGlnaHRzIiwKICAgICJlbXB0eSBwYXJraW5nIHN0cnVjdHVyZSB3aXRoIGZsaWNrZXJpbmcgbGlnaHRzIiwKICAgICJkYXJrIHNlcnZlciByb29tIHdpdGggcm93cyBvZiBibGlua2luZyBibHVlIGxpZ2h0cyIsCiAgICAicmVzdHJpY3RlZCBtaWxpdGFyeSBoYW5nYXIgd2l0aCBkcmFwZWQgdGFycHMiLAogICAgImRlc2VydCBuaWdodCBza3kgd2l0aCBkaXN0YW50IHVubWFya2VkIHdhcmVob3VzZSIsCiAgICAiZGltbHkgbGl0IHdhciByb29tIHdpdGggZ2xvd2luZyBtb25pdG9ycyIsCiAgICAic2F0ZWxsaXRlIGRpc2ggYXJyYXkgaW4gZGVzZXJ0IGF0IG5pZ2h0IiwKICAgICJibGFja2VkIG91dCBTVVYgbW90b3JjYWRlIG9uIHJhaW55IHN0cmVldCIsCiAgICAiYWJhbmRvbmVkIHdhcmVob3VzZSB3aXRoIHNjYXR0ZXJlZCBjbGFzc2lmaWVkIGZpbGVzIiwKICAgICJyb29mdG9wIGF0IG5pZ2h0IHdpdGggZGlzdGFudCByYWRpbyB0b3dlciBibGlua2luZyByZWQiLAogICAgImRlZXAgdW5kZXJncm91bmQgdHVubmVsIHdpdGggcGlwZXMgYW5kIGRpbSB5ZWxsb3cgbGlnaHRzIiwKICAgICJzdGF0aWMtZmlsbGVkIFRWIHNjcmVlbnMgaW4gZGFyayBjb250cm9sIHJvb20iLAogICAgImFpcnBvcnQgdGFybWFjIHdpdGggdW5tYXJrZWQgYmxhY2sgaGVsaWNvcHRlciIsCiAgICAibmlnaHQgc2t5IHdpdGggYmx1cnJ5IFVGTyBhbmQgc2VhcmNobGlnaHRzIiwKICAgICJQZW50YWdvbiBoYWxsd2F5IHdpdGggZmx1b3Jlc2NlbnQgbGlnaHRpbmciLAogICAgImJsdXJyeSByZWRhY3RlZCBkb2N1bWVudHMgYW5kIGZpbGluZyBjYWJpbmV0cyIsCl0KCkVYUFJFU1NJT05TID0gWwogICAgInRpbnkgbmV1dHJhbCBtb3V0aCIsICJ0aW55IGZsYXQgbW91dGgiLCAic21hbGwgZXhwcmVzc2lvbmxlc3MgbW91dGgiLAogICAgInNtYWxsIGZsYXQgbW91dGgiLCAidGlueSBzdHJhaWdodCBtb3V0aCIsCl0KCiMg4pSA4pSAIFJhcml0eS13ZWlnaHRlZCBvcHRpb25hbCB0cmFpdCBzZWxlY3Rpb24g4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiMgVGFyZ2V0IGRpc3RyaWJ1dGlvbjoKIyAgIENvbW1vbiAgKDAgZXh0cmFzKTogfjIwJSAgLT4gNDAwCiMgICBVbmNvbW1vbigxIGV4dHJhKTogIH4zOCUgIC0+IDc2MAojICAgUmFyZSAgICAoMiBleHRyYXMpOiB+MzAlICAtPiA2MDAKIyAgIExlZ2VuZGFyeSgzLTQgZXh0cmFzKTp+MTIlIC0+IDI0MAoKUkFSSVRZX1dFSUdIVFMgPSB7CiAgICAwOiA0MDAsICAgIyBDb21tb24KICAgIDE6IDc2MCwgICAjIFVuY29tbW9uCiAgICAyOiA2MDAsICAgIyBSYXJlCiAgICAzOiAyMDAsICAgIyBMZWdlbmRhcnkgKDMgZXh0cmFzKQogICAgNDogNDAsICAgICMgTGVnZW5kYXJ5ICg0IGV4dHJhcykKfQoKUkFSSVRZX0xBQkVMUyA9IHsKICAgIDA6ICJDb21tb24iLAogICAgMTogIlVuY29tbW9uIiwKICAgIDI6ICJSYXJlIiwKICAgIDM6ICJMZWdlbmRhcnkiLAogICAgNDogIkxlZ2VuZGFyeSIsCn0KCk9QVElPTkFMX0NBVEVHT1JJRVMgPSBbCiAgICAoImFjY2Vzc29yeSIsIEFDQ0VTU09SSUVTKSwKICAgICgidGF0dG9vIiwgVEFUVE9PUyksCiAgICAoInBpZXJjaW5nIiwgUElFUkNJTkdTKSwKICAgICgiZnJlY2tsZXMiLCBGUkVDS0xFUyksCl0KCgpkZWYgcGlja19leHRyYXMobnVtX2V4dHJhczogaW50KSAtPiBkaWN0OgogICAgIiIiUGljayB3aGljaCBvcHRpb25hbCBjYXRlZ29yaWVzIGFyZSBhY3RpdmUgYW5kIHNlbGVjdCBhIHRyYWl0IGZyb20gZWFjaC4iIiIKICAgIGNhdHMgPSByYW5kb20uc2FtcGxlKE9QVElPTkFMX0NBVEVHT1JJRVMsIGs9bnVtX2V4dHJhcykKICAgIHJlc3VsdCA9IHt9CiAgICBmb3IgbmFtZSwgcG9vbCBpbiBPUFRJT05BTF9DQVRFR09SSUVTOgogICAgICAgIGlmIChuYW1lLCBwb29sKSBpbiBjYXRzOgogICAgICAgICAgICByZXN1bHRbbmFtZV0gPSByYW5kb20uY2hvaWNlKHBvb2wpCiAgICAgICAgZWxzZToKICAgICAgICAgICAgcmVzdWx0W25hbWVdID0gTm9uZQogICAgcmV0dXJuIHJlc3VsdAoKCmRlZiBnZW5lcmF0ZV9hZ2VudCh0b2tlbl9pZDogaW50LCBudW1fZXh0cmFzOiBpbnQpIC0+IGRpY3Q6CiAgICAiIiJHZW5lcmF0ZSBhIHNpbmdsZSBhZ2VudCdzIHRyYWl0cy4iIiIKICAgIHRyYWl0cyA9IHsKICAgICAgICAic3VpdF9zdHlsZSI6IHJhbmRvbS5jaG9pY2UoU1VJVF9TVFlMRVMpLAogICAgICAgICJzdW5nbGFzc2VzIjogcmFuZG9tLmNob2ljZShTVU5HTEFTU0VTKSwKICAgICAgICAiaGFpcl9zdHlsZSI6IHJhbmRvbS5jaG9pY2UoSEFJUl9TVFlMRVMpLAogICAgICAgICJoYWlyX2NvbG9yIjogcmFuZG9tLmNob2ljZShIQUlSX0NPTE9SUyksCiAgICAgICAgInNraW5fdG9uZSI6IHJhbmRvbS5jaG9pY2UoU0tJTl9UT05FUyksCiAgICAgICAgImJhY2tncm91bmQiOiByYW5kb20uY2hvaWNlKEJBQ0tHUk9VTkRTKSwKICAgICAgICAiZXhwcmVzc2lvbiI6IHJhbmRvbS5jaG9pY2UoRVhQUkVTU0lPTlMpLAogICAgfQogICAgZXh0cmFzID0gcGlja19leHRyYXMobnVtX2V4dHJhcykKICAgIHRyYWl0cy51cGRhdGUoZXh0cmFzKQoKICAgIHJhcml0eSA9IFJBUklUWV9MQUJFTFNbbnVtX2V4dHJhc10KCiAgICAjIEJ1aWxkIHByb21wdAogICAgcGFydHMgPSBbCiAgICAgICAgIkNoaWJpIGFnZW50LCBvdmVyc2l6ZWQgaGVhZCwgbGFyZ2UgZ2xvc3N5IGJsYWNrIGV5ZXMgd2l0aCB3aGl0ZSBoaWdobGlnaHRzIiwKICAgICAgICBmInt0cmFpdHNbJ2hhaXJfY29sb3InXX0ge3RyYWl0c1snaGFpcl9zdHlsZSddfSIsCiAgICAgICAgdHJhaXRzWyJza2luX3RvbmUiXSwKICAgIF0KICAgIGlmIHRyYWl0cy5nZXQoImZyZWNrbGVzIik6CiAgICAgICAgcGFydHMuYXBwZW5kKHRyYWl0c1siZnJlY2tsZXMiXSkKICAgIHBhcnRzLmFwcGVuZCh0cmFpdHNbImV4cHJlc3Npb24iXSkKICAgIHBhcnRzLmFwcGVuZCh0cmFpdHNbInN1aXRfc3R5bGUiXSkKICAgIHBhcnRzLmFwcGVuZCh0cmFpdHNbInN1bmdsYXNzZXMiXSkKICAgIGlmIHRyYWl0cy5nZXQoImFjY2Vzc29yeSIpOgogICAgICAgIHBhcnRzLmFwcGVuZCh0cmFpdHNbImFjY2Vzc29yeSJdKQogICAgaWYgdHJhaXRzLmdldCgidGF0dG9vIik6CiAgICAgICAgcGFydHMuYXBwZW5kKHRyYWl0c1sidGF0dG9vIl0pCiAgICBpZiB0cmFpdHMuZ2V0KCJwaWVyY2luZyIpOgogICAgICAgIHBhcnRzLmFwcGVuZCh0cmFpdHNbInBpZXJjaW5nIl0pCiAgICBwYXJ0cy5hcHBlbmQoImNoZXN0LXVwIHBvcnRyYWl0IikKICAgIHBhcnRzLmFwcGVuZChmInt0cmFpdHNbJ2JhY2tncm91bmQnXX0gYmFja2dyb3VuZCIpCiAgICBwYXJ0cy5hcHBlbmQoImthd2FpaSBkaWdpdGFsIGFydCwgTkZUIGNvbGxlY3RpYmxlIGNhcmQgc3R5bGUiKQoKICAgIHByb21wdCA9ICIsICIuam9pbihwYXJ0cykKCiAgICByZXR1cm4gewogICAgICAgICJ0b2tlbl9pZCI6IHRva2VuX2lkLAogICAgICAgICJ0cmFpdHMiOiB0cmFpdHMsCiAgICAgICAgInJhcml0eSI6IHJhcml0eSwKICAgICAgICAibnVtX2V4dHJhcyI6IG51bV9leHRyYXMsCiAgICAgICAgInByb21wdCI6IHByb21wdCwKICAgIH0KCgpkZWYgYnVpbGRfb3BlbnNlYV9tZXRhZGF0YShhZ2VudDogZGljdCkgLT4gZGljdDoKICAgICIiIkJ1aWxkIE9wZW5TZWEtc3RhbmRhcmQgbWV0YWRhdGEgSlNPTiBmb3IgYSBzaW5nbGUgYWdlbnQuIiIiCiAgICB0ID0gYWdlbnRbInRyYWl0cyJdCiAgICBhdHRyaWJ1dGVzID0gWwogICAgICAgIHsidHJhaXRfdHlwZSI6ICJTdWl0IFN0eWxlIiwgInZhbHVlIjogdFsic3VpdF9zdHlsZSJdfSwKICAgICAgICB7InRyYWl0X3R5cGUiOiAiU3VuZ2xhc3NlcyIsICJ2YWx1ZSI6IHRbInN1bmdsYXNzZXMiXX0sCiAgICAgICAgeyJ0cmFpdF90eXBlIjogIkhhaXIgU3R5bGUiLCAidmFsdWUiOiB0WyJoYWlyX3N0eWxlIl19LAogICAgICAgIHsidHJhaXRfdHlwZSI6ICJIYWlyIENvbG9yIiwgInZhbHVlIjogdFsiaGFpcl9jb2xvciJdfSwKICAgICAgICB7InRyYWl0X3R5cGUiOiAiU2tpbiBUb25lIiwgInZhbHVlIjogdFsic2tpbl90b25lIl19LAogICAgICAgIHsidHJhaXRfdHlwZSI6ICJCYWNrZ3JvdW5kIiwgInZhbHVlIjogdFsiYmFja2dyb3VuZCJdfSwKICAgICAgICB7InRyYWl0X3R5cGUiOiAiRXhwcmVzc2lvbiIsICJ2YWx1ZSI6IHRbImV4cHJlc3Npb24iXX0sCiAgICAgICAgeyJ0cmFpdF90eXBlIjogIlJhcml0eSIsICJ2YWx1ZSI6IGFnZW50WyJyYXJpdHkiXX0sCiAgICBdCiAgICBpZiB0LmdldCgiYWNjZXNzb3J5Iik6CiAgICAgICAgYXR0cmlidXRlcy5hcHBlbmQoeyJ0cmFpdF90eXBlIjogIkFjY2Vzc29yeSIsICJ2YWx1ZSI6IHRbImFjY2Vzc29yeSJdfSkKICAgIGlmIHQuZ2V0KCJ0YXR0b28iKToKICAgICAgICBhdHRyaWJ1dGVzLmFwcGVuZCh7InRyYWl0X3R5cGUiOiAiVGF0dG9vIiwgInZhbHVlIjogdFsidGF0dG9vIl19KQogICAgaWYgdC5nZXQoInBpZXJjaW5nIik6CiAgICAgICAgYXR0cmlidXRlcy5hcHBlbmQoeyJ0cmFpdF90eXBlIjogIlBpZXJjaW5nIiwgInZhbHVlIjogdFsicGllcmNpbmciXX0pCiAgICBpZiB0LmdldCgiZnJlY2tsZXMiKToKICAgICAgICBhdHRyaWJ1dGVzLmFwcGVuZCh7InRyYWl0X3R5cGUiOiAiRnJlY2tsZXMiLCAidmFsdWUiOiB0WyJmcmVja2xlcyJdfSkKCiAgICB0aWQgPSBhZ2VudFsidG9rZW5faWQiXQogICAgcmV0dXJuIHsKICAgICAgICAibmFtZSI6IGYiQ2hpYmkgQWdlbnQgI3t0aWQ6MDRkfSIsCiAgICAgICAgImRlc2NyaXB0aW9uIjogIkEgY3V0ZSBjaGliaSBzZWNyZXQgYWdlbnQgZnJvbSB0aGUgMjAwMC1waWVjZSBDaGliaSBBZ2VudCBjb2xsZWN0aW9uLiIsCiAgICAgICAgImltYWdlIjogZiJpcGZzOi8vWU9VUl9DSURfSEVSRS97dGlkOjA0ZH0ucG5nIiwKICAgICAgICAiYXR0cmlidXRlcyI6IGF0dHJpYnV0ZXMsCiAgICB9CgoKZGVmIG1haW4oKToKICAgICMgQnVpbGQgdGhlIHJhcml0eSBzY2hlZHVsZTogYSBsaXN0IG9mIG51bV9leHRyYXMgdmFsdWVzLCBvbmUgcGVyIGFnZW50CiAgICBzY2hlZHVsZSA9IFtdCiAgICBmb3IgbnVtX2V4dHJhcywgY291bnQgaW4gUkFSSVRZX1dFSUdIVFMuaXRlbXMoKToKICAgICAgICBzY2hlZHVsZS5leHRlbmQoW251bV9leHRyYXNdICogY291bnQpCiAgICBhc3NlcnQgbGVuKHNjaGVkdWxlKSA9PSAyMDAwLCBmIlNjaGVkdWxlIGhhcyB7bGVuKHNjaGVkdWxlKX0gZW50cmllcywgZXhwZWN0ZWQgMjAwMCIKICAgIHJhbmRvbS5zaHVmZmxlKHNjaGVkdWxlKQoKICAgICMgR2VuZXJhdGUgYWdlbnRzLCBlbnN1cmluZyB1bmlxdWVuZXNzCiAgICBzZWVuX2NvbWJvcyA9IHNldCgpCiAgICBhZ2VudHMgPSBbXQogICAgYXR0ZW1wdHMgPSAwCiAgICBtYXhfYXR0ZW1wdHMgPSA1MDAwMAoKICAgIGZvciBpLCBudW1fZXh0cmFzIGluIGVudW1lcmF0ZShzY2hlZHVsZSk6CiAgICAgICAgdG9rZW5faWQgPSBpICsgMQogICAgICAgIHdoaWxlIGF0dGVtcHRzIDwgbWF4X2F0dGVtcHRzOgogICAgICAgICAgICBhdHRlbXB0cyArPSAxCiAgICAgICAgICAgIGFnZW50ID0gZ2VuZXJhdGVfYWdlbnQodG9rZW5faWQsIG51bV9leHRyYXMpCiAgICAgICAgICAgICMgQ3JlYXRlIGEgaGFzaGFibGUga2V5IGZyb20gdGhlIHRyYWl0cwogICAgICAgICAgICB0ID0gYWdlbnRbInRyYWl0cyJdCiAgICAgICAgICAgIGNvbWJvX2tleSA9ICgKICAgICAgICAgICAgICAgIHRbInN1aXRfc3R5bGUiXSwgdFsic3VuZ2xhc3NlcyJdLCB0WyJoYWlyX3N0eWxlIl0sCiAgICAgICAgICAgICAgICB0WyJoYWlyX2NvbG9yIl0sIHRbInNraW5fdG9uZSJdLCB0WyJiYWNrZ3JvdW5kIl0sCiAgICAgICAgICAgICAgICB0WyJleHByZXNzaW9uIl0sCiAgICAgICAgICAgICAgICB0LmdldCgiYWNjZXNzb3J5IiksIHQuZ2V0KCJ0YXR0b28iKSwKICAgICAgICAgICAgICAgIHQuZ2V0KCJwaWVyY2luZyIpLCB0LmdldCgiZnJlY2tsZXMiKSwKICAgICAgICAgICAgKQogICAgICAgICAgICBpZiBjb21ib19rZXkgbm90IGluIHNlZW5fY29tYm9zOgogICAgICAgICAgICAgICAgc2Vlbl9jb21ib3MuYWRkKGNvbWJvX2tleSkKICAgICAgICAgICAgICAgIGFnZW50cy5hcHBlbmQoYWdlbnQpCiAgICAgICAgICAgICAgICBicmVhawogICAgICAgIGVsc2U6CiAgICAgICAgICAgIHByaW50KGYiRVJST1I6IENvdWxkIG5vdCBnZW5lcmF0ZSB1bmlxdWUgY29tYm8gYWZ0ZXIge21heF9hdHRlbXB0c30gYXR0ZW1wdHMiKQogICAgICAgICAgICByZXR1cm4KCiAgICAjIOKUgOKUgCBPdXRwdXQg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACgogICAgb3MubWFrZWRpcnMoIm91dHB1dC9tZXRhZGF0YSIsIGV4aXN0X29rPVRydWUpCiAgICBvcy5tYWtlZGlycygib3V0cHV0L2ltYWdlcyIsIGV4aXN0X29rPVRydWUpCgogICAgIyBmdWxsX2NvbGxlY3Rpb24uanNvbgogICAgd2l0aCBvcGVuKCJvdXRwdXQvZnVsbF9jb2xsZWN0aW9uLmpzb24iLCAidyIpIGFzIGY6CiAgICAgICAganNvbi5kdW1wKGFnZW50cywgZiwgaW5kZW50PTIpCgogICAgIyBwcm9tcHRzX29ubHkudHh0CiAgICB3aXRoIG9wZW4oIm91dHB1dC9wcm9tcHRzX29ubHkudHh0IiwgInciKSBhcyBmOgogICAgICAgIGZvciBhZ2VudCBpbiBhZ2VudHM6CiAgICAgICAgICAgIGYud3JpdGUoYWdlbnRbInByb21wdCJdICsgIlxuIikKCiAgICAjIEluZGl2aWR1YWwgbWV0YWRhdGEgZmlsZXMKICAgIGZvciBhZ2VudCBpbiBhZ2VudHM6CiAgICAgICAgbWV0YSA9IGJ1aWxkX29wZW5zZWFfbWV0YWRhdGEoYWdlbnQpCiAgICAgICAgcGF0aCA9IGYib3V0cHV0L21ldGFkYXRhL3thZ2VudFsndG9rZW5faWQnXTowNGR9Lmpzb24iCiAgICAgICAgd2l0aCBvcGVuKHBhdGgsICJ3IikgYXMgZjoKICAgICAgICAgICAganNvbi5kdW1wKG1ldGEsIGYsIGluZGVudD0yKQoKICAgICMg4pSA4pSAIFN1bW1hcnkg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACgogICAgcmFyaXR5X2NvdW50cyA9IENvdW50ZXIoYVsicmFyaXR5Il0gZm9yIGEgaW4gYWdlbnRzKQogICAgZXh0cmFzX2NvdW50cyA9IENvdW50ZXIoYVsibnVtX2V4dHJhcyJdIGZvciBhIGluIGFnZW50cykKCiAgICBwcmludCgiPSIgKiA2MCkKICAgIHByaW50KCJDSElCSSBBR0VOVCBDT0xMRUNUSU9OIOKAlCBHRU5FUkFUSU9OIENPTVBMRVRFIikKICAgIHByaW50KCI9IiAqIDYwKQogICAgcHJpbnQoZiJUb3RhbCBhZ2VudHMgZ2VuZXJhdGVkOiB7bGVuKGFnZW50cyl9IikKICAgIHByaW50KGYiVW5pcXVlIGNvbWJpbmF0aW9ucyB2ZXJpZmllZDoge2xlbihzZWVuX2NvbWJvcyl9IikKICAgIHByaW50KGYiR2VuZXJhdGlvbiBhdHRlbXB0czoge2F0dGVtcHRzfSIpCiAgICBwcmludCgpCiAgICBwcmludCgiUkFSSVRZIERJU1RSSUJVVElPTjoiKQogICAgcHJpbnQoIi0iICogNDApCiAgICBmb3IgbGFiZWwgaW4gWyJDb21tb24iLCAiVW5jb21tb24iLCAiUmFyZSIsICJMZWdlbmRhcnkiXToKICAgICAgICBjb3VudCA9IHJhcml0eV9jb3VudHMuZ2V0KGxhYmVsLCAwKQogICAgICAgIHBjdCA9IGNvdW50IC8gbGVuKGFnZW50cykgKiAxMDAKICAgICAgICBwcmludChmIiAge2xhYmVsOjEyc306IHtjb3VudDo1ZH0gICh7cGN0OjUuMWZ9JSkiKQogICAgcHJpbnQoKQogICAgcHJpbnQoIkVYVFJBUyBCUkVBS0RPV046IikKICAgIHByaW50KCItIiAqIDQwKQogICAgZm9yIG4gaW4gc29ydGVkKGV4dHJhc19jb3VudHMpOgogICAgICAgIGNvdW50ID0gZXh0cmFzX2NvdW50c1tuXQogICAgICAgIHBjdCA9IGNvdW50IC8gbGVuKGFnZW50cykgKiAxMDAKICAgICAgICBwcmludChmIiAge259IGV4dHJhczoge2NvdW50OjVkfSAgKHtwY3Q6NS4xZn0lKSIpCiAgICBwcmludCgpCgogICAgIyBQcmludCBmaXJzdCA1IHByb21wdHMKICAgIHByaW50KCJGSVJTVCA1IFBST01QVFM6IikKICAgIHByaW50KCI9IiAqIDYwKQogICAgZm9yIGFnZW50IGluIGFnZW50c1s6NV06CiAgICAgICAgdGlkID0gYWdlbnRbInRva2VuX2lkIl0KICAgICAgICBwcmludChmIlxuWyN7dGlkOjA0ZH1dIFJhcml0eToge2FnZW50WydyYXJpdHknXX0gKHthZ2VudFsnbnVtX2V4dHJhcyddfSBleHRyYXMpIikKICAgICAgICBwcmludChmIiAge2FnZW50Wydwcm9tcHQnXX0iKQogICAgcHJpbnQoKQoKICAgICMgVHJhaXQgZnJlcXVlbmN5IHN0YXRzCiAgICBwcmludCgiVFJBSVQgRlJFUVVFTkNZIEhJR0hMSUdIVFM6IikKICAgIHByaW50KCItIiAqIDQwKQogICAgZm9yIHRyYWl0X25hbWUgaW4gWyJhY2Nlc3NvcnkiLCAidGF0dG9vIiwgInBpZXJjaW5nIiwgImZyZWNrbGVzIl06CiAgICAgICAgaGFzX2l0ID0gc3VtKDEgZm9yIGEgaW4gYWdlbnRzIGlmIGFbInRyYWl0cyJdLmdldCh0cmFpdF9uYW1lKSkKICAgICAgICBwY3QgPSBoYXNfaXQgLyBsZW4oYWdlbnRzKSAqIDEwMAogICAgICAgIHByaW50KGYiICB7dHJhaXRfbmFtZToxMnN9OiB7aGFzX2l0OjVkfSBhZ2VudHMgaGF2ZSBvbmUgKHtwY3Q6NS4xZn0lKSIpCgoKaWYgX19uYW1lX18gPT0gIl9fbWFpbl9fIjoKICAgIG1haW4oKQo=",
-    "generate_images.py": "IyEvdXNyL2Jpbi9lbnYgcHl0aG9uMwoiIiIKR2VuZXJhdGUgTkZUIGltYWdlcyB2aWEgZmFsLmFpIHF1ZXVlIEFQSS4KClVzYWdlOgogICAgcHl0aG9uIGdlbmVyYXRlX2ltYWdlcy5weSAgICAgICAgICAgICAgICAgICAgIyBnZW5lcmF0ZSBhbGwgMjAwMAogICAgcHl0aG9uIGdlbmVyYXRlX2ltYWdlcy5weSAtLXN0YXJ0IDEgLS1lbmQgMjAgIyBnZW5lcmF0ZSAjMDAwMS0jMDAyMAogICAgcHl0aG9uIGdlbmVyYXRlX2ltYWdlcy5weSAtLXN0YXJ0IDUwIC0tZW5kIDUwICMgZ2VuZXJhdGUganVzdCAjMDA1MAogICAgcHl0aG9uIGdlbmVyYXRlX2ltYWdlcy5weSAtLXJlZG8gMywxNyw0MiAgICAgICMgcmVkbyBzcGVjaWZpYyB0b2tlbiBJRHMKIiIiCgppbXBvcnQgYXJncGFyc2UKaW1wb3J0IGpzb24KaW1wb3J0IG9zCmltcG9ydCBzeXMKaW1wb3J0IHRpbWUKCmltcG9ydCByZXF1ZXN0cwoKIyDilIDilIAgQ29uZmlnIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAoKRkFMX0tFWSA9IG9zLmVudmlyb24uZ2V0KCJGQUxfS0VZIiwgIiIpCk1PREVMX0lEID0gImZhbC1haS9uYW5vLWJhbmFuYSIKUVVFVUVfVVJMID0gZiJodHRwczovL3F1ZXVlLmZhbC5ydW4ve01PREVMX0lEfSIKQ09MTEVDVElPTl9QQVRIID0gIm91dHB1dC9mdWxsX2NvbGxlY3Rpb24uanNvbiIKSU1BR0VTX0RJUiA9ICJvdXRwdXQvaW1hZ2VzIgpERUxBWV9CRVRXRUVOX1JFUVVFU1RTID0gMS4wICAjIHNlY29uZHMgYmV0d2VlbiBzdWJtaXR0aW5nIHJlcXVlc3RzClBPTExfSU5URVJWQUwgPSAyLjAgICAgICAgICAgICMgc2Vjb25kcyBiZXR3ZWVuIHN0YXR1cyBwb2xscwpNQVhfUE9MTF9BVFRFTVBUUyA9IDE1MCAgICAgICAjIG1heCBwb2xscyBwZXIgaW1hZ2UgKH41IG1pbikKTUFYX1JFVFJJRVMgPSAzICAgICAgICAgICAgICAgIyByZXRyaWVzIG9uIGZhaWx1cmUgcGVyIGltYWdlCgojIOKUgOKUgCBIZWxwZXJzIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAoKZGVmIGhlYWRlcnMoKToKICAgIHJldHVybiB7CiAgICAgICAgIkF1dGhvcml6YXRpb24iOiBmIktleSB7RkFMX0tFWX0iLAogICAgICAgICJDb250ZW50LVR5cGUiOiAiYXBwbGljYXRpb24vanNvbiIsCiAgICB9CgoKZGVmIGF1dGhfaGVhZGVycygpOgogICAgcmV0dXJuIHsiQXV0aG9yaXphdGlvbiI6IGYiS2V5IHtGQUxfS0VZfSJ9CgoKZGVmIHN1Ym1pdF9yZXF1ZXN0KHByb21wdDogc3RyKSAtPiBkaWN0OgogICAgIiIiU3VibWl0IGFuIGltYWdlIGdlbmVyYXRpb24gcmVxdWVzdCB0byB0aGUgZmFsLmFpIHF1ZXVlLiIiIgogICAgcGF5bG9hZCA9IHsKICAgICAgICAicHJvbXB0IjogcHJvbXB0LAogICAgICAgICJhc3BlY3RfcmF0aW8iOiAiMToxIiwKICAgICAgICAib3V0cHV0X2Zvcm1hdCI6ICJwbmciLAogICAgICAgICJudW1faW1hZ2VzIjogMSwKICAgIH0KICAgIHJlc3AgPSByZXF1ZXN0cy5wb3N0KFFVRVVFX1VSTCwgaGVhZGVycz1oZWFkZXJzKCksIGpzb249cGF5bG9hZCwgdGltZW91dD0zMCkKICAgIHJlc3AucmFpc2VfZm9yX3N0YXR1cygpCiAgICByZXR1cm4gcmVzcC5qc29uKCkKCgpkZWYgcG9sbF91bnRpbF9kb25lKHN0YXR1c191cmw6IHN0cikgLT4gc3RyOgogICAgIiIiUG9sbCB0aGUgcXVldWUgdW50aWwgdGhlIHJlcXVlc3QgY29tcGxldGVzLiBSZXR1cm5zIHRoZSByZXNwb25zZSBVUkwgc3RhdHVzLiIiIgogICAgZm9yIGF0dGVtcHQgaW4gcmFuZ2UoTUFYX1BPTExfQVRURU1QVFMpOgogICAgICAgIHJlc3AgPSByZXF1ZXN0cy5nZXQoCiAgICAgICAgICAgIHN0YXR1c191cmwsCiAgICAgICAgICAgIGhlYWRlcnM9YXV0aF9oZWFkZXJzKCksCiAgICAgICAgICAgIHBhcmFtcz17ImxvZ3MiOiAxfSwKICAgICAgICAgICAgdGltZW91dD0zMCwKICAgICAgICApCiAgICAgICAgcmVzcC5yYWlzZV9mb3Jfc3RhdHVzKCkKICAgICAgICBkYXRhID0gcmVzcC5qc29uKCkKICAgICAgICBzdGF0dXMgPSBkYXRhLmdldCgic3RhdHVzIiwgIlVOS05PV04iKQoKICAgICAgICBpZiBzdGF0dXMgPT0gIkNPTVBMRVRFRCI6CiAgICAgICAgICAgIHJldHVybiAiQ09NUExFVEVEIgogICAgICAgIGVsaWYgc3RhdHVzIGluICgiRkFJTEVEIiwgIkNBTkNFTExFRCIpOgogICAgICAgICAgICBlcnJvcl9tc2cgPSBkYXRhLmdldCgiZXJyb3IiLCAiVW5rbm93biBlcnJvciIpCiAgICAgICAgICAgIHJhaXNlIFJ1bnRpbWVFcnJvcihmIlJlcXVlc3Qge3N0YXR1c306IHtlcnJvcl9tc2d9IikKCiAgICAgICAgdGltZS5zbGVlcChQT0xMX0lOVEVSVkFMKQoKICAgIHJhaXNlIFRpbWVvdXRFcnJvcihmIlJlcXVlc3QgZGlkIG5vdCBjb21wbGV0ZSBhZnRlciB7TUFYX1BPTExfQVRURU1QVFN9IHBvbGxzIikKCgpkZWYgZmV0Y2hfcmVzdWx0KHJlc3BvbnNlX3VybDogc3RyKSAtPiBkaWN0OgogICAgIiIiRmV0Y2ggdGhlIGZpbmFsIHJlc3VsdCBmcm9tIHRoZSBxdWV1ZS4iIiIKICAgIHJlc3AgPSByZXF1ZXN0cy5nZXQocmVzcG9uc2VfdXJsLCBoZWFkZXJzPWF1dGhfaGVhZGVycygpLCB0aW1lb3V0PTMwKQogICAgcmVzcC5yYWlzZV9mb3Jfc3RhdHVzKCkKICAgIHJldHVybiByZXNwLmpzb24oKQoKCmRlZiBkb3dubG9hZF9pbWFnZShpbWFnZV91cmw6IHN0ciwgZGVzdF9wYXRoOiBzdHIpOgogICAgIiIiRG93bmxvYWQgYW4gaW1hZ2UgZnJvbSBVUkwgdG8gbG9jYWwgZmlsZS4iIiIKICAgIHJlc3AgPSByZXF1ZXN0cy5nZXQoaW1hZ2VfdXJsLCB0aW1lb3V0PTEyMCkKICAgIHJlc3AucmFpc2VfZm9yX3N0YXR1cygpCiAgICB3aXRoIG9wZW4oZGVzdF9wYXRoLCAid2IiKSBhcyBmOgogICAgICAgIGYud3JpdGUocmVzcC5jb250ZW50KQoKCmRlZiBnZW5lcmF0ZV9zaW5nbGUodG9rZW5faWQ6IGludCwgcHJvbXB0OiBzdHIsIGZvcmNlOiBib29sID0gRmFsc2UpIC0+IGJvb2w6CiAgICAiIiJHZW5lcmF0ZSBhIHNpbmdsZSBpbWFnZS4gUmV0dXJucyBUcnVlIG9uIHN1Y2Nlc3MsIEZhbHNlIG9uIGZhaWx1cmUuIiIiCiAgICBmaWxlbmFtZSA9IGYie3Rva2VuX2lkOjA0ZH0ucG5nIgogICAgZGVzdF9wYXRoID0gb3MucGF0aC5qb2luKElNQUdFU19ESVIsIGZpbGVuYW1lKQoKICAgICMgUmVzdW1lIGNhcGFiaWxpdHk6IHNraXAgaWYgYWxyZWFkeSBleGlzdHMgKHVubGVzcyBmb3JjZS9yZWRvKQogICAgaWYgbm90IGZvcmNlIGFuZCBvcy5wYXRoLmV4aXN0cyhkZXN0X3BhdGgpIGFuZCBvcy5wYXRoLmdldHNpemUoZGVzdF9wYXRoKSA+IDA6CiAgICAgICAgcmV0dXJuIFRydWUgICMgYWxyZWFkeSBkb25lCgogICAgZm9yIHJldHJ5IGluIHJhbmdlKE1BWF9SRVRSSUVTKToKICAgICAgICB0cnk6CiAgICAgICAgICAgICMgU3RlcCAxOiBTdWJtaXQgdG8gcXVldWUKICAgICAgICAgICAgcXVldWVfcmVzcCA9IHN1Ym1pdF9yZXF1ZXN0KHByb21wdCkKICAgICAgICAgICAgcmVxdWVzdF9pZCA9IHF1ZXVlX3Jlc3AuZ2V0KCJyZXF1ZXN0X2lkIiwgIj8iKQogICAgICAgICAgICBzdGF0dXNfdXJsID0gcXVldWVfcmVzcC5nZXQoInN0YXR1c191cmwiKQogICAgICAgICAgICByZXNwb25zZV91cmwgPSBxdWV1ZV9yZXNwLmdldCgicmVzcG9uc2VfdXJsIikKCiAgICAgICAgICAgIGlmIG5vdCBzdGF0dXNfdXJsIG9yIG5vdCByZXNwb25zZV91cmw6CiAgICAgICAgICAgICAgICByYWlzZSBSdW50aW1lRXJyb3IoZiJNaXNzaW5nIHN0YXR1cy9yZXNwb25zZSBVUkxzIGluIHF1ZXVlIHJlc3BvbnNlOiB7cXVldWVfcmVzcH0iKQoKICAgICAgICAgICAgIyBTdGVwIDI6IFBvbGwgdW50aWwgZG9uZQogICAgICAgICAgICBwb2xsX3VudGlsX2RvbmUoc3RhdHVzX3VybCkKCiAgICAgICAgICAgICMgU3RlcCAzOiBGZXRjaCByZXN1bHQKICAgICAgICAgICAgcmVzdWx0ID0gZmV0Y2hfcmVzdWx0KHJlc3BvbnNlX3VybCkKCiAgICAgICAgICAgICMgU3RlcCA0OiBFeHRyYWN0IGltYWdlIFVSTCBhbmQgZG93bmxvYWQKICAgICAgICAgICAgaW1hZ2VzID0gcmVzdWx0LmdldCgiaW1hZ2VzIiwgW10pCiAgICAgICAgICAgIGlmIG5vdCBpbWFnZXM6CiAgICAgICAgICAgICAgICAjIFNvbWUgbW9kZWxzIHJldHVybiBvdXRwdXQuaW1hZ2VzIG9yIGRhdGEuaW1hZ2VzCiAgICAgICAgICAgICAgICBvdXRwdXQgPSByZXN1bHQuZ2V0KCJvdXRwdXQiLCByZXN1bHQuZ2V0KCJkYXRhIiwge30pKQogICAgICAgICAgICAgICAgaWYgaXNpbnN0YW5jZShvdXRwdXQsIGRpY3QpOgogICAgICAgICAgICAgICAgICAgIGltYWdlcyA9IG91dHB1dC5nZXQoImltYWdlcyIsIFtdKQoKICAgICAgICAgICAgaWYgbm90IGltYWdlczoKICAgICAgICAgICAgICAgIHJhaXNlIFJ1bnRpbWVFcnJvcihmIk5vIGltYWdlcyBpbiByZXNwb25zZToge2pzb24uZHVtcHMocmVzdWx0KVs6NTAwXX0iKQoKICAgICAgICAgICAgaW1hZ2VfdXJsID0gaW1hZ2VzWzBdLmdldCgidXJsIikgaWYgaXNpbnN0YW5jZShpbWFnZXNbMF0sIGRpY3QpIGVsc2UgaW1hZ2VzWzBdCiAgICAgICAgICAgIGlmIG5vdCBpbWFnZV91cmw6CiAgICAgICAgICAgICAgICByYWlzZSBSdW50aW1lRXJyb3IoZiJObyBVUkwgaW4gaW1hZ2UgZGF0YToge2ltYWdlc1swXX0iKQoKICAgICAgICAgICAgZG93bmxvYWRfaW1hZ2UoaW1hZ2VfdXJsLCBkZXN0X3BhdGgpCiAgICAgICAgICAgIHJldHVybiBUcnVlCgogICAgICAgIGV4Y2VwdCBFeGNlcHRpb24gYXMgZToKICAgICAgICAgICAgd2FpdCA9IDIgKiogKHJldHJ5ICsgMSkKICAgICAgICAgICAgcHJpbnQoZiIgICAgWyFdIEF0dGVtcHQge3JldHJ5ICsgMX0ve01BWF9SRVRSSUVTfSBmYWlsZWQ6IHtlfSIpCiAgICAgICAgICAgIGlmIHJldHJ5IDwgTUFYX1JFVFJJRVMgLSAxOgogICAgICAgICAgICAgICAgcHJpbnQoZiIgICAgWyFdIFJldHJ5aW5nIGluIHt3YWl0fXMuLi4iKQogICAgICAgICAgICAgICAgdGltZS5zbGVlcCh3YWl0KQoKICAgIHJldHVybiBGYWxzZQoKCiMg4pSA4pSAIE1haW4g4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACgpkZWYgbWFpbigpOgogICAgZ2xvYmFsIFFVRVVFX1VSTCwgREVMQVlfQkVUV0VFTl9SRVFVRVNUUwoKICAgIHBhcnNlciA9IGFyZ3BhcnNlLkFyZ3VtZW50UGFyc2VyKGRlc2NyaXB0aW9uPSJHZW5lcmF0ZSBORlQgaW1hZ2VzIHZpYSBmYWwuYWkiKQogICAgcGFyc2VyLmFkZF9hcmd1bWVudCgiLS1zdGFydCIsIHR5cGU9aW50LCBkZWZhdWx0PTEsIGhlbHA9IkZpcnN0IHRva2VuIElEIChkZWZhdWx0OiAxKSIpCiAgICBwYXJzZXIuYWRkX2FyZ3VtZW50KCItLWVuZCIsIHR5cGU9aW50LCBkZWZhdWx0PTIwMDAsIGhlbHA9Ikxhc3QgdG9rZW4gSUQgKGRlZmF1bHQ6IDIwMDApIikKICAgIHBhcnNlci5hZGRfYXJndW1lbnQoIi0tcmVkbyIsIHR5cGU9c3RyLCBkZWZhdWx0PSIiLCBoZWxwPSJDb21tYS1zZXBhcmF0ZWQgdG9rZW4gSURzIHRvIHJlZ2VuZXJhdGUiKQogICAgcGFyc2VyLmFkZF9hcmd1bWVudCgiLS1kZWxheSIsIHR5cGU9ZmxvYXQsIGRlZmF1bHQ9REVMQVlfQkVUV0VFTl9SRVFVRVNUUywgaGVscD0iRGVsYXkgYmV0d2VlbiByZXF1ZXN0cyBpbiBzZWNvbmRzIikKICAgIHBhcnNlci5hZGRfYXJndW1lbnQoIi0tbW9kZWwiLCB0eXBlPXN0ciwgZGVmYXVsdD1NT0RFTF9JRCwgaGVscD1mImZhbC5haSBtb2RlbCBJRCAoZGVmYXVsdDoge01PREVMX0lEfSkiKQogICAgYXJncyA9IHBhcnNlci5wYXJzZV9hcmdzKCkKCiAgICBpZiBhcmdzLm1vZGVsICE9IE1PREVMX0lEOgogICAgICAgIFFVRVVFX1VSTCA9IGYiaHR0cHM6Ly9xdWV1ZS5mYWwucnVuL3thcmdzLm1vZGVsfSIKICAgIERFTEFZX0JFVFdFRU5fUkVRVUVTVFMgPSBhcmdzLmRlbGF5CgogICAgaWYgbm90IEZBTF9LRVk6CiAgICAgICAgcHJpbnQoIkVSUk9SOiBGQUxfS0VZIGVudmlyb25tZW50IHZhcmlhYmxlIG5vdCBzZXQuIikKICAgICAgICBzeXMuZXhpdCgxKQoKICAgICMgTG9hZCBjb2xsZWN0aW9uCiAgICB3aXRoIG9wZW4oQ09MTEVDVElPTl9QQVRIKSBhcyBmOgogICAgICAgIGNvbGxlY3Rpb24gPSBqc29uLmxvYWQoZikKCiAgICAjIEJ1aWxkIGxvb2t1cCBieSB0b2tlbl9pZAogICAgYWdlbnRzX2J5X2lkID0ge2FbInRva2VuX2lkIl06IGEgZm9yIGEgaW4gY29sbGVjdGlvbn0KCiAgICAjIERldGVybWluZSB3aGljaCBJRHMgdG8gcHJvY2VzcwogICAgaWYgYXJncy5yZWRvOgogICAgICAgIHRva2VuX2lkcyA9IFtpbnQoeC5zdHJpcCgpKSBmb3IgeCBpbiBhcmdzLnJlZG8uc3BsaXQoIiwiKSBpZiB4LnN0cmlwKCldCiAgICAgICAgZm9yY2UgPSBUcnVlCiAgICAgICAgcHJpbnQoZiJSRURPIG1vZGU6IHJlZ2VuZXJhdGluZyB7bGVuKHRva2VuX2lkcyl9IHNwZWNpZmljIGltYWdlcyIpCiAgICBlbHNlOgogICAgICAgIHRva2VuX2lkcyA9IGxpc3QocmFuZ2UoYXJncy5zdGFydCwgYXJncy5lbmQgKyAxKSkKICAgICAgICBmb3JjZSA9IEZhbHNlCiAgICAgICAgcHJpbnQoZiJHZW5lcmF0aW5nIGltYWdlcyAje2FyZ3Muc3RhcnQ6MDRkfSB0byAje2FyZ3MuZW5kOjA0ZH0gKHtsZW4odG9rZW5faWRzKX0gdG90YWwpIikKCiAgICBvcy5tYWtlZGlycyhJTUFHRVNfRElSLCBleGlzdF9vaz1UcnVlKQoKICAgICMgQ291bnQgYWxyZWFkeSBkb25lIChmb3IgcmVzdW1lIGRpc3BsYXkpCiAgICBhbHJlYWR5X2RvbmUgPSAwCiAgICB0b19nZW5lcmF0ZSA9IFtdCiAgICBmb3IgdGlkIGluIHRva2VuX2lkczoKICAgICAgICBpZiB0aWQgbm90IGluIGFnZW50c19ieV9pZDoKICAgICAgICAgICAgcHJpbnQoZiJXQVJOSU5HOiBUb2tlbiBJRCB7dGlkfSBub3QgZm91bmQgaW4gY29sbGVjdGlvbiwgc2tpcHBpbmciKQogICAgICAgICAgICBjb250aW51ZQogICAgICAgIGRlc3QgPSBvcy5wYXRoLmpvaW4oSU1BR0VTX0RJUiwgZiJ7dGlkOjA0ZH0ucG5nIikKICAgICAgICBpZiBub3QgZm9yY2UgYW5kIG9zLnBhdGguZXhpc3RzKGRlc3QpIGFuZCBvcy5wYXRoLmdldHNpemUoZGVzdCkgPiAwOgogICAgICAgICAgICBhbHJlYWR5X2RvbmUgKz0gMQogICAgICAgIGVsc2U6CiAgICAgICAgICAgIHRvX2dlbmVyYXRlLmFwcGVuZCh0aWQpCgogICAgcHJpbnQoZiJBbHJlYWR5IGNvbXBsZXRlZDoge2FscmVhZHlfZG9uZX0iKQogICAgcHJpbnQoZiJUbyBnZW5lcmF0ZToge2xlbih0b19nZW5lcmF0ZSl9IikKICAgIHByaW50KGYiTW9kZWw6IHthcmdzLm1vZGVsfSIpCiAgICBwcmludChmIkRlbGF5IGJldHdlZW4gcmVxdWVzdHM6IHtERUxBWV9CRVRXRUVOX1JFUVVFU1RTfXMiKQogICAgcHJpbnQoIi0iICogNTApCgogICAgaWYgbm90IHRvX2dlbmVyYXRlOgogICAgICAgIHByaW50KCJOb3RoaW5nIHRvIGdlbmVyYXRlIOKAlCBhbGwgaW1hZ2VzIGFscmVhZHkgZXhpc3QhIikKICAgICAgICByZXR1cm4KCiAgICBzdWNjZXNzZXMgPSAwCiAgICBmYWlsdXJlcyA9IDAKICAgIGZhaWxlZF9pZHMgPSBbXQoKICAgIGZvciBpLCB0aWQgaW4gZW51bWVyYXRlKHRvX2dlbmVyYXRlKToKICAgICAgICBhZ2VudCA9IGFnZW50c19ieV9pZFt0aWRdCiAgICAgICAgcHJvZ3Jlc3MgPSBmIlt7aSArIDF9L3tsZW4odG9fZ2VuZXJhdGUpfV0iCiAgICAgICAgcHJpbnQoZiJ7cHJvZ3Jlc3N9ICN7dGlkOjA0ZH0gKHthZ2VudFsncmFyaXR5J119KS4uLiIsIGVuZD0iICIsIGZsdXNoPVRydWUpCgogICAgICAgIG9rID0gZ2VuZXJhdGVfc2luZ2xlKHRpZCwgYWdlbnRbInByb21wdCJdLCBmb3JjZT1mb3JjZSkKCiAgICAgICAgaWYgb2s6CiAgICAgICAgICAgIHN1Y2Nlc3NlcyArPSAxCiAgICAgICAgICAgIHByaW50KCJPSyIpCiAgICAgICAgZWxzZToKICAgICAgICAgICAgZmFpbHVyZXMgKz0gMQogICAgICAgICAgICBmYWlsZWRfaWRzLmFwcGVuZCh0aWQpCiAgICAgICAgICAgIHByaW50KCJGQUlMRUQiKQoKICAgICAgICAjIFJhdGUgbGltaXRpbmcgZGVsYXkgKHNraXAgYWZ0ZXIgbGFzdCBvbmUpCiAgICAgICAgaWYgaSA8IGxlbih0b19nZW5lcmF0ZSkgLSAxOgogICAgICAgICAgICB0aW1lLnNsZWVwKERFTEFZX0JFVFdFRU5fUkVRVUVTVFMpCgogICAgIyDilIDilIAgU3VtbWFyeSDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKICAgIHByaW50KCkKICAgIHByaW50KCI9IiAqIDUwKQogICAgcHJpbnQoIkdFTkVSQVRJT04gQ09NUExFVEUiKQogICAgcHJpbnQoIj0iICogNTApCiAgICBwcmludChmIlN1Y2Nlc3NmdWw6IHtzdWNjZXNzZXN9IikKICAgIHByaW50KGYiRmFpbGVkOiAgICAge2ZhaWx1cmVzfSIpCiAgICBwcmludChmIlNraXBwZWQ6ICAgIHthbHJlYWR5X2RvbmV9IikKICAgIGlmIGZhaWxlZF9pZHM6CiAgICAgICAgaWRzX3N0ciA9ICIsIi5qb2luKHN0cih4KSBmb3IgeCBpbiBmYWlsZWRfaWRzKQogICAgICAgIHByaW50KGYiXG5GYWlsZWQgSURzIChyZS1ydW4gd2l0aCAtLXJlZG8ge2lkc19zdHJ9KToiKQogICAgICAgIGZvciB0aWQgaW4gZmFpbGVkX2lkczoKICAgICAgICAgICAgcHJpbnQoZiIgICN7dGlkOjA0ZH0iKQoKCmlmIF9fbmFtZV9fID09ICJfX21haW5fXyI6CiAgICBtYWluKCkK",
-    "update_metadata_cid.py": "IyEvdXNyL2Jpbi9lbnYgcHl0aG9uMwoiIiIKUmVwbGFjZSBZT1VSX0NJRF9IRVJFIGluIGFsbCBtZXRhZGF0YSBmaWxlcyB3aXRoIGFuIGFjdHVhbCBJUEZTIENJRC4KClVzYWdlOgogICAgcHl0aG9uIHVwZGF0ZV9tZXRhZGF0YV9jaWQucHkgUW1Zb3VyQWN0dWFsQ0lESGVyZQoiIiIKCmltcG9ydCBqc29uCmltcG9ydCBvcwppbXBvcnQgc3lzCgoKZGVmIG1haW4oKToKICAgIGlmIGxlbihzeXMuYXJndikgIT0gMjoKICAgICAgICBwcmludCgiVXNhZ2U6IHB5dGhvbiB1cGRhdGVfbWV0YWRhdGFfY2lkLnB5IDxJUEZTX0NJRD4iKQogICAgICAgIHByaW50KCJFeGFtcGxlOiBweXRob24gdXBkYXRlX21ldGFkYXRhX2NpZC5weSBRbVh5N3ouLi4iKQogICAgICAgIHN5cy5leGl0KDEpCgogICAgY2lkID0gc3lzLmFyZ3ZbMV0uc3RyaXAoKQogICAgbWV0YWRhdGFfZGlyID0gIm91dHB1dC9tZXRhZGF0YSIKCiAgICBpZiBub3Qgb3MucGF0aC5pc2RpcihtZXRhZGF0YV9kaXIpOgogICAgICAgIHByaW50KGYiRVJST1I6IHttZXRhZGF0YV9kaXJ9IG5vdCBmb3VuZC4gUnVuIGdlbmVyYXRlX3Byb21wdHMucHkgZmlyc3QuIikKICAgICAgICBzeXMuZXhpdCgxKQoKICAgIHVwZGF0ZWQgPSAwCiAgICBmb3IgZmlsZW5hbWUgaW4gc29ydGVkKG9zLmxpc3RkaXIobWV0YWRhdGFfZGlyKSk6CiAgICAgICAgaWYgbm90IGZpbGVuYW1lLmVuZHN3aXRoKCIuanNvbiIpOgogICAgICAgICAgICBjb250aW51ZQogICAgICAgIHBhdGggPSBvcy5wYXRoLmpvaW4obWV0YWRhdGFfZGlyLCBmaWxlbmFtZSkKICAgICAgICB3aXRoIG9wZW4ocGF0aCkgYXMgZjoKICAgICAgICAgICAgZGF0YSA9IGpzb24ubG9hZChmKQoKICAgICAgICBvbGRfaW1hZ2UgPSBkYXRhLmdldCgiaW1hZ2UiLCAiIikKICAgICAgICBuZXdfaW1hZ2UgPSBvbGRfaW1hZ2UucmVwbGFjZSgiWU9VUl9DSURfSEVSRSIsIGNpZCkKCiAgICAgICAgaWYgbmV3X2ltYWdlICE9IG9sZF9pbWFnZToKICAgICAgICAgICAgZGF0YVsiaW1hZ2UiXSA9IG5ld19pbWFnZQogICAgICAgICAgICB3aXRoIG9wZW4ocGF0aCwgInciKSBhcyBmOgogICAgICAgICAgICAgICAganNvbi5kdW1wKGRhdGEsIGYsIGluZGVudD0yKQogICAgICAgICAgICB1cGRhdGVkICs9IDEKCiAgICBwcmludChmIlVwZGF0ZWQge3VwZGF0ZWR9IG1ldGFkYXRhIGZpbGVzIHdpdGggQ0lEOiB7Y2lkfSIpCiAgICBpZiB1cGRhdGVkID09IDA6CiAgICAgICAgcHJpbnQoIihObyBmaWxlcyBjb250YWluZWQgWU9VUl9DSURfSEVSRSDigJQgd2VyZSB0aGV5IGFscmVhZHkgdXBkYXRlZD8pIikKCgppZiBfX25hbWVfXyA9PSAiX19tYWluX18iOgogICAgbWFpbigpCg==",
+    "requirements.txt": "YWlvaHR0cD49My45LjAKYWlvZmlsZXM+PTIzLjEuMApvcmpzb24+PTMuOC4wCm51bXB5Pj0xLjIyLjAK",
+    "README.md": "IyBDaGliaSBBZ2VudHMgTkZUIOKAlCBJbWFnZSBHZW5lcmF0aW9uIFBpcGVsaW5lCgpBIHBpcGVsaW5lIGZvciBnZW5lcmF0aW5nIGEgMjAwMC1waWVjZSBjaGliaSBzZWNyZXQgYWdlbnQgTkZUIGNvbGxlY3Rpb24gdXNpbmcgZmFsLmFpLgoKIyMgU2V0dXAKCmBgYGJhc2gKIyBJbnN0YWxsIGRlcGVuZGVuY2llcwpwaXAgaW5zdGFsbCAtciByZXF1aXJlbWVudHMudHh0CgojIFNldCB5b3VyIGZhbC5haSBBUEkga2V5CmV4cG9ydCBGQUxfS0VZPSJ5b3VyLWZhbC1hcGkta2V5LWhlcmUiCmBgYAoKIyMgU3RlcCAxOiBHZW5lcmF0ZSBQcm9tcHRzICYgTWV0YWRhdGEKCmBgYGJhc2gKcHl0aG9uIGdlbmVyYXRlX3Byb21wdHMucHkKYGBgCgpUaGlzIGNyZWF0ZXM6Ci0gYG91dHB1dC9mdWxsX2NvbGxlY3Rpb24uanNvbmAg4oCUIGFsbCAyMDAwIGFnZW50cyB3aXRoIHByb21wdHMsIHRyYWl0cywgYW5kIHJhcml0eQotIGBvdXRwdXQvcHJvbXB0c19vbmx5LnR4dGAg4oCUIGp1c3QgcHJvbXB0cywgb25lIHBlciBsaW5lCi0gYG91dHB1dC9tZXRhZGF0YS8wMDAxLmpzb25gIHRocm91Z2ggYG91dHB1dC9tZXRhZGF0YS8yMDAwLmpzb25gIOKAlCBPcGVuU2VhLXN0YW5kYXJkIG1ldGFkYXRhCgojIyMgUmFyaXR5IERpc3RyaWJ1dGlvbgp8IFJhcml0eSAgICB8IENvdW50IHwgUGVyY2VudGFnZSB8CnwtLS0tLS0tLS0tLXwtLS0tLS0tfC0tLS0tLS0tLS0tLXwKfCBDb21tb24gICAgfCA0MDAgICB8IDIwJSAgICAgICAgfAp8IFVuY29tbW9uICB8IDc2MCAgIHwgMzglICAgICAgICB8CnwgUmFyZSAgICAgIHwgNjAwICAgfCAzMCUgICAgICAgIHwKfCBMZWdlbmRhcnkgfCAyNDAgICB8IDEyJSAgICAgICAgfAoKIyMgU3RlcCAyOiBHZW5lcmF0ZSBJbWFnZXMKCmBgYGJhc2gKIyBUZXN0IGJhdGNoIChmaXJzdCAyMCkKcHl0aG9uIGdlbmVyYXRlX2ltYWdlcy5weSAtLXN0YXJ0IDEgLS1lbmQgMjAKCiMgRnVsbCBydW4gKGFsbCAyMDAwKQpweXRob24gZ2VuZXJhdGVfaW1hZ2VzLnB5CgojIFJlZG8gc3BlY2lmaWMgaW1hZ2VzCnB5dGhvbiBnZW5lcmF0ZV9pbWFnZXMucHkgLS1yZWRvIDMsMTcsNDIKCiMgVXNlIGEgZGlmZmVyZW50IG1vZGVsCnB5dGhvbiBnZW5lcmF0ZV9pbWFnZXMucHkgLS1tb2RlbCBmYWwtYWkvbmFuby1iYW5hbmEtcHJvCgojIENhcCBjYWxscyB0byB0aGUgZmFsLmFpIHF1ZXVlIChkZWZhdWx0IDEwIHBlciBzZWNvbmQpCnB5dGhvbiBnZW5lcmF0ZV9pbWFnZXMucHkgLS1yYXRlIDUKCiMgQ2hhbmdlIGhvdyBtYW55IGltYWdlcyBhcmUgZ2VuZXJhdGVkIGluIHBhcmFsbGVsIChkZWZhdWx0IDE2KQpweXRob24gZ2VuZXJhdGVfaW1hZ2VzLnB5IC0tY29uY3VycmVuY3kgMzIKYGBgCgpGZWF0dXJlczoKLSAqKkNvbmN1cnJlbnQgZ2VuZXJhdGlvbioqIOKAlCB1cCB0byBgLS1jb25jdXJyZW5jeWAgaW1hZ2VzIGluIGZsaWdodCBhdCBvbmNlIG92ZXIgYSBzaGFyZWQgY29ubmVjdGlvbiBwb29sCi0gKipQdXNoLXN0eWxlIHN0YXR1cyoqIOKAlCBmb2xsb3dzIGZhbCdzIHF1ZXVlIHN0YXR1cyBzdHJlYW0gaW5zdGVhZCBvZiBwb2xsaW5nLCBmYWxsaW5nIGJhY2sgdG8gcG9sbGluZyBpZiB0aGUgc3RyZWFtIGlzIHVuYXZhaWxhYmxlCi0gKipSZXN1bWUgY2FwYWJpbGl0eSoqIOKAlCByZS1ydW5uaW5nIHNraXBzIGFscmVhZHktZG93bmxvYWRlZCBpbWFnZXMKLSAqKkJhdGNoIHN1cHBvcnQqKiDigJQgdXNlIGAtLXN0YXJ0YCBhbmQgYC0tZW5kYCB0byBnZW5lcmF0ZSBhIHJhbmdlCi0gKipSZWRvIG1vZGUqKiDigJQgYC0tcmVkbyAzLDE3LDQyYCByZWdlbmVyYXRlcyBvbmx5IHRob3NlIHRva2VuIElEcwotICoqUmF0ZSBsaW1pdGluZyoqIOKAlCB0b2tlbiBidWNrZXQgY2FwcGVkIGJ5IGAtLXJhdGVgIHRoYXQgYWxzbyBiYWNrcyBvZmYgd2hlbiBmYWwuYWkncyByYXRlLWxpbWl0IGhlYWRlcnMgc2F5IHRoZSBxdW90YSBpcyBuZWFybHkgc3BlbnQKLSAqKkF1dG8tcmV0cnkqKiDigJQgMyBhdHRlbXB0cyBwZXIgaW1hZ2Ugb24gdGhyb3R0bGluZywgNXh4LCB0aW1lb3V0cywgY29ubmVjdGlvbiBlcnJvcnMgYW5kIHRydW5jYXRlZCByZXNwb25zZXMsIHdpdGggaml0dGVyZWQgZXhwb25lbnRpYWwgYmFja29mZiAoaG9ub3JzIGBSZXRyeS1BZnRlcmApOyBhbnl0aGluZyBlbHNlICg0eHgsIGZhaWxlZCBnZW5lcmF0aW9ucykgZmFpbHMgaW1tZWRpYXRlbHkKLSAqKlByb2dyZXNzIHRyYWNraW5nKiog4oCUIHJlcG9ydHMgc3VjY2Vzcy9mYWlsdXJlIGNvdW50cyBhbmQgbGlzdHMgZmFpbGVkIElEcwoKSW1hZ2VzIGFyZSBzYXZlZCB0byBgb3V0cHV0L2ltYWdlcy8wMDAxLnBuZ2AgdGhyb3VnaCBgb3V0cHV0L2ltYWdlcy8yMDAwLnBuZ2AuCgojIyBTdGVwIDM6IFVwZGF0ZSBNZXRhZGF0YSB3aXRoIElQRlMgQ0lECgpBZnRlciB1cGxvYWRpbmcgaW1hZ2VzIHRvIElQRlM6CgpgYGBiYXNoCnB5dGhvbiB1cGRhdGVfbWV0YWRhdGFfY2lkLnB5IFFtWW91ckFjdHVhbENJREhlcmUKYGBgCgpUaGlzIHJlcGxhY2VzIGBZT1VSX0NJRF9IRVJFYCBpbiBhbGwgMjAwMCBtZXRhZGF0YSBmaWxlcyB3aXRoIHlvdXIgcmVhbCBDSUQuCgojIyBQcm9qZWN0IFN0cnVjdHVyZQoKYGBgCmNoaWJpLWFnZW50cy1uZnQvCuKUnOKUgOKUgCBnZW5lcmF0ZV9wcm9tcHRzLnB5ICAgICAgIyBQaGFzZSAxOiB0cmFpdCBnZW5lcmF0aW9uICYgbWV0YWRhdGEK4pSc4pSA4pSAIGdlbmVyYXRlX2ltYWdlcy5weSAgICAgICAjIFBoYXNlIDI6IGZhbC5haSBpbWFnZSBnZW5lcmF0aW9uCuKUnOKUgOKUgCB1cGRhdGVfbWV0YWRhdGFfY2lkLnB5ICAgIyBQaGFzZSAzOiBJUEZTIENJRCByZXBsYWNlbWVudArilJzilIDilIAgcmVxdWlyZW1lbnRzLnR4dArilJzilIDilIAgUkVBRE1FLm1kCuKUlOKUgOKUgCBvdXRwdXQvICAgICAgICAgICAgICAgICAgIyBjcmVhdGVkIGJ5IHNjcmlwdHMKICAgIOKUnOKUgOKUgCBmdWxsX2NvbGxlY3Rpb24uanNvbgogICAg4pSc4pSA4pSAIHByb21wdHNfb25seS50eHQKICAgIOKUnOKUgOKUgCBtZXRhZGF0YS8KICAgIOKUgiAgIOKUnOKUgOKUgCAwMDAxLmpzb24KICAgIOKUgiAgIOKUlOKUgOKUgCAuLi4KICAgIOKUlOKUgOKUgCBpbWFnZXMvCiAgICAgICAg4pSc4pSA4pSAIDAwMDEucG5nCiAgICAgICAg4pSU4pSA4pSAIC4uLgpgYGAK",
+    "generate_prompts.py": "IyEvdXNyL2Jpbi9lbnYgcHl0aG9uMwoiIiJHZW5lcmF0ZSAyMDAwIHVuaXF1ZSBjaGliaSBhZ2VudCBORlQgdHJhaXQgY29tYmluYXRpb25zLiIiIgoKaW1wb3J0IG9zCmltcG9ydCByYW5kb20KaW1wb3J0IHN5cwpmcm9tIGNvbGxlY3Rpb25zIGltcG9ydCBDb3VudGVyCmZyb20gY29uY3VycmVudC5mdXR1cmVzIGltcG9ydCBUaHJlYWRQb29sRXhlY3V0b3IKCmltcG9ydCBudW1weSBhcyBucAppbXBvcnQgb3Jqc29uCgpyYW5kb20uc2VlZCg0MikKcm5nID0gbnAucmFuZG9tLmRlZmF1bHRfcm5nKDQyKQoKIyDilIDilIAgVHJhaXQgcG9vbHMg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACgpTVUlUX1NUWUxFUyA9IFsKICAgICJibGFjayBzdWl0IGJsYWNrIHRpZSIsICJibGFjayBzdWl0IGJsYWNrIHR1cnRsZW5lY2siLAogICAgImJsYWNrIHN1aXQgb3BlbiBjb2xsYXIgYmxhY2sgc2hpcnQiLCAiYmxhY2sgc3VpdCB3aGl0ZSBzaGlydCBsb29zZSB0aWUiLAogICAgImJsYWNrIHN1aXQgd2hpdGUgc2hpcnQgc2tpbm55IGJsYWNrIHRpZSIsICJibGFjayBkb3VibGUtYnJlYXN0ZWQgc3VpdCIsCiAgICAiYmxhY2sgdGhyZWUtcGllY2Ugc3VpdCB3aXRoIHZlc3QgdmlzaWJsZSIsICJibGFjayBzdWl0IG1hbmRhcmluIGNvbGxhciIsCiAgICAiYmxhY2sgc3VpdCBidXR0b25lZCBhbGwgdGhlIHdheSB1cCIsICJibGFjayBzdWl0IHJvbGxlZCBzbGVldmVzIiwKICAgICJydW1wbGVkIGJsYWNrIHN1aXQgbm8gdGllIiwgInNoYXJwIGJsYWNrIHN1aXQgYmxhY2sgc2hpcnQiLAogICAgImNyaXNwIGJsYWNrIHN1aXQgd2hpdGUgc2hpcnQgYmxhY2sgdGllIiwgImJsYWNrIHN1aXQgd2l0aCBwb2NrZXQgc3F1YXJlIiwKXQoKU1VOR0xBU1NFUyA9IFsKICAgICJibGFjayBhdmlhdG9yIHN1bmdsYXNzZXMiLCAiYmxhY2sgd2F5ZmFyZXIgc3VuZ2xhc3NlcyIsCiAgICAicm91bmQgYmxhY2sgc3VuZ2xhc3NlcyIsICJyZWN0YW5ndWxhciBibGFjayBzdW5nbGFzc2VzIiwKICAgICJ3cmFwYXJvdW5kIGJsYWNrIHN1bmdsYXNzZXMiLCAiYmxhY2sgY2x1Ym1hc3RlciBzdW5nbGFzc2VzIiwKICAgICJjYXQtZXllIGJsYWNrIHN1bmdsYXNzZXMiLCAib3ZhbCBibGFjayBzdW5nbGFzc2VzIiwKICAgICJhbmd1bGFyIGJsYWNrIHN1bmdsYXNzZXMiLCAidGhpbiByZWN0YW5ndWxhciBibGFjayBzdW5nbGFzc2VzIiwKXQoKSEFJUl9TVFlMRVMgPSBbCiAgICAic2hvcnQgc3Bpa3kgaGFpciIsICJsb25nIHN0cmFpZ2h0IGhhaXIiLCAibWVzc3kgY3VybHkgaGFpciIsCiAgICAic2xpY2tlZCBiYWNrIGhhaXIiLCAic2hvcnQgYnV6emN1dCIsICJsb25nIHdhdnkgaGFpciB3aXRoIGJhbmdzIiwKICAgICJzaG9ydCB0ZXh0dXJlZCBoYWlyIHdpdGggdW5kZXJjdXQiLCAibWVkaXVtIHRvdXNsZWQgaGFpciIsCiAgICAibmVhdCBzaG9ydCBoYWlyIHdpdGggc2lkZSBwYXJ0IiwgInNob3J0IGNob3BweSBoYWlyIiwKICAgICJ0aWdodCBicmFpZHMgcHVsbGVkIGJhY2siLCAic2hvcnQgZmxhdC10b3AgbWlsaXRhcnkgaGFpcmN1dCIsCiAgICAibWVzc3kgbWVkaXVtIGhhaXIgd2l0aCBiYW5ncyIsICJsb25nIGhhaXIgaW4gYSBidW4iLCAibW9oYXdrIiwKICAgICJzaG91bGRlciBsZW5ndGggc3RyYWlnaHQgaGFpciIsCl0KCkhBSVJfQ09MT1JTID0gWwogICAgImJsYWNrIiwgImRhcmsgYnJvd24iLCAibGlnaHQgYnJvd24iLCAiYmxvbmRlIiwgImRhcmsgYmxvbmRlIiwKICAgICJwbGF0aW51bSBibG9uZGUiLCAicmVkIiwgImRhcmsgcmVkIiwgImF1YnVybiIsICJzaWx2ZXItd2hpdGUiLAogICAgImR1c3R5IGJsdWUiLCAicGluayIsICJncmF5IiwgImpldCBibGFjayIsICJzdHJhd2JlcnJ5IGJsb25kZSIsCiAgICAicHVycGxlIiwgImdyZWVuLXRpbnRlZCBibGFjayIsCl0KClNLSU5fVE9ORVMgPSBbCiAgICAicGFsZSBza2luIiwgImxpZ2h0IHNraW4iLCAiZmFpciBwaW5rIHNraW4iLCAibGlnaHQgdGFuIHNraW4iLAogICAgIm9saXZlIHNraW4iLCAid2FybSBtZWRpdW0gc2tpbiIsICJ0YW4gc2tpbiIsICJ3YXJtIGdvbGRlbi1icm93biBza2luIiwKICAgICJicm93biBza2luIiwgImRhcmsgYnJvd24gc2tpbiIsICJkZWVwIGRhcmsgc2tpbiIsICJwYWxlIHBvcmNlbGFpbiBza2luIiwKXQoKQUNDRVNTT1JJRVMgPSBbCiAgICAiY29pbGVkIGNsZWFyIGVhcnBpZWNlIiwgInJhZGlvIGVhcnBpZWNlIHdpdGggY29pbGVkIGNvcmQiLAogICAgInNpbmdsZSBlYXJwaWVjZSIsICJhbWVyaWNhbiBmbGFnIGxhcGVsIHBpbiIsICJzaWx2ZXIgbGFwZWwgcGluIiwKICAgICJiYWRnZSBsYW55YXJkIHR1Y2tlZCBpbnRvIGphY2tldCIsICJwZW4gY2xpcHBlZCB0byBicmVhc3QgcG9ja2V0IiwKICAgICJjbGFzc2lmaWVkIGZvbGRlciBwZWVraW5nIGZyb20gamFja2V0IiwgImNpZ2FyZXR0ZSBiZWhpbmQgZWFyIiwKICAgICJzaWx2ZXIgdGllIGNsaXAiLCAiY2hhaW4gY29ubmVjdGluZyBlYXIgY3VmZiB0byBjb2xsYXIiLAogICAgImRvZyB0YWdzIHR1Y2tlZCB1bmRlciBzaGlydCIsICJ3cmlzdHdhdGNoIHBlZWtpbmcgZnJvbSBzbGVldmUiLApdCgpUQVRUT09TID0gWwogICAgIm5lY2sgdGF0dG9vIHBlZWtpbmcgYWJvdmUgY29sbGFyIiwgImhhbmQgdGF0dG9vcyB2aXNpYmxlIiwKICAgICJzbGVldmUgdGF0dG9vIHBlZWtpbmcgZnJvbSBjdWZmIiwgInRlYXJkcm9wIGZhY2UgdGF0dG9vIiwKICAgICJzcGlkZXIgd2ViIHRhdHRvbyBvbiBuZWNrIiwgImJhcmNvZGUgdGF0dG9vIG9uIG5lY2siLAogICAgImNyb3NzIHRhdHRvbyB1bmRlciBleWUiLCAic25ha2UgdGF0dG9vIGNyYXdsaW5nIHVwIG5lY2siLAogICAgInJvc2UgdGF0dG9vIGJlaGluZCBlYXIiLCAic2t1bGwgdGF0dG9vIGJlaGluZCBlYXIiLAogICAgImZsYW1lIHRhdHRvbyBvbiBuZWNrIiwgImtudWNrbGUgdGF0dG9vcyIsICJzdGFyIHRhdHRvbyBiZWhpbmQgZWFyIiwKICAgICJkYWdnZXIgdGF0dG9vIG9uIGhhbmQiLCAiZm9yZWFybSB0YXR0b29zIHZpc2libGUiLApdCgpQSUVSQ0lOR1MgPSBbCiAgICAiZ29sZCBub3NlIHN0dWQiLCAic2lsdmVyIG5vc2UgcmluZyIsICJzZXB0dW0gcmluZyIsICJidWxsIG5vc2UgcmluZyIsCiAgICAiZXllYnJvdyBwaWVyY2luZyIsICJsaXAgcmluZyIsICJkb3VibGUgbm9zZSByaW5nIiwKICAgICJpbmR1c3RyaWFsIGVhciBwaWVyY2luZyIsICJkb3VibGUgaG9vcCBlYXJyaW5nIiwgImVhciBjdWZmIiwKICAgICJjaGFpbiBub3NlIHJpbmcgdG8gZWFyIGN1ZmYiLCAidG9uZ3VlIHBpZXJjaW5nIiwKXQoKRlJFQ0tMRVMgPSBbCiAgICAiZnJlY2tsZXMgb24gbm9zZSIsICJzY2F0dGVyZWQgZnJlY2tsZXMgYWNyb3NzIGNoZWVrcyIsCiAgICAibGlnaHQgZnJlY2tsZXMiLCAic3VidGxlIGZyZWNrbGVzIiwKXQoKQkFDS0dST1VORFMgPSBbCiAgICAiZ3JhaW55IHN1cnZlaWxsYW5jZSBmb290YWdlIG9mIHBhcmtpbmcgZ2FyYWdlIiwKICAgICJ1bmRlcmdyb3VuZCBidW5rZXIgd2l0aCByZWQgZW1lcmdlbmN5IGxpZ2h0cyIsCiAgICAiY29yayBib2FyZCB3aXRoIHJlZCBzdHJpbmcgY29uc3BpcmFjeSB3YWxsIiwKICAgICJmb2dneSBibGFjayBoZWxpY29wdGVyIHRhcm1hYyIsCiAgICAiZW1wdHkgaW50ZXJyb2dhdGlvbiByb29tIHNpbmdsZSBsaWdodGJ1bGIiLAogICAgInJlZGFjdGVkIGRvY3VtZW50cyBzY2F0dGVyZWQgZGVzayIsCiAgICAic2hhZG93eSBoYWxsd2F5IHdpdGggZmxpY2tlcmluZyBmbHVvcmVzY2VudCBsaWdodHMiLAogICAgImRlc2VydCBoaWdod2F5IEFyZWEgNTEgc2VhcmNobGlnaHRzIiwKICAgICJzZWNyZXQgdW5kZXJncm91bmQgbGFiIHdpdGggZ3JlZW4gZ2xvd2luZyB0dWJlcyIsCiAgICAicmFpbnkgbmlnaHQgZW1iYXNzeSByb29mdG9wIHdpdGggc2F0ZWxsaXRlIGRpc2hlcyIsCiAgICAibG9uZyBkYXJrIGNvcnJpZG9yIHdpdGggc2luZ2xlIHJlZCBleGl0IHNpZ24iLAogICAgImZvZ2d5IGJyaWRnZSBhdCBtaWRuaWdodCB3aXRoIGRpc3RhbnQgaGVhZGxpZ2h0cyIsCiAgICAiZW1wdHkgcGFya2luZyBzdHJ1Y3R1cmUgd2l0aCBmbGlja2VyaW5nIGxpZ2h0cyIsCiAgICAiZGFyayBzZXJ2ZXIgcm9vbSB3aXRoIHJvd3Mgb2YgYmxpbmtpbmcgYmx1ZSBsaWdodHMiLAogICAgInJlc3RyaWN0ZWQgbWlsaXRhcnkgaGFuZ2FyIHdpdGggZHJhcGVkIHRhcnBzIiwKICAgICJkZXNlcnQgbmlnaHQgc2t5IHdpdGggZGlzdGFudCB1bm1hcmtlZCB3YXJlaG91c2UiLAogICAgImRpbWx5IGxpdCB3YXIgcm9vbSB3aXRoIGdsb3dpbmcgbW9uaXRvcnMiLAogICAgInNhdGVsbGl0ZSBkaXNoIGFycmF5IGluIGRlc2VydCBhdCBuaWdodCIsCiAgICAiYmxhY2tlZCBvdXQgU1VWIG1vdG9yY2FkZSBvbiByYWlueSBzdHJlZXQiLAogICAgImFiYW5kb25lZCB3YXJlaG91c2Ugd2l0aCBzY2F0dGVyZWQgY2xhc3NpZmllZCBmaWxlcyIsCiAgICAicm9vZnRvcCBhdCBuaWdodCB3aXRoIGRpc3RhbnQgcmFkaW8gdG93ZXIgYmxpbmtpbmcgcmVkIiwKICAgICJkZWVwIHVuZGVyZ3JvdW5kIHR1bm5lbCB3aXRoIHBpcGVzIGFuZCBkaW0geWVsbG93IGxpZ2h0cyIsCiAgICAic3RhdGljLWZpbGxlZCBUViBzY3JlZW5zIGluIGRhcmsgY29udHJvbCByb29tIiwKICAgICJhaXJwb3J0IHRhcm1hYyB3aXRoIHVubWFya2VkIGJsYWNrIGhlbGljb3B0ZXIiLAogICAgIm5pZ2h0IHNreSB3aXRoIGJsdXJyeSBVRk8gYW5kIHNlYXJjaGxpZ2h0cyIsCiAgICAiUGVudGFnb24gaGFsbHdheSB3aXRoIGZsdW9yZXNjZW50IGxpZ2h0aW5nIiwKICAgICJibHVycnkgcmVkYWN0ZWQgZG9jdW1lbnRzIGFuZCBmaWxpbmcgY2FiaW5ldHMiLApdCgpFWFBSRVNTSU9OUyA9IFsKICAgICJ0aW55IG5ldXRyYWwgbW91dGgiLCAidGlueSBmbGF0IG1vdXRoIiwgInNtYWxsIGV4cHJlc3Npb25sZXNzIG1vdXRoIiwKICAgICJzbWFsbCBmbGF0IG1vdXRoIiwgInRpbnkgc3RyYWlnaHQgbW91dGgiLApdCgojIOKUgOKUgCBSYXJpdHktd2VpZ2h0ZWQgb3B0aW9uYWwgdHJhaXQgc2VsZWN0aW9uIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAojIFRhcmdldCBkaXN0cmlidXRpb246CiMgICBDb21tb24gICgwIGV4dHJhcyk6IH4yMCUgIC0+IDQwMAojICAgVW5jb21tb24oMSBleHRyYSk6ICB+MzglICAtPiA3NjAKIyAgIFJhcmUgICAgKDIgZXh0cmFzKTogfjMwJSAgLT4gNjAwCiMgICBMZWdlbmRhcnkoMy00IGV4dHJhcyk6fjEyJSAtPiAyNDAKClJBUklUWV9XRUlHSFRTID0gewogICAgMDogNDAwLCAgICMgQ29tbW9uCiAgICAxOiA3NjAsICAgIyBVbmNvbW1vbgogICAgMjogNjAwLCAgICMgUmFyZQogICAgMzogMjAwLCAgICMgTGVnZW5kYXJ5ICgzIGV4dHJhcykKICAgIDQ6IDQwLCAgICAjIExlZ2VuZGFyeSAoNCBleHRyYXMpCn0KClJBUklUWV9MQUJFTFMgPSB7CiAgICAwOiAiQ29tbW9uIiwKICAgIDE6ICJVbmNvbW1vbiIsCiAgICAyOiAiUmFyZSIsCiAgICAzOiAiTGVnZW5kYXJ5IiwKICAgIDQ6ICJMZWdlbmRhcnkiLAp9CgpQUk9NUFRfSEVBRCA9ICJDaGliaSBhZ2VudCwgb3ZlcnNpemVkIGhlYWQsIGxhcmdlIGdsb3NzeSBibGFjayBleWVzIHdpdGggd2hpdGUgaGlnaGxpZ2h0cyIKUFJPTVBUX1RBSUwgPSAia2F3YWlpIGRpZ2l0YWwgYXJ0LCBORlQgY29sbGVjdGlibGUgY2FyZCBzdHlsZSIKCiMgRXZlcnkgYWdlbnQgZ2V0cyBvbmUgdHJhaXQgZnJvbSBlYWNoIG9mIHRoZXNlLCBpbiB0aGlzIGNvbHVtbiBvcmRlcgpCQVNFX0NBVEVHT1JJRVMgPSBbCiAgICAoInN1aXRfc3R5bGUiLCBTVUlUX1NUWUxFUyksCiAgICAoInN1bmdsYXNzZXMiLCBTVU5HTEFTU0VTKSwKICAgICgiaGFpcl9zdHlsZSIsIEhBSVJfU1RZTEVTKSwKICAgICgiaGFpcl9jb2xvciIsIEhBSVJfQ09MT1JTKSwKICAgICgic2tpbl90b25lIiwgU0tJTl9UT05FUyksCiAgICAoImJhY2tncm91bmQiLCBCQUNLR1JPVU5EUyksCiAgICAoImV4cHJlc3Npb24iLCBFWFBSRVNTSU9OUyksCl0KQkFTRV9QT09MX1NJWkVTID0gdHVwbGUobGVuKHBvb2wpIGZvciBfLCBwb29sIGluIEJBU0VfQ0FURUdPUklFUykKVE9UQUxfQkFTRV9DT01CT1MgPSBpbnQobnAucHJvZChCQVNFX1BPT0xfU0laRVMpKQoKT1BUSU9OQUxfQ0FURUdPUklFUyA9IFsKICAgICgiYWNjZXNzb3J5IiwgQUNDRVNTT1JJRVMpLAogICAgKCJ0YXR0b28iLCBUQVRUT09TKSwKICAgICgicGllcmNpbmciLCBQSUVSQ0lOR1MpLAogICAgKCJmcmVja2xlcyIsIEZSRUNLTEVTKSwKXQoKIyDilIDilIAgT3BlblNlYSBhdHRyaWJ1dGVzIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAojIEtleXMgYW5kIGxhYmVscyBhcmUgdGhlIHNhbWUgaW4gZXZlcnkgbWV0YWRhdGEgZmlsZSwgc28gaW50ZXJuIHRoZW0gb25jZSBhbmQKIyBzaGFyZSB0aGVtIGFjcm9zcyBhbGwgMjAwMCBhdHRyaWJ1dGUgbGlzdHMuCgpUUkFJVF9UWVBFID0gc3lzLmludGVybigidHJhaXRfdHlwZSIpClZBTFVFID0gc3lzLmludGVybigidmFsdWUiKQpSQVJJVFlfQVRUUklCVVRFID0gc3lzLmludGVybigiUmFyaXR5IikKCkJBU0VfQVRUUklCVVRFUyA9IFsKICAgIChzeXMuaW50ZXJuKGxhYmVsKSwga2V5KQogICAgZm9yIGxhYmVsLCBrZXkgaW4gWwogICAgICAgICgiU3VpdCBTdHlsZSIsICJzdWl0X3N0eWxlIiksCiAgICAgICAgKCJTdW5nbGFzc2VzIiwgInN1bmdsYXNzZXMiKSwKICAgICAgICAoIkhhaXIgU3R5bGUiLCAiaGFpcl9zdHlsZSIpLAogICAgICAgICgiSGFpciBDb2xvciIsICJoYWlyX2NvbG9yIiksCiAgICAgICAgKCJTa2luIFRvbmUiLCAic2tpbl90b25lIiksCiAgICAgICAgKCJCYWNrZ3JvdW5kIiwgImJhY2tncm91bmQiKSwKICAgICAgICAoIkV4cHJlc3Npb24iLCAiZXhwcmVzc2lvbiIpLAogICAgXQpdCgpPUFRJT05BTF9BVFRSSUJVVEVTID0gWwogICAgKHN5cy5pbnRlcm4obGFiZWwpLCBrZXkpCiAgICBmb3IgbGFiZWwsIGtleSBpbiBbCiAgICAgICAgKCJBY2Nlc3NvcnkiLCAiYWNjZXNzb3J5IiksCiAgICAgICAgKCJUYXR0b28iLCAidGF0dG9vIiksCiAgICAgICAgKCJQaWVyY2luZyIsICJwaWVyY2luZyIpLAogICAgICAgICgiRnJlY2tsZXMiLCAiZnJlY2tsZXMiKSwKICAgIF0KXQoKCmRlZiBwaWNrX2V4dHJhcyhudW1fZXh0cmFzOiBpbnQpIC0+IGRpY3Q6CiAgICAiIiJQaWNrIHdoaWNoIG9wdGlvbmFsIGNhdGVnb3JpZXMgYXJlIGFjdGl2ZSBhbmQgc2VsZWN0IGEgdHJhaXQgZnJvbSBlYWNoLiIiIgogICAgIyBCaXQgaSBzZXQgbWVhbnMgT1BUSU9OQUxfQ0FURUdPUklFU1tpXSBpcyBhY3RpdmUKICAgIG1hc2sgPSBzdW0oMSA8PCBpIGZvciBpIGluIHJhbmRvbS5zYW1wbGUocmFuZ2UobGVuKE9QVElPTkFMX0NBVEVHT1JJRVMpKSwgaz1udW1fZXh0cmFzKSkKICAgIHJldHVybiB7CiAgICAgICAgbmFtZTogcmFuZG9tLmNob2ljZShwb29sKSBpZiBtYXNrICYgKDEgPDwgaSkgZWxzZSBOb25lCiAgICAgICAgZm9yIGksIChuYW1lLCBwb29sKSBpbiBlbnVtZXJhdGUoT1BUSU9OQUxfQ0FURUdPUklFUykKICAgIH0KCgpkZWYgc2FtcGxlX2Jhc2VfaW5kaWNlcyhuOiBpbnQpIC0+IGxpc3Q6CiAgICAiIiJEcmF3IG4gZGlzdGluY3QgYmFzZS10cmFpdCBjb21iaW5hdGlvbnMgaW4gb25lIGJhdGNoLgoKICAgIFBpY2tzIG4gZGlmZmVyZW50IHBvc2l0aW9ucyBpbiB0aGUgQ2FydGVzaWFuIHByb2R1Y3Qgb2YgQkFTRV9DQVRFR09SSUVTCiAgICBhbmQgZGVjb2RlcyBlYWNoIGludG8gcGVyLWNhdGVnb3J5IHBvb2wgaW5kaWNlcywgc28gZXZlcnkgcm93IGlzIHVuaXF1ZQogICAgYnkgY29uc3RydWN0aW9uLiBSZXR1cm5zIG4gcm93cywgb25lIGluZGV4IHBlciBCQVNFX0NBVEVHT1JJRVMgZW50cnkuCiAgICAiIiIKICAgIGNvbWJvcyA9IHJuZy5jaG9pY2UoVE9UQUxfQkFTRV9DT01CT1MsIHNpemU9biwgcmVwbGFjZT1GYWxzZSkKICAgIHJldHVybiBucC5zdGFjayhucC51bnJhdmVsX2luZGV4KGNvbWJvcywgQkFTRV9QT09MX1NJWkVTKSwgYXhpcz0xKS50b2xpc3QoKQoKCmRlZiBnZW5lcmF0ZV9hZ2VudCh0b2tlbl9pZDogaW50LCBudW1fZXh0cmFzOiBpbnQsIGJhc2VfaW5kaWNlczogbGlzdCkgLT4gZGljdDoKICAgICIiIkdlbmVyYXRlIGEgc2luZ2xlIGFnZW50J3MgdHJhaXRzIGZyb20gcHJlLWRyYXduIGJhc2UtdHJhaXQgaW5kaWNlcy4iIiIKICAgIHRyYWl0cyA9IHtuYW1lOiBwb29sW2ldIGZvciAobmFtZSwgcG9vbCksIGkgaW4gemlwKEJBU0VfQ0FURUdPUklFUywgYmFzZV9pbmRpY2VzKX0KICAgIGV4dHJhcyA9IHBpY2tfZXh0cmFzKG51bV9leHRyYXMpCiAgICB0cmFpdHMudXBkYXRlKGV4dHJhcykKCiAgICByYXJpdHkgPSBSQVJJVFlfTEFCRUxTW251bV9leHRyYXNdCgogICAgIyBCdWlsZCBwcm9tcHQ7IGFic2VudCBvcHRpb25hbCB0cmFpdHMgYXJlIE5vbmUgYW5kIGRyb3BwZWQgYnkgZmlsdGVyKCkKICAgIHByb21wdCA9ICIsICIuam9pbihmaWx0ZXIoTm9uZSwgKAogICAgICAgIFBST01QVF9IRUFELAogICAgICAgIGYie3RyYWl0c1snaGFpcl9jb2xvciddfSB7dHJhaXRzWydoYWlyX3N0eWxlJ119IiwKICAgICAgICB0cmFpdHNbInNraW5fdG9uZSJdLAogICAgICAgIHRyYWl0c1siZnJlY2tsZXMiXSwKICAgICAgICB0cmFpdHNbImV4cHJlc3Npb24iXSwKICAgICAgICB0cmFpdHNbInN1aXRfc3R5bGUiXSwKICAgICAgICB0cmFpdHNbInN1bmdsYXNzZXMiXSwKICAgICAgICB0cmFpdHNbImFjY2Vzc29yeSJdLAogICAgICAgIHRyYWl0c1sidGF0dG9vIl0sCiAgICAgICAgdHJhaXRzWyJwaWVyY2luZyJdLAogICAgICAgICJjaGVzdC11cCBwb3J0cmFpdCIsCiAgICAgICAgZiJ7dHJhaXRzWydiYWNrZ3JvdW5kJ119IGJhY2tncm91bmQiLAogICAgICAgIFBST01QVF9UQUlMLAogICAgKSkpCgogICAgcmV0dXJuIHsKICAgICAgICAidG9rZW5faWQiOiB0b2tlbl9pZCwKICAgICAgICAidHJhaXRzIjogdHJhaXRzLAogICAgICAgICJyYXJpdHkiOiByYXJpdHksCiAgICAgICAgIm51bV9leHRyYXMiOiBudW1fZXh0cmFzLAogICAgICAgICJwcm9tcHQiOiBwcm9tcHQsCiAgICB9CgoKZGVmIGJ1aWxkX29wZW5zZWFfbWV0YWRhdGEoYWdlbnQ6IGRpY3QpIC0+IGRpY3Q6CiAgICAiIiJCdWlsZCBPcGVuU2VhLXN0YW5kYXJkIG1ldGFkYXRhIEpTT04gZm9yIGEgc2luZ2xlIGFnZW50LiIiIgogICAgdCA9IGFnZW50WyJ0cmFpdHMiXQogICAgYXR0cmlidXRlcyA9IFt7VFJBSVRfVFlQRTogbGFiZWwsIFZBTFVFOiB0W2tleV19IGZvciBsYWJlbCwga2V5IGluIEJBU0VfQVRUUklCVVRFU10KICAgIGF0dHJpYnV0ZXMuYXBwZW5kKHtUUkFJVF9UWVBFOiBSQVJJVFlfQVRUUklCVVRFLCBWQUxVRTogYWdlbnRbInJhcml0eSJdfSkKICAgIGF0dHJpYnV0ZXMuZXh0ZW5kKAogICAgICAgIHtUUkFJVF9UWVBFOiBsYWJlbCwgVkFMVUU6IHRba2V5XX0gZm9yIGxhYmVsLCBrZXkgaW4gT1BUSU9OQUxfQVRUUklCVVRFUyBpZiB0LmdldChrZXkpCiAgICApCgogICAgdGlkID0gYWdlbnRbInRva2VuX2lkIl0KICAgIHJldHVybiB7CiAgICAgICAgIm5hbWUiOiBmIkNoaWJpIEFnZW50ICN7dGlkOjA0ZH0iLAogICAgICAgICJkZXNjcmlwdGlvbiI6ICJBIGN1dGUgY2hpYmkgc2VjcmV0IGFnZW50IGZyb20gdGhlIDIwMDAtcGllY2UgQ2hpYmkgQWdlbnQgY29sbGVjdGlvbi4iLAogICAgICAgICJpbWFnZSI6IGYiaXBmczovL1lPVVJfQ0lEX0hFUkUve3RpZDowNGR9LnBuZyIsCiAgICAgICAgImF0dHJpYnV0ZXMiOiBhdHRyaWJ1dGVzLAogICAgfQoKCmRlZiB3cml0ZV9tZXRhZGF0YShhZ2VudDogZGljdCk6CiAgICAiIiJXcml0ZSBvbmUgYWdlbnQncyBPcGVuU2VhIG1ldGFkYXRhIHRvIG91dHB1dC9tZXRhZGF0YS9OTk5OLmpzb24uIiIiCiAgICBwYXRoID0gZiJvdXRwdXQvbWV0YWRhdGEve2FnZW50Wyd0b2tlbl9pZCddOjA0ZH0uanNvbiIKICAgIHdpdGggb3BlbihwYXRoLCAid2IiKSBhcyBmOgogICAgICAgIGYud3JpdGUob3Jqc29uLmR1bXBzKGJ1aWxkX29wZW5zZWFfbWV0YWRhdGEoYWdlbnQpLCBvcHRpb249b3Jqc29uLk9QVF9JTkRFTlRfMikpCgoKZGVmIG1haW4oKToKICAgICMgQnVpbGQgdGhlIHJhcml0eSBzY2hlZHVsZTogYSBsaXN0IG9mIG51bV9leHRyYXMgdmFsdWVzLCBvbmUgcGVyIGFnZW50CiAgICBzY2hlZHVsZSA9IFtdCiAgICBmb3IgbnVtX2V4dHJhcywgY291bnQgaW4gUkFSSVRZX1dFSUdIVFMuaXRlbXMoKToKICAgICAgICBzY2hlZHVsZS5leHRlbmQoW251bV9leHRyYXNdICogY291bnQpCiAgICBhc3NlcnQgbGVuKHNjaGVkdWxlKSA9PSAyMDAwLCBmIlNjaGVkdWxlIGhhcyB7bGVuKHNjaGVkdWxlKX0gZW50cmllcywgZXhwZWN0ZWQgMjAwMCIKICAgIHJhbmRvbS5zaHVmZmxlKHNjaGVkdWxlKQoKICAgICMgR2VuZXJhdGUgYWdlbnRzLiBCYXNlIHRyYWl0cyBhcmUgZHJhd24gYXMgZGlzdGluY3QgY29tYmluYXRpb25zLCBzbyB0aGUKICAgICMgZnVsbCB0cmFpdCBzZXRzIGFyZSB1bmlxdWUgd2l0aG91dCBhbnkgcmVqZWN0aW9uIHNhbXBsaW5nLgogICAgYmFzZV9yb3dzID0gc2FtcGxlX2Jhc2VfaW5kaWNlcyhsZW4oc2NoZWR1bGUpKQogICAgYWdlbnRzID0gWwogICAgICAgIGdlbmVyYXRlX2FnZW50KGkgKyAxLCBudW1fZXh0cmFzLCBiYXNlX2luZGljZXMpCiAgICAgICAgZm9yIGksIChudW1fZXh0cmFzLCBiYXNlX2luZGljZXMpIGluIGVudW1lcmF0ZSh6aXAoc2NoZWR1bGUsIGJhc2Vfcm93cykpCiAgICBdCgogICAgc2Vlbl9jb21ib3MgPSB7CiAgICAgICAgdHVwbGUoYVsidHJhaXRzIl1bbmFtZV0gZm9yIG5hbWUsIF8gaW4gQkFTRV9DQVRFR09SSUVTICsgT1BUSU9OQUxfQ0FURUdPUklFUykKICAgICAgICBmb3IgYSBpbiBhZ2VudHMKICAgIH0KICAgIGFzc2VydCBsZW4oc2Vlbl9jb21ib3MpID09IGxlbihhZ2VudHMpLCAiRHVwbGljYXRlIHRyYWl0IGNvbWJpbmF0aW9uIGdlbmVyYXRlZCIKCiAgICAjIOKUgOKUgCBPdXRwdXQg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACgogICAgb3MubWFrZWRpcnMoIm91dHB1dC9tZXRhZGF0YSIsIGV4aXN0X29rPVRydWUpCiAgICBvcy5tYWtlZGlycygib3V0cHV0L2ltYWdlcyIsIGV4aXN0X29rPVRydWUpCgogICAgIyBmdWxsX2NvbGxlY3Rpb24uanNvbgogICAgd2l0aCBvcGVuKCJvdXRwdXQvZnVsbF9jb2xsZWN0aW9uLmpzb24iLCAid2IiKSBhcyBmOgogICAgICAgIGYud3JpdGUob3Jqc29uLmR1bXBzKGFnZW50cywgb3B0aW9uPW9yanNvbi5PUFRfSU5ERU5UXzIpKQoKICAgICMgcHJvbXB0c19vbmx5LnR4dAogICAgd2l0aCBvcGVuKCJvdXRwdXQvcHJvbXB0c19vbmx5LnR4dCIsICJ3IikgYXMgZjoKICAgICAgICBmb3IgYWdlbnQgaW4gYWdlbnRzOgogICAgICAgICAgICBmLndyaXRlKGFnZW50WyJwcm9tcHQiXSArICJcbiIpCgogICAgIyBJbmRpdmlkdWFsIG1ldGFkYXRhIGZpbGVzOyBlYWNoIGlzIGFuIGluZGVwZW5kZW50IHNtYWxsIHdyaXRlLCBzbwogICAgIyBvdmVybGFwIHRoZW0gYWNyb3NzIHRocmVhZHMgcmF0aGVyIHRoYW4gd2FpdGluZyBvbiBlYWNoIGluIHR1cm4KICAgIHdpdGggVGhyZWFkUG9vbEV4ZWN1dG9yKG1heF93b3JrZXJzPTE2KSBhcyBleGVjdXRvcjoKICAgICAgICBsaXN0KGV4ZWN1dG9yLm1hcCh3cml0ZV9tZXRhZGF0YSwgYWdlbnRzKSkKCiAgICAjIOKUgOKUgCBTdW1tYXJ5IOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAoKICAgIHJhcml0eV9jb3VudHMgPSBDb3VudGVyKGFbInJhcml0eSJdIGZvciBhIGluIGFnZW50cykKICAgIGV4dHJhc19jb3VudHMgPSBDb3VudGVyKGFbIm51bV9leHRyYXMiXSBmb3IgYSBpbiBhZ2VudHMpCgogICAgcHJpbnQoIj0iICogNjApCiAgICBwcmludCgiQ0hJQkkgQUdFTlQgQ09MTEVDVElPTiDigJQgR0VORVJBVElPTiBDT01QTEVURSIpCiAgICBwcmludCgiPSIgKiA2MCkKICAgIHByaW50KGYiVG90YWwgYWdlbnRzIGdlbmVyYXRlZDoge2xlbihhZ2VudHMpfSIpCiAgICBwcmludChmIlVuaXF1ZSBjb21iaW5hdGlvbnMgdmVyaWZpZWQ6IHtsZW4oc2Vlbl9jb21ib3MpfSIpCiAgICBwcmludChmIlBvc3NpYmxlIGJhc2UgY29tYmluYXRpb25zOiB7VE9UQUxfQkFTRV9DT01CT1M6LH0iKQogICAgcHJpbnQoKQogICAgcHJpbnQoIlJBUklUWSBESVNUUklCVVRJT046IikKICAgIHByaW50KCItIiAqIDQwKQogICAgZm9yIGxhYmVsIGluIFsiQ29tbW9uIiwgIlVuY29tbW9uIiwgIlJhcmUiLCAiTGVnZW5kYXJ5Il06CiAgICAgICAgY291bnQgPSByYXJpdHlfY291bnRzLmdldChsYWJlbCwgMCkKICAgICAgICBwY3QgPSBjb3VudCAvIGxlbihhZ2VudHMpICogMTAwCiAgICAgICAgcHJpbnQoZiIgIHtsYWJlbDoxMnN9OiB7Y291bnQ6NWR9ICAoe3BjdDo1LjFmfSUpIikKICAgIHByaW50KCkKICAgIHByaW50KCJFWFRSQVMgQlJFQUtET1dOOiIpCiAgICBwcmludCgiLSIgKiA0MCkKICAgIGZvciBuIGluIHNvcnRlZChleHRyYXNfY291bnRzKToKICAgICAgICBjb3VudCA9IGV4dHJhc19jb3VudHNbbl0KICAgICAgICBwY3QgPSBjb3VudCAvIGxlbihhZ2VudHMpICogMTAwCiAgICAgICAgcHJpbnQoZiIgIHtufSBleHRyYXM6IHtjb3VudDo1ZH0gICh7cGN0OjUuMWZ9JSkiKQogICAgcHJpbnQoKQoKICAgICMgUHJpbnQgZmlyc3QgNSBwcm9tcHRzCiAgICBwcmludCgiRklSU1QgNSBQUk9NUFRTOiIpCiAgICBwcmludCgiPSIgKiA2MCkKICAgIGZvciBhZ2VudCBpbiBhZ2VudHNbOjVdOgogICAgICAgIHRpZCA9IGFnZW50WyJ0b2tlbl9pZCJdCiAgICAgICAgcHJpbnQoZiJcblsje3RpZDowNGR9XSBSYXJpdHk6IHthZ2VudFsncmFyaXR5J119ICh7YWdlbnRbJ251bV9leHRyYXMnXX0gZXh0cmFzKSIpCiAgICAgICAgcHJpbnQoZiIgIHthZ2VudFsncHJvbXB0J119IikKICAgIHByaW50KCkKCiAgICAjIFRyYWl0IGZyZXF1ZW5jeSBzdGF0cwogICAgcHJpbnQoIlRSQUlUIEZSRVFVRU5DWSBISUdITElHSFRTOiIpCiAgICBwcmludCgiLSIgKiA0MCkKICAgIGZvciB0cmFpdF9uYW1lIGluIFsiYWNjZXNzb3J5IiwgInRhdHRvbyIsICJwaWVyY2luZyIsICJmcmVja2xlcyJdOgogICAgICAgIGhhc19pdCA9IHN1bSgxIGZvciBhIGluIGFnZW50cyBpZiBhWyJ0cmFpdHMiXS5nZXQodHJhaXRfbmFtZSkpCiAgICAgICAgcGN0ID0gaGFzX2l0IC8gbGVuKGFnZW50cykgKiAxMDAKICAgICAgICBwcmludChmIiAge3RyYWl0X25hbWU6MTJzfToge2hhc19pdDo1ZH0gYWdlbnRzIGhhdmUgb25lICh7cGN0OjUuMWZ9JSkiKQoKCmlmIF9fbmFtZV9fID09ICJfX21haW5fXyI6CiAgICBtYWluKCkK",
+    "generate_images.py": "IyEvdXNyL2Jpbi9lbnYgcHl0aG9uMwoiIiIKR2VuZXJhdGUgTkZUIGltYWdlcyB2aWEgZmFsLmFpIHF1ZXVlIEFQSS4KClVzYWdlOgogICAgcHl0aG9uIGdlbmVyYXRlX2ltYWdlcy5weSAgICAgICAgICAgICAgICAgICAgIyBnZW5lcmF0ZSBhbGwgMjAwMAogICAgcHl0aG9uIGdlbmVyYXRlX2ltYWdlcy5weSAtLXN0YXJ0IDEgLS1lbmQgMjAgIyBnZW5lcmF0ZSAjMDAwMS0jMDAyMAogICAgcHl0aG9uIGdlbmVyYXRlX2ltYWdlcy5weSAtLXN0YXJ0IDUwIC0tZW5kIDUwICMgZ2VuZXJhdGUganVzdCAjMDA1MAogICAgcHl0aG9uIGdlbmVyYXRlX2ltYWdlcy5weSAtLXJlZG8gMywxNyw0MiAgICAgICMgcmVkbyBzcGVjaWZpYyB0b2tlbiBJRHMKIiIiCgppbXBvcnQgYXJncGFyc2UKaW1wb3J0IGFzeW5jaW8KaW1wb3J0IGNvbnRleHRsaWIKaW1wb3J0IGpzb24KaW1wb3J0IG9zCmltcG9ydCByYW5kb20KaW1wb3J0IHN5cwppbXBvcnQgdGltZQoKaW1wb3J0IGFpb2ZpbGVzCmltcG9ydCBhaW9odHRwCmltcG9ydCBvcmpzb24KCiMg4pSA4pSAIENvbmZpZyDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKCkZBTF9LRVkgPSBvcy5lbnZpcm9uLmdldCgiRkFMX0tFWSIsICIiKQpNT0RFTF9JRCA9ICJmYWwtYWkvbmFuby1iYW5hbmEiClFVRVVFX1VSTCA9IGYiaHR0cHM6Ly9xdWV1ZS5mYWwucnVuL3tNT0RFTF9JRH0iCkNPTExFQ1RJT05fUEFUSCA9ICJvdXRwdXQvZnVsbF9jb2xsZWN0aW9uLmpzb24iCklNQUdFU19ESVIgPSAib3V0cHV0L2ltYWdlcyIKUkVRVUVTVFNfUEVSX1NFQ09ORCA9IDEwLjAgICAgIyBjZWlsaW5nIG9uIGNhbGxzIHRvIHRoZSBxdWV1ZSBob3N0ClJBVEVfTElNSVRfV0lORE9XID0gNjAuMCAgICAgICMgc2Vjb25kcyB0aGF0IFgtUmF0ZUxpbWl0LUxpbWl0IGlzIGNvdW50ZWQgb3ZlcgpSQVRFX0xJTUlUX0xPV19XQVRFUiA9IDIgICAgICAjIHBhdXNlIHVudGlsIHJlc2V0IGJlbG93IHRoaXMgbWFueSByZW1haW5pbmcKUE9MTF9JTlRFUlZBTCA9IDIuMCAgICAgICAgICAgIyBzZWNvbmRzIGJldHdlZW4gc3RhdHVzIHBvbGxzIChzdHJlYW0gZmFsbGJhY2spCk1BWF9XQUlUID0gMzAwLjAgICAgICAgICAgICAgICMgbWF4IHNlY29uZHMgcGVyIGltYWdlIHRvIGZpbmlzaCwgc3RyZWFtICsgcG9sbHMgKH41IG1pbikKU1RSRUFNX1JFQURfVElNRU9VVCA9IDYwLjAgICAgIyBtYXggc2Vjb25kcyBvZiBzaWxlbmNlIG9uIHRoZSBzdGF0dXMgc3RyZWFtCk1BWF9SRVRSSUVTID0gMyAgICAgICAgICAgICAgICMgcmV0cmllcyBvbiBmYWlsdXJlIHBlciBpbWFnZQpNQVhfQkFDS09GRiA9IDYwLjAgICAgICAgICAgICAjIGNhcCBvbiBzZWNvbmRzIGJldHdlZW4gcmV0cmllcwpSRVRSWUFCTEVfU1RBVFVTRVMgPSB7NDA4LCA0Mjl9ICAjIHBsdXMgYW55IDV4eDsgb3RoZXIgZXJyb3JzIGFyZSBmYXRhbApDT05DVVJSRU5DWSA9IDE2ICAgICAgICAgICAgICAjIGltYWdlcyBpbiBmbGlnaHQgYXQgb25jZQpDT05ORUNUSU9OX0hFQURST09NID0gOCAgICAgICAjIHNwYXJlIHBvb2xlZCBjb25uZWN0aW9ucyBiZXlvbmQgb25lIHBlciB3b3JrZXIKRE9XTkxPQURfQ0hVTktfU0laRSA9IDY1NTM2ICAgIyBieXRlcyB3cml0dGVuIHBlciBjaHVuayB3aGVuIHNhdmluZyBpbWFnZXMKUE5HX1NJR05BVFVSRSA9IGIiXHg4OVBOR1xyXG5ceDFhXG4iClBOR19UUkFJTEVSID0gYiJceDAwXHgwMFx4MDBceDAwSUVORFx4YWVCYFx4ODIiICAjIGVtcHR5IElFTkQgY2h1bmsgZW5kaW5nIGV2ZXJ5IFBORwoKQVBJX1RJTUVPVVQgPSBhaW9odHRwLkNsaWVudFRpbWVvdXQodG90YWw9MzApCkRPV05MT0FEX1RJTUVPVVQgPSBhaW9odHRwLkNsaWVudFRpbWVvdXQodG90YWw9MTIwKQoKIyBDbGVhcmVkIHRoZSBmaXJzdCB0aW1lIHRoZSBxdWV1ZSByZWplY3RzIHRoZSBzdGF0dXMgc3RyZWFtIGVuZHBvaW50LCBzbyBsYXRlcgojIGltYWdlcyBnbyBzdHJhaWdodCB0byBwb2xsaW5nIGluc3RlYWQgb2Ygc3BlbmRpbmcgYSByZXF1ZXN0IG9uIGl0LgpzdGF0dXNfc3RyZWFtX2F2YWlsYWJsZSA9IFRydWUKCiMg4pSA4pSAIFJhdGUgbGltaXRpbmcg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACgpjbGFzcyBSYXRlTGltaXRlcjoKICAgICIiIlRva2VuIGJ1Y2tldCBzaGFyZWQgYnkgZXZlcnkgd29ya2VyIHRhbGtpbmcgdG8gdGhlIHF1ZXVlIGhvc3QuCgogICAgUmVmaWxscyBhdCBgcmF0ZWAgdG9rZW5zIHBlciBzZWNvbmQuIFJlc3BvbnNlcyBmZWVkIHRoZWlyIFgtUmF0ZUxpbWl0LSoKICAgIGhlYWRlcnMgYmFjayBpbiB2aWEgdXBkYXRlKCksIHdoaWNoIGNhbiBsb3dlciB0aGUgcmF0ZSBvciBwYXVzZSBkaXNwYXRjaAogICAgdW50aWwgdGhlIHNlcnZlcidzIHdpbmRvdyByZXNldHMuCiAgICAiIiIKCiAgICBkZWYgX19pbml0X18oc2VsZiwgcmF0ZTogZmxvYXQsIGJ1cnN0OiBpbnQgPSAxKToKICAgICAgICBzZWxmLm1heF9yYXRlID0gcmF0ZQogICAgICAgIHNlbGYucmF0ZSA9IHJhdGUKICAgICAgICBzZWxmLmNhcGFjaXR5ID0gYnVyc3QKICAgICAgICBzZWxmLnRva2VucyA9IGZsb2F0KGJ1cnN0KQogICAgICAgIHNlbGYubGFzdF9yZWZpbGwgPSB0aW1lLm1vbm90b25pYygpCiAgICAgICAgc2VsZi5wYXVzZWRfdW50aWwgPSAwLjAKICAgICAgICBzZWxmLl9sb2NrID0gYXN5bmNpby5Mb2NrKCkKCiAgICBhc3luYyBkZWYgYWNxdWlyZShzZWxmKToKICAgICAgICAiIiJXYWl0IHVudGlsIGEgcmVxdWVzdCBtYXkgYmUgc2VudCwgdGhlbiBjb25zdW1lIGEgdG9rZW4uIiIiCiAgICAgICAgYXN5bmMgd2l0aCBzZWxmLl9sb2NrOgogICAgICAgICAgICB3aGlsZSBUcnVlOgogICAgICAgICAgICAgICAgbm93ID0gdGltZS5tb25vdG9uaWMoKQogICAgICAgICAgICAgICAgc2VsZi50b2tlbnMgPSBtaW4oc2VsZi5jYXBhY2l0eSwgc2VsZi50b2tlbnMgKyAobm93IC0gc2VsZi5sYXN0X3JlZmlsbCkgKiBzZWxmLnJhdGUpCiAgICAgICAgICAgICAgICBzZWxmLmxhc3RfcmVmaWxsID0gbm93CiAgICAgICAgICAgICAgICBpZiBub3cgPCBzZWxmLnBhdXNlZF91bnRpbDoKICAgICAgICAgICAgICAgICAgICB3YWl0ID0gc2VsZi5wYXVzZWRfdW50aWwgLSBub3cKICAgICAgICAgICAgICAgIGVsaWYgc2VsZi50b2tlbnMgPj0gMToKICAgICAgICAgICAgICAgICAgICBzZWxmLnRva2VucyAtPSAxCiAgICAgICAgICAgICAgICAgICAgcmV0dXJuCiAgICAgICAgICAgICAgICBlbHNlOgogICAgICAgICAgICAgICAgICAgIHdhaXQgPSAoMSAtIHNlbGYudG9rZW5zKSAvIHNlbGYucmF0ZQogICAgICAgICAgICAgICAgYXdhaXQgYXN5bmNpby5zbGVlcCh3YWl0KQoKICAgIGRlZiB1cGRhdGUoc2VsZiwgaGVhZGVycyk6CiAgICAgICAgIiIiQWRqdXN0IHRvIHRoZSBzZXJ2ZXIncyBhZHZlcnRpc2VkIGxpbWl0cywgaWYgaXQgc2VudCBhbnkuIiIiCiAgICAgICAgdHJ5OgogICAgICAgICAgICBsaW1pdCA9IGhlYWRlcnMuZ2V0KCJYLVJhdGVMaW1pdC1MaW1pdCIpCiAgICAgICAgICAgIGlmIGxpbWl0IGlzIG5vdCBOb25lOgogICAgICAgICAgICAgICAgc2VsZi5yYXRlID0gbWluKHNlbGYubWF4X3JhdGUsIG1heChmbG9hdChsaW1pdCksIDEuMCkgLyBSQVRFX0xJTUlUX1dJTkRPVykKCiAgICAgICAgICAgIHJlbWFpbmluZyA9IGhlYWRlcnMuZ2V0KCJYLVJhdGVMaW1pdC1SZW1haW5pbmciKQogICAgICAgICAgICByZXNldCA9IGhlYWRlcnMuZ2V0KCJYLVJhdGVMaW1pdC1SZXNldCIpCiAgICAgICAgICAgIGlmIHJlbWFpbmluZyBpcyBub3QgTm9uZSBhbmQgcmVzZXQgaXMgbm90IE5vbmUgYW5kIGZsb2F0KHJlbWFpbmluZykgPCBSQVRFX0xJTUlUX0xPV19XQVRFUjoKICAgICAgICAgICAgICAgIHJlc2V0ID0gZmxvYXQocmVzZXQpCiAgICAgICAgICAgICAgICAjIEVpdGhlciBzZWNvbmRzIHVudGlsIHJlc2V0IG9yIGFuIGFic29sdXRlIGVwb2NoIHRpbWVzdGFtcAogICAgICAgICAgICAgICAgZGVsYXkgPSByZXNldCAtIHRpbWUudGltZSgpIGlmIHJlc2V0ID4gMWU5IGVsc2UgcmVzZXQKICAgICAgICAgICAgICAgIGRlbGF5ID0gbWluKG1heChkZWxheSwgMC4wKSwgTUFYX0JBQ0tPRkYpCiAgICAgICAgICAgICAgICBzZWxmLnBhdXNlZF91bnRpbCA9IG1heChzZWxmLnBhdXNlZF91bnRpbCwgdGltZS5tb25vdG9uaWMoKSArIGRlbGF5KQogICAgICAgIGV4Y2VwdCBWYWx1ZUVycm9yOgogICAgICAgICAgICBwYXNzICAjIG1hbGZvcm1lZCBoZWFkZXI7IGtlZXAgdGhlIGN1cnJlbnQgc2V0dGluZ3MKCgojIOKUgOKUgCBIZWxwZXJzIOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgOKUgAoKIyBCdWlsdCBvbmNlIGFuZCBzaGFyZWQgYnkgZXZlcnkgcmVxdWVzdC4gSW1hZ2UgZG93bmxvYWRzIGdvIHRvIHRoZSBDRE4gYW5kCiMgZGVsaWJlcmF0ZWx5IGNhcnJ5IG5vIGtleS4KQVVUSF9IRUFERVJTID0geyJBdXRob3JpemF0aW9uIjogZiJLZXkge0ZBTF9LRVl9In0KSlNPTl9IRUFERVJTID0geyoqQVVUSF9IRUFERVJTLCAiQ29udGVudC1UeXBlIjogImFwcGxpY2F0aW9uL2pzb24ifQoKIyBSZXF1ZXN0IGZpZWxkcyB0aGF0IGFyZSB0aGUgc2FtZSBmb3IgZXZlcnkgaW1hZ2U7IG9ubHkgdGhlIHByb21wdCB2YXJpZXMKUEFZTE9BRF9CQVNFID0gewogICAgImFzcGVjdF9yYXRpbyI6ICIxOjEiLAogICAgIm91dHB1dF9mb3JtYXQiOiAicG5nIiwKICAgICJudW1faW1hZ2VzIjogMSwKfQoKCkBjb250ZXh0bGliLmFzeW5jY29udGV4dG1hbmFnZXIKYXN5bmMgZGVmIHF1ZXVlX2NhbGwoCiAgICBzZXNzaW9uOiBhaW9odHRwLkNsaWVudFNlc3Npb24sCiAgICBsaW1pdGVyOiBSYXRlTGltaXRlciwKICAgIG1ldGhvZDogc3RyLAogICAgdXJsOiBzdHIsCiAgICBoZWFkZXJzOiBkaWN0ID0gQVVUSF9IRUFERVJTLAogICAgKiprd2FyZ3MsCik6CiAgICAiIiJNYWtlIGEgcmF0ZS1saW1pdGVkLCBhdXRoZW50aWNhdGVkIGNhbGwgdG8gdGhlIHF1ZXVlIGhvc3QuIiIiCiAgICBhd2FpdCBsaW1pdGVyLmFjcXVpcmUoKQogICAgYXN5bmMgd2l0aCBzZXNzaW9uLnJlcXVlc3QobWV0aG9kLCB1cmwsIGhlYWRlcnM9aGVhZGVycywgKiprd2FyZ3MpIGFzIHJlc3A6CiAgICAgICAgbGltaXRlci51cGRhdGUocmVzcC5oZWFkZXJzKQogICAgICAgIHJlc3AucmFpc2VfZm9yX3N0YXR1cygpCiAgICAgICAgeWllbGQgcmVzcAoKCmFzeW5jIGRlZiBzdWJtaXRfcmVxdWVzdChzZXNzaW9uOiBhaW9odHRwLkNsaWVudFNlc3Npb24sIGxpbWl0ZXI6IFJhdGVMaW1pdGVyLCBwcm9tcHQ6IHN0cikgLT4gZGljdDoKICAgICIiIlN1Ym1pdCBhbiBpbWFnZSBnZW5lcmF0aW9uIHJlcXVlc3QgdG8gdGhlIGZhbC5haSBxdWV1ZS4iIiIKICAgIHBheWxvYWQgPSBvcmpzb24uZHVtcHMoeyoqUEFZTE9BRF9CQVNFLCAicHJvbXB0IjogcHJvbXB0fSkKICAgIGFzeW5jIHdpdGggcXVldWVfY2FsbCgKICAgICAgICBzZXNzaW9uLAogICAgICAgIGxpbWl0ZXIsCiAgICAgICAgIlBPU1QiLAogICAgICAgIFFVRVVFX1VSTCwKICAgICAgICBoZWFkZXJzPUpTT05fSEVBREVSUywKICAgICAgICBkYXRhPXBheWxvYWQsCiAgICAgICAgdGltZW91dD1BUElfVElNRU9VVCwKICAgICkgYXMgcmVzcDoKICAgICAgICByZXR1cm4gb3Jqc29uLmxvYWRzKGF3YWl0IHJlc3AucmVhZCgpKQoKCmRlZiBjaGVja19zdGF0dXMoZGF0YTogZGljdCkgLT4gYm9vbDoKICAgICIiIlJldHVybiBUcnVlIGlmIGEgcXVldWUgc3RhdHVzIHBheWxvYWQgaXMgQ09NUExFVEVELCByYWlzZSBpZiBpdCBmYWlsZWQuIiIiCiAgICBzdGF0dXMgPSBkYXRhLmdldCgic3RhdHVzIiwgIlVOS05PV04iKQogICAgaWYgc3RhdHVzIGluICgiRkFJTEVEIiwgIkNBTkNFTExFRCIpOgogICAgICAgIGVycm9yX21zZyA9IGRhdGEuZ2V0KCJlcnJvciIsICJVbmtub3duIGVycm9yIikKICAgICAgICByYWlzZSBSdW50aW1lRXJyb3IoZiJSZXF1ZXN0IHtzdGF0dXN9OiB7ZXJyb3JfbXNnfSIpCiAgICByZXR1cm4gc3RhdHVzID09ICJDT01QTEVURUQiCgoKYXN5bmMgZGVmIHN0cmVhbV9zdGF0dXMoCiAgICBzZXNzaW9uOiBhaW9odHRwLkNsaWVudFNlc3Npb24sCiAgICBsaW1pdGVyOiBSYXRlTGltaXRlciwKICAgIHN0YXR1c191cmw6IHN0ciwKICAgIHRpbWVvdXQ6IGZsb2F0LAopIC0+IGJvb2w6CiAgICAiIiJGb2xsb3cgdGhlIHF1ZXVlJ3Mgc2VydmVyLXNlbnQgc3RhdHVzIHN0cmVhbSBmb3IgdXAgdG8gYHRpbWVvdXRgIHNlY29uZHMuCiAgICBSZXR1cm5zIFRydWUgb25jZSBDT01QTEVURUQsIEZhbHNlIGlmIHRoZSBzdHJlYW0gY2xvc2VkIGJlZm9yZSBhIGZpbmFsCiAgICBzdGF0dXMgYXJyaXZlZC4iIiIKICAgIGFzeW5jIHdpdGggcXVldWVfY2FsbCgKICAgICAgICBzZXNzaW9uLAogICAgICAgIGxpbWl0ZXIsCiAgICAgICAgIkdFVCIsCiAgICAgICAgZiJ7c3RhdHVzX3VybH0vc3RyZWFtIiwKICAgICAgICBwYXJhbXM9eyJsb2dzIjogMH0sCiAgICAgICAgdGltZW91dD1haW9odHRwLkNsaWVudFRpbWVvdXQodG90YWw9dGltZW91dCwgc29ja19yZWFkPVNUUkVBTV9SRUFEX1RJTUVPVVQpLAogICAgKSBhcyByZXNwOgogICAgICAgIGFzeW5jIGZvciBsaW5lIGluIHJlc3AuY29udGVudDoKICAgICAgICAgICAgbGluZSA9IGxpbmUuc3RyaXAoKQogICAgICAgICAgICBpZiBsaW5lLnN0YXJ0c3dpdGgoYiJkYXRhOiIpIGFuZCBjaGVja19zdGF0dXMob3Jqc29uLmxvYWRzKGxpbmVbNTpdKSk6CiAgICAgICAgICAgICAgICByZXR1cm4gVHJ1ZQogICAgcmV0dXJuIEZhbHNlCgoKYXN5bmMgZGVmIHBvbGxfdW50aWxfZG9uZShzZXNzaW9uOiBhaW9odHRwLkNsaWVudFNlc3Npb24sIGxpbWl0ZXI6IFJhdGVMaW1pdGVyLCBzdGF0dXNfdXJsOiBzdHIpIC0+IHN0cjoKICAgICIiIldhaXQgdXAgdG8gTUFYX1dBSVQgc2Vjb25kcyBmb3IgdGhlIHJlcXVlc3QgdG8gY29tcGxldGUuIFJldHVybnMgdGhlCiAgICByZXNwb25zZSBVUkwgc3RhdHVzLgoKICAgIFRoZSBzdGF0dXMgc3RyZWFtIGhvbGRzIG9uZSBjb25uZWN0aW9uIG9wZW4gYW5kIGlzIHB1c2hlZCBldmVyeSBzdGF0dXMKICAgIGNoYW5nZSwgc28gYSB0eXBpY2FsIGltYWdlIGNvc3RzIG9uZSByZXF1ZXN0IGluc3RlYWQgb2YgfjE1IHBvbGxzLiBJZiB0aGUKICAgIHN0cmVhbSBpcyB1bmF2YWlsYWJsZSBvciBkcm9wcyBlYXJseSwgZmFsbCBiYWNrIHRvIGludGVydmFsIHBvbGxpbmcgZm9yCiAgICB3aGF0ZXZlciBpcyBsZWZ0IG9mIHRoZSBzYW1lIGRlYWRsaW5lLgogICAgIiIiCiAgICBnbG9iYWwgc3RhdHVzX3N0cmVhbV9hdmFpbGFibGUKCiAgICBsb29wID0gYXN5bmNpby5nZXRfcnVubmluZ19sb29wKCkKICAgIGRlYWRsaW5lID0gbG9vcC50aW1lKCkgKyBNQVhfV0FJVAoKICAgIGlmIHN0YXR1c19zdHJlYW1fYXZhaWxhYmxlOgogICAgICAgIHRyeToKICAgICAgICAgICAgaWYgYXdhaXQgc3RyZWFtX3N0YXR1cyhzZXNzaW9uLCBsaW1pdGVyLCBzdGF0dXNfdXJsLCBNQVhfV0FJVCk6CiAgICAgICAgICAgICAgICByZXR1cm4gIkNPTVBMRVRFRCIKICAgICAgICBleGNlcHQgKGFpb2h0dHAuQ2xpZW50RXJyb3IsIGFzeW5jaW8uVGltZW91dEVycm9yLCBWYWx1ZUVycm9yKSBhcyBlOgogICAgICAgICAgICBpZiAoCiAgICAgICAgICAgICAgICBpc2luc3RhbmNlKGUsIGFpb2h0dHAuQ2xpZW50UmVzcG9uc2VFcnJvcikKICAgICAgICAgICAgICAgIGFuZCA0MDAgPD0gZS5zdGF0dXMgPCA1MDAKICAgICAgICAgICAgICAgIGFuZCBlLnN0YXR1cyBub3QgaW4gUkVUUllBQkxFX1NUQVRVU0VTCiAgICAgICAgICAgICk6CiAgICAgICAgICAgICAgICBpZiBzdGF0dXNfc3RyZWFtX2F2YWlsYWJsZToKICAgICAgICAgICAgICAgICAgICBzdGF0dXNfc3RyZWFtX2F2YWlsYWJsZSA9IEZhbHNlCiAgICAgICAgICAgICAgICAgICAgcHJpbnQoZiIgICAgWyFdIFN0YXR1cyBzdHJlYW0gdW5hdmFpbGFibGUgKHtlfSksIHBvbGxpbmcgZnJvbSBub3cgb24iKQogICAgICAgICAgICBlbGlmIGxvb3AudGltZSgpIDwgZGVhZGxpbmU6CiAgICAgICAgICAgICAgICBwcmludChmIiAgICBbIV0gU3RhdHVzIHN0cmVhbSBpbnRlcnJ1cHRlZCAoe2V9KSwgcG9sbGluZyBpbnN0ZWFkIikKCiAgICB3aGlsZSBsb29wLnRpbWUoKSA8IGRlYWRsaW5lOgogICAgICAgIGFzeW5jIHdpdGggcXVldWVfY2FsbCgKICAgICAgICAgICAgc2Vzc2lvbiwKICAgICAgICAgICAgbGltaXRlciwKICAgICAgICAgICAgIkdFVCIsCiAgICAgICAgICAgIHN0YXR1c191cmwsCiAgICAgICAgICAgIHBhcmFtcz17ImxvZ3MiOiAwfSwKICAgICAgICAgICAgdGltZW91dD1BUElfVElNRU9VVCwKICAgICAgICApIGFzIHJlc3A6CiAgICAgICAgICAgIGRhdGEgPSBvcmpzb24ubG9hZHMoYXdhaXQgcmVzcC5yZWFkKCkpCgogICAgICAgIGlmIGNoZWNrX3N0YXR1cyhkYXRhKToKICAgICAgICAgICAgcmV0dXJuICJDT01QTEVURUQiCgogICAgICAgIGF3YWl0IGFzeW5jaW8uc2xlZXAoUE9MTF9JTlRFUlZBTCkKCiAgICByYWlzZSBUaW1lb3V0RXJyb3IoZiJSZXF1ZXN0IGRpZCBub3QgY29tcGxldGUgd2l0aGluIHtNQVhfV0FJVDouMGZ9cyIpCgoKYXN5bmMgZGVmIGZldGNoX3Jlc3VsdChzZXNzaW9uOiBhaW9odHRwLkNsaWVudFNlc3Npb24sIGxpbWl0ZXI6IFJhdGVMaW1pdGVyLCByZXNwb25zZV91cmw6IHN0cikgLT4gZGljdDoKICAgICIiIkZldGNoIHRoZSBmaW5hbCByZXN1bHQgZnJvbSB0aGUgcXVldWUuIiIiCiAgICBhc3luYyB3aXRoIHF1ZXVlX2NhbGwoc2Vzc2lvbiwgbGltaXRlciwgIkdFVCIsIHJlc3BvbnNlX3VybCwgdGltZW91dD1BUElfVElNRU9VVCkgYXMgcmVzcDoKICAgICAgICByZXR1cm4gb3Jqc29uLmxvYWRzKGF3YWl0IHJlc3AucmVhZCgpKQoKCmFzeW5jIGRlZiBkb3dubG9hZF9pbWFnZShzZXNzaW9uOiBhaW9odHRwLkNsaWVudFNlc3Npb24sIGltYWdlX3VybDogc3RyLCBkZXN0X3BhdGg6IHN0cik6CiAgICAiIiJEb3dubG9hZCBhbiBpbWFnZSBmcm9tIFVSTCB0byBsb2NhbCBmaWxlLgoKICAgIFdyaXRlcyB0byBhIC5wYXJ0IGZpbGUgYW5kIHJlbmFtZXMgaXQgaW50byBwbGFjZSBvbmx5IG9uY2UgY29tcGxldGUsIHNvIGFuCiAgICBpbnRlcnJ1cHRlZCBkb3dubG9hZCBuZXZlciBsZWF2ZXMgYSB0cnVuY2F0ZWQgUE5HIHVuZGVyIHRoZSBmaW5hbCBuYW1lLgogICAgIiIiCiAgICB0bXBfcGF0aCA9IGRlc3RfcGF0aCArICIucGFydCIKICAgIHRyeToKICAgICAgICBhc3luYyB3aXRoIHNlc3Npb24uZ2V0KGltYWdlX3VybCwgdGltZW91dD1ET1dOTE9BRF9USU1FT1VUKSBhcyByZXNwOgogICAgICAgICAgICByZXNwLnJhaXNlX2Zvcl9zdGF0dXMoKQogICAgICAgICAgICAjIFN0cmVhbSB0byBkaXNrIHNvIG1lbW9yeSBzdGF5cyBhdCBvbmUgY2h1bmsgcGVyIGluLWZsaWdodCBkb3dubG9hZAogICAgICAgICAgICBhc3luYyB3aXRoIGFpb2ZpbGVzLm9wZW4odG1wX3BhdGgsICJ3YiIpIGFzIGY6CiAgICAgICAgICAgICAgICBhc3luYyBmb3IgY2h1bmsgaW4gcmVzcC5jb250ZW50Lml0ZXJfY2h1bmtlZChET1dOTE9BRF9DSFVOS19TSVpFKToKICAgICAgICAgICAgICAgICAgICBhd2FpdCBmLndyaXRlKGNodW5rKQogICAgICAgIG9zLnJlcGxhY2UodG1wX3BhdGgsIGRlc3RfcGF0aCkKICAgIGV4Y2VwdCBCYXNlRXhjZXB0aW9uOgogICAgICAgIHdpdGggY29udGV4dGxpYi5zdXBwcmVzcyhGaWxlTm90Rm91bmRFcnJvcik6CiAgICAgICAgICAgIG9zLnVubGluayh0bXBfcGF0aCkKICAgICAgICByYWlzZQoKCmRlZiBpc19jb21wbGV0ZV9pbWFnZShwYXRoOiBzdHIpIC0+IGJvb2w6CiAgICAiIiJUcnVlIGlmIHBhdGggaXMgYSB3aG9sZSBQTkc6IGl0IHN0YXJ0cyB3aXRoIHRoZSBzaWduYXR1cmUgYW5kIGVuZHMgd2l0aAogICAgdGhlIElFTkQgY2h1bmssIHNvIGEgdHJ1bmNhdGVkIGRvd25sb2FkIGlzIG5vdCBtaXN0YWtlbiBmb3IgYSBmaW5pc2hlZCBvbmUuIiIiCiAgICB0cnk6CiAgICAgICAgd2l0aCBvcGVuKHBhdGgsICJyYiIpIGFzIGY6CiAgICAgICAgICAgIGlmIGYucmVhZChsZW4oUE5HX1NJR05BVFVSRSkpICE9IFBOR19TSUdOQVRVUkU6CiAgICAgICAgICAgICAgICByZXR1cm4gRmFsc2UKICAgICAgICAgICAgZi5zZWVrKC1sZW4oUE5HX1RSQUlMRVIpLCBvcy5TRUVLX0VORCkKICAgICAgICAgICAgcmV0dXJuIGYucmVhZCgpID09IFBOR19UUkFJTEVSCiAgICBleGNlcHQgT1NFcnJvcjoKICAgICAgICByZXR1cm4gRmFsc2UKCgpkZWYgaXNfcmV0cnlhYmxlKGVycm9yOiBFeGNlcHRpb24pIC0+IGJvb2w6CiAgICAiIiJPbmx5IHRocm90dGxpbmcsIHNlcnZlciBlcnJvcnMsIHRpbWVvdXRzIGFuZCBkcm9wcGVkIGNvbm5lY3Rpb25zIChpbmNsdWRpbmcKICAgIGEgYm9keSBjdXQgb2ZmIG1pZC1kb3dubG9hZCkgYXJlIHdvcnRoIHJldHJ5aW5nLiBBbnl0aGluZyBlbHNlIChhIDR4eCwgYQogICAgRkFJTEVEIGdlbmVyYXRpb24sIGEgbWFsZm9ybWVkIHJlc3BvbnNlKSBpcyBsaWtlbHkgdG8gZmFpbCB0aGUgc2FtZSB3YXkKICAgIGFnYWluLiIiIgogICAgaWYgaXNpbnN0YW5jZShlcnJvciwgYWlvaHR0cC5DbGllbnRSZXNwb25zZUVycm9yKToKICAgICAgICByZXR1cm4gZXJyb3Iuc3RhdHVzIGluIFJFVFJZQUJMRV9TVEFUVVNFUyBvciBlcnJvci5zdGF0dXMgPj0gNTAwCiAgICByZXR1cm4gaXNpbnN0YW5jZSgKICAgICAgICBlcnJvciwKICAgICAgICAoYWlvaHR0cC5DbGllbnRDb25uZWN0aW9uRXJyb3IsIGFpb2h0dHAuQ2xpZW50UGF5bG9hZEVycm9yLCBhc3luY2lvLlRpbWVvdXRFcnJvciwgVGltZW91dEVycm9yKSwKICAgICkKCgpkZWYgcmV0cnlfZGVsYXkocmV0cnk6IGludCwgZXJyb3I6IEV4Y2VwdGlvbikgLT4gZmxvYXQ6CiAgICAiIiJFeHBvbmVudGlhbCBiYWNrb2ZmIHdpdGggZXF1YWwgaml0dGVyLCBob25vcmluZyBSZXRyeS1BZnRlciBvbiBhIDQyOS4iIiIKICAgIGlmIGlzaW5zdGFuY2UoZXJyb3IsIGFpb2h0dHAuQ2xpZW50UmVzcG9uc2VFcnJvcikgYW5kIGVycm9yLnN0YXR1cyA9PSA0MjkgYW5kIGVycm9yLmhlYWRlcnM6CiAgICAgICAgdHJ5OgogICAgICAgICAgICByZXR1cm4gbWluKE1BWF9CQUNLT0ZGLCBmbG9hdChlcnJvci5oZWFkZXJzLmdldCgiUmV0cnktQWZ0ZXIiKSkpCiAgICAgICAgZXhjZXB0IChUeXBlRXJyb3IsIFZhbHVlRXJyb3IpOgogICAgICAgICAgICBwYXNzICAjIG1pc3Npbmcgb3IgYW4gSFRUUC1kYXRlOyB1c2UgdGhlIG5vcm1hbCBiYWNrb2ZmCiAgICByZXR1cm4gbWluKE1BWF9CQUNLT0ZGLCAyICoqIHJldHJ5ICsgcmFuZG9tLnVuaWZvcm0oMCwgMSkpCgoKZGVmIHNjYW5fY29tcGxldGVkX2ltYWdlcyh3YW50ZWQ6IHNldCkgLT4gc2V0OgogICAgIiIiUmV0dXJuIHRoZSBmaWxlbmFtZXMgZnJvbSBgd2FudGVkYCB0aGF0IGFyZSBmaW5pc2hlZCBQTkdzIGluIElNQUdFU19ESVIuCgogICAgT25lIGRpcmVjdG9yeSBzY2FuIHJlcGxhY2VzIGEgcGFpciBvZiBzdGF0IGNhbGxzIHBlciB0b2tlbjsgb25seSB3YW50ZWQKICAgIGZpbGVzIHRoYXQgYWN0dWFsbHkgZXhpc3QgYXJlIG9wZW5lZCB0byBjaGVjayB0aGVpciBjb250ZW50cy4KICAgICIiIgogICAgdHJ5OgogICAgICAgIHdpdGggb3Muc2NhbmRpcihJTUFHRVNfRElSKSBhcyBpdDoKICAgICAgICAgICAgcmV0dXJuIHsKICAgICAgICAgICAgICAgIGVudHJ5Lm5hbWUKICAgICAgICAgICAgICAgIGZvciBlbnRyeSBpbiBpdAogICAgICAgICAgICAgICAgaWYgZW50cnkubmFtZSBpbiB3YW50ZWQgYW5kIGVudHJ5LmlzX2ZpbGUoKSBhbmQgaXNfY29tcGxldGVfaW1hZ2UoZW50cnkucGF0aCkKICAgICAgICAgICAgfQogICAgZXhjZXB0IEZpbGVOb3RGb3VuZEVycm9yOgogICAgICAgIHJldHVybiBzZXQoKQoKCmFzeW5jIGRlZiBnZW5lcmF0ZV9zaW5nbGUoCiAgICBzZXNzaW9uOiBhaW9odHRwLkNsaWVudFNlc3Npb24sCiAgICBzZW06IGFzeW5jaW8uU2VtYXBob3JlLAogICAgbGltaXRlcjogUmF0ZUxpbWl0ZXIsCiAgICB0b2tlbl9pZDogaW50LAogICAgcHJvbXB0OiBzdHIsCikgLT4gYm9vbDoKICAgICIiIkdlbmVyYXRlIGEgc2luZ2xlIGltYWdlLiBSZXR1cm5zIFRydWUgb24gc3VjY2VzcywgRmFsc2Ugb24gZmFpbHVyZS4iIiIKICAgIGZpbGVuYW1lID0gZiJ7dG9rZW5faWQ6MDRkfS5wbmciCiAgICBkZXN0X3BhdGggPSBvcy5wYXRoLmpvaW4oSU1BR0VTX0RJUiwgZmlsZW5hbWUpCgogICAgYXN5bmMgd2l0aCBzZW06CiAgICAgICAgZm9yIHJldHJ5IGluIHJhbmdlKE1BWF9SRVRSSUVTKToKICAgICAgICAgICAgdHJ5OgogICAgICAgICAgICAgICAgIyBTdGVwIDE6IFN1Ym1pdCB0byBxdWV1ZQogICAgICAgICAgICAgICAgcXVldWVfcmVzcCA9IGF3YWl0IHN1Ym1pdF9yZXF1ZXN0KHNlc3Npb24sIGxpbWl0ZXIsIHByb21wdCkKICAgICAgICAgICAgICAgIHJlcXVlc3RfaWQgPSBxdWV1ZV9yZXNwLmdldCgicmVxdWVzdF9pZCIsICI/IikKICAgICAgICAgICAgICAgIHN0YXR1c191cmwgPSBxdWV1ZV9yZXNwLmdldCgic3RhdHVzX3VybCIpCiAgICAgICAgICAgICAgICByZXNwb25zZV91cmwgPSBxdWV1ZV9yZXNwLmdldCgicmVzcG9uc2VfdXJsIikKCiAgICAgICAgICAgICAgICBpZiBub3Qgc3RhdHVzX3VybCBvciBub3QgcmVzcG9uc2VfdXJsOgogICAgICAgICAgICAgICAgICAgIHJhaXNlIFJ1bnRpbWVFcnJvcihmIk1pc3Npbmcgc3RhdHVzL3Jlc3BvbnNlIFVSTHMgaW4gcXVldWUgcmVzcG9uc2U6IHtxdWV1ZV9yZXNwfSIpCgogICAgICAgICAgICAgICAgIyBTdGVwIDI6IFBvbGwgdW50aWwgZG9uZQogICAgICAgICAgICAgICAgYXdhaXQgcG9sbF91bnRpbF9kb25lKHNlc3Npb24sIGxpbWl0ZXIsIHN0YXR1c191cmwpCgogICAgICAgICAgICAgICAgIyBTdGVwIDM6IEZldGNoIHJlc3VsdAogICAgICAgICAgICAgICAgcmVzdWx0ID0gYXdhaXQgZmV0Y2hfcmVzdWx0KHNlc3Npb24sIGxpbWl0ZXIsIHJlc3BvbnNlX3VybCkKCiAgICAgICAgICAgICAgICAjIFN0ZXAgNDogRXh0cmFjdCBpbWFnZSBVUkwgYW5kIGRvd25sb2FkCiAgICAgICAgICAgICAgICBpbWFnZXMgPSByZXN1bHQuZ2V0KCJpbWFnZXMiLCBbXSkKICAgICAgICAgICAgICAgIGlmIG5vdCBpbWFnZXM6CiAgICAgICAgICAgICAgICAgICAgIyBTb21lIG1vZGVscyByZXR1cm4gb3V0cHV0LmltYWdlcyBvciBkYXRhLmltYWdlcwogICAgICAgICAgICAgICAgICAgIG91dHB1dCA9IHJlc3VsdC5nZXQoIm91dHB1dCIsIHJlc3VsdC5nZXQoImRhdGEiLCB7fSkpCiAgICAgICAgICAgICAgICAgICAgaWYgaXNpbnN0YW5jZShvdXRwdXQsIGRpY3QpOgogICAgICAgICAgICAgICAgICAgICAgICBpbWFnZXMgPSBvdXRwdXQuZ2V0KCJpbWFnZXMiLCBbXSkKCiAgICAgICAgICAgICAgICBpZiBub3QgaW1hZ2VzOgogICAgICAgICAgICAgICAgICAgIHJhaXNlIFJ1bnRpbWVFcnJvcihmIk5vIGltYWdlcyBpbiByZXNwb25zZToge29yanNvbi5kdW1wcyhyZXN1bHQpLmRlY29kZSgpWzo1MDBdfSIpCgogICAgICAgICAgICAgICAgaW1hZ2VfdXJsID0gaW1hZ2VzWzBdLmdldCgidXJsIikgaWYgaXNpbnN0YW5jZShpbWFnZXNbMF0sIGRpY3QpIGVsc2UgaW1hZ2VzWzBdCiAgICAgICAgICAgICAgICBpZiBub3QgaW1hZ2VfdXJsOgogICAgICAgICAgICAgICAgICAgIHJhaXNlIFJ1bnRpbWVFcnJvcihmIk5vIFVSTCBpbiBpbWFnZSBkYXRhOiB7aW1hZ2VzWzBdfSIpCgogICAgICAgICAgICAgICAgYXdhaXQgZG93bmxvYWRfaW1hZ2Uoc2Vzc2lvbiwgaW1hZ2VfdXJsLCBkZXN0X3BhdGgpCiAgICAgICAgICAgICAgICByZXR1cm4gVHJ1ZQoKICAgICAgICAgICAgZXhjZXB0IEV4Y2VwdGlvbiBhcyBlOgogICAgICAgICAgICAgICAgcHJpbnQoZiIgICAgWyFdICN7dG9rZW5faWQ6MDRkfSBhdHRlbXB0IHtyZXRyeSArIDF9L3tNQVhfUkVUUklFU30gZmFpbGVkOiB7ZX0iKQogICAgICAgICAgICAgICAgaWYgbm90IGlzX3JldHJ5YWJsZShlKToKICAgICAgICAgICAgICAgICAgICBwcmludChmIiAgICBbIV0gI3t0b2tlbl9pZDowNGR9IG5vdCByZXRyeWFibGUsIGdpdmluZyB1cCIpCiAgICAgICAgICAgICAgICAgICAgYnJlYWsKICAgICAgICAgICAgICAgIGlmIHJldHJ5IDwgTUFYX1JFVFJJRVMgLSAxOgogICAgICAgICAgICAgICAgICAgIHdhaXQgPSByZXRyeV9kZWxheShyZXRyeSwgZSkKICAgICAgICAgICAgICAgICAgICBwcmludChmIiAgICBbIV0gI3t0b2tlbl9pZDowNGR9IHJldHJ5aW5nIGluIHt3YWl0Oi4xZn1zLi4uIikKICAgICAgICAgICAgICAgICAgICBhd2FpdCBhc3luY2lvLnNsZWVwKHdhaXQpCgogICAgcmV0dXJuIEZhbHNlCgoKYXN5bmMgZGVmIGdlbmVyYXRlX2FsbCgKICAgIHRvX2dlbmVyYXRlOiBsaXN0LAogICAgYWdlbnRzX2J5X2lkOiBkaWN0LAogICAgY29uY3VycmVuY3k6IGludCwKICAgIHJhdGU6IGZsb2F0LAopIC0+IGxpc3Q6CiAgICAiIiJHZW5lcmF0ZSBhbGwgcmVxdWVzdGVkIGltYWdlcyBjb25jdXJyZW50bHkuIFJldHVybnMgdGhlIGxpc3Qgb2YgZmFpbGVkIHRva2VuIElEcy4iIiIKICAgIHNlbSA9IGFzeW5jaW8uU2VtYXBob3JlKGNvbmN1cnJlbmN5KQogICAgbGltaXRlciA9IFJhdGVMaW1pdGVyKHJhdGUsIGJ1cnN0PWNvbmN1cnJlbmN5KQogICAgIyBPbmUgcG9vbGVkLCBrZWVwLWFsaXZlIGNvbm5lY3RvciBmb3IgdGhlIHdob2xlIHJ1bjogcG9sbHMgYW5kIGZldGNoZXMgcmV1c2UKICAgICMgd2FybSBUTFMgY29ubmVjdGlvbnMgdG8gcXVldWUuZmFsLnJ1biBpbnN0ZWFkIG9mIHJlY29ubmVjdGluZyBwZXIgY2FsbC4KICAgICMgRWFjaCB3b3JrZXIgaG9sZHMgYXQgbW9zdCBvbmUgY29ubmVjdGlvbiBhdCBhIHRpbWUgKGEgc3RhdHVzIHN0cmVhbSBzdGF5cwogICAgIyBvcGVuIGZvciBhIHdob2xlIGdlbmVyYXRpb24pLCBzbyB0aGUgcG9vbCBpcyBzaXplZCBmcm9tIHRoZSBjb25jdXJyZW5jeS4KICAgICMgQSBzbWFsbGVyIHBvb2wgd291bGQgbGVhdmUgc3VibWl0cyBhbmQgZmV0Y2hlcyBxdWV1ZWQgZm9yIGEgY29ubmVjdGlvbgogICAgIyB1bnRpbCBBUElfVElNRU9VVCBleHBpcmVzLgogICAgcG9vbF9zaXplID0gY29uY3VycmVuY3kgKyBDT05ORUNUSU9OX0hFQURST09NCiAgICBjb25uZWN0b3IgPSBhaW9odHRwLlRDUENvbm5lY3RvcigKICAgICAgICBsaW1pdD1wb29sX3NpemUsCiAgICAgICAgbGltaXRfcGVyX2hvc3Q9cG9vbF9zaXplLAogICAgICAgIGtlZXBhbGl2ZV90aW1lb3V0PTYwLAogICAgICAgIHR0bF9kbnNfY2FjaGU9MzAwLAogICAgKQoKICAgIGFzeW5jIHdpdGggYWlvaHR0cC5DbGllbnRTZXNzaW9uKGNvbm5lY3Rvcj1jb25uZWN0b3IpIGFzIHNlc3Npb246CgogICAgICAgIGFzeW5jIGRlZiBydW4odGlkOiBpbnQpOgogICAgICAgICAgICBvayA9IGF3YWl0IGdlbmVyYXRlX3NpbmdsZShzZXNzaW9uLCBzZW0sIGxpbWl0ZXIsIHRpZCwgYWdlbnRzX2J5X2lkW3RpZF1bInByb21wdCJdKQogICAgICAgICAgICByZXR1cm4gdGlkLCBvawoKICAgICAgICBmYWlsZWRfaWRzID0gW10KICAgICAgICB0YXNrcyA9IFtydW4odGlkKSBmb3IgdGlkIGluIHRvX2dlbmVyYXRlXQogICAgICAgIGZvciBpLCBmaW5pc2hlZCBpbiBlbnVtZXJhdGUoYXN5bmNpby5hc19jb21wbGV0ZWQodGFza3MpKToKICAgICAgICAgICAgdGlkLCBvayA9IGF3YWl0IGZpbmlzaGVkCiAgICAgICAgICAgIHByb2dyZXNzID0gZiJbe2kgKyAxfS97bGVuKHRvX2dlbmVyYXRlKX1dIgogICAgICAgICAgICBwcmludChmIntwcm9ncmVzc30gI3t0aWQ6MDRkfSAoe2FnZW50c19ieV9pZFt0aWRdWydyYXJpdHknXX0pLi4uIHsnT0snIGlmIG9rIGVsc2UgJ0ZBSUxFRCd9IikKICAgICAgICAgICAgaWYgbm90IG9rOgogICAgICAgICAgICAgICAgZmFpbGVkX2lkcy5hcHBlbmQodGlkKQoKICAgIHJldHVybiBzb3J0ZWQoZmFpbGVkX2lkcykKCgpkZWYgcG9zaXRpdmVfaW50KHZhbHVlOiBzdHIpIC0+IGludDoKICAgICIiImFyZ3BhcnNlIHR5cGUgZm9yIGNvdW50cyB0aGF0IG11c3QgYmUgYXQgbGVhc3QgMS4iIiIKICAgIG4gPSBpbnQodmFsdWUpCiAgICBpZiBuIDw9IDA6CiAgICAgICAgcmFpc2UgYXJncGFyc2UuQXJndW1lbnRUeXBlRXJyb3IoZiJtdXN0IGJlIGEgcG9zaXRpdmUgaW50ZWdlciwgZ290IHt2YWx1ZX0iKQogICAgcmV0dXJuIG4KCgpkZWYgcG9zaXRpdmVfZmxvYXQodmFsdWU6IHN0cikgLT4gZmxvYXQ6CiAgICAiIiJhcmdwYXJzZSB0eXBlIGZvciByYXRlcyB0aGF0IG11c3QgYmUgYWJvdmUgemVyby4iIiIKICAgIHggPSBmbG9hdCh2YWx1ZSkKICAgIGlmIG5vdCB4ID4gMDoKICAgICAgICByYWlzZSBhcmdwYXJzZS5Bcmd1bWVudFR5cGVFcnJvcihmIm11c3QgYmUgZ3JlYXRlciB0aGFuIDAsIGdvdCB7dmFsdWV9IikKICAgIHJldHVybiB4CgoKIyDilIDilIAgTWFpbiDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIDilIAKCmRlZiBtYWluKCk6CiAgICBnbG9iYWwgUVVFVUVfVVJMCgogICAgcGFyc2VyID0gYXJncGFyc2UuQXJndW1lbnRQYXJzZXIoZGVzY3JpcHRpb249IkdlbmVyYXRlIE5GVCBpbWFnZXMgdmlhIGZhbC5haSIpCiAgICBwYXJzZXIuYWRkX2FyZ3VtZW50KCItLXN0YXJ0IiwgdHlwZT1pbnQsIGRlZmF1bHQ9MSwgaGVscD0iRmlyc3QgdG9rZW4gSUQgKGRlZmF1bHQ6IDEpIikKICAgIHBhcnNlci5hZGRfYXJndW1lbnQoIi0tZW5kIiwgdHlwZT1pbnQsIGRlZmF1bHQ9MjAwMCwgaGVscD0iTGFzdCB0b2tlbiBJRCAoZGVmYXVsdDogMjAwMCkiKQogICAgcGFyc2VyLmFkZF9hcmd1bWVudCgiLS1yZWRvIiwgdHlwZT1zdHIsIGRlZmF1bHQ9IiIsIGhlbHA9IkNvbW1hLXNlcGFyYXRlZCB0b2tlbiBJRHMgdG8gcmVnZW5lcmF0ZSIpCiAgICBwYXJzZXIuYWRkX2FyZ3VtZW50KCItLXJhdGUiLCB0eXBlPXBvc2l0aXZlX2Zsb2F0LCBkZWZhdWx0PVJFUVVFU1RTX1BFUl9TRUNPTkQsIGhlbHA9ZiJNYXggcXVldWUgQVBJIGNhbGxzIHBlciBzZWNvbmQgKGRlZmF1bHQ6IHtSRVFVRVNUU19QRVJfU0VDT05EfSkiKQogICAgcGFyc2VyLmFkZF9hcmd1bWVudCgiLS1jb25jdXJyZW5jeSIsIHR5cGU9cG9zaXRpdmVfaW50LCBkZWZhdWx0PUNPTkNVUlJFTkNZLCBoZWxwPWYiSW1hZ2VzIGdlbmVyYXRlZCBpbiBwYXJhbGxlbCAoZGVmYXVsdDoge0NPTkNVUlJFTkNZfSkiKQogICAgcGFyc2VyLmFkZF9hcmd1bWVudCgiLS1tb2RlbCIsIHR5cGU9c3RyLCBkZWZhdWx0PU1PREVMX0lELCBoZWxwPWYiZmFsLmFpIG1vZGVsIElEIChkZWZhdWx0OiB7TU9ERUxfSUR9KSIpCiAgICBhcmdzID0gcGFyc2VyLnBhcnNlX2FyZ3MoKQoKICAgIGlmIGFyZ3MubW9kZWwgIT0gTU9ERUxfSUQ6CiAgICAgICAgUVVFVUVfVVJMID0gZiJodHRwczovL3F1ZXVlLmZhbC5ydW4ve2FyZ3MubW9kZWx9IgoKICAgIGlmIG5vdCBGQUxfS0VZOgogICAgICAgIHByaW50KCJFUlJPUjogRkFMX0tFWSBlbnZpcm9ubWVudCB2YXJpYWJsZSBub3Qgc2V0LiIpCiAgICAgICAgc3lzLmV4aXQoMSkKCiAgICAjIExvYWQgY29sbGVjdGlvbgogICAgd2l0aCBvcGVuKENPTExFQ1RJT05fUEFUSCkgYXMgZjoKICAgICAgICBjb2xsZWN0aW9uID0ganNvbi5sb2FkKGYpCgogICAgIyBCdWlsZCBsb29rdXAgYnkgdG9rZW5faWQKICAgIGFnZW50c19ieV9pZCA9IHthWyJ0b2tlbl9pZCJdOiBhIGZvciBhIGluIGNvbGxlY3Rpb259CgogICAgIyBEZXRlcm1pbmUgd2hpY2ggSURzIHRvIHByb2Nlc3MKICAgIGlmIGFyZ3MucmVkbzoKICAgICAgICB0b2tlbl9pZHMgPSBbaW50KHguc3RyaXAoKSkgZm9yIHggaW4gYXJncy5yZWRvLnNwbGl0KCIsIikgaWYgeC5zdHJpcCgpXQogICAgICAgIGZvcmNlID0gVHJ1ZQogICAgICAgIHByaW50KGYiUkVETyBtb2RlOiByZWdlbmVyYXRpbmcge2xlbih0b2tlbl9pZHMpfSBzcGVjaWZpYyBpbWFnZXMiKQogICAgZWxzZToKICAgICAgICB0b2tlbl9pZHMgPSBsaXN0KHJhbmdlKGFyZ3Muc3RhcnQsIGFyZ3MuZW5kICsgMSkpCiAgICAgICAgZm9yY2UgPSBGYWxzZQogICAgICAgIHByaW50KGYiR2VuZXJhdGluZyBpbWFnZXMgI3thcmdzLnN0YXJ0OjA0ZH0gdG8gI3thcmdzLmVuZDowNGR9ICh7bGVuKHRva2VuX2lkcyl9IHRvdGFsKSIpCgogICAgb3MubWFrZWRpcnMoSU1BR0VTX0RJUiwgZXhpc3Rfb2s9VHJ1ZSkKCiAgICAjIFJlc3VtZSBjYXBhYmlsaXR5OiBza2lwIGltYWdlcyBhbHJlYWR5IG9uIGRpc2sgKHVubGVzcyBmb3JjZS9yZWRvKQogICAgaWYgZm9yY2U6CiAgICAgICAgZG9uZSA9IHNldCgpCiAgICBlbHNlOgogICAgICAgIGRvbmUgPSBzY2FuX2NvbXBsZXRlZF9pbWFnZXMoe2Yie3RpZDowNGR9LnBuZyIgZm9yIHRpZCBpbiB0b2tlbl9pZHN9KQogICAgYWxyZWFkeV9kb25lID0gMAogICAgdG9fZ2VuZXJhdGUgPSBbXQogICAgZm9yIHRpZCBpbiB0b2tlbl9pZHM6CiAgICAgICAgaWYgdGlkIG5vdCBpbiBhZ2VudHNfYnlfaWQ6CiAgICAgICAgICAgIHByaW50KGYiV0FSTklORzogVG9rZW4gSUQge3RpZH0gbm90IGZvdW5kIGluIGNvbGxlY3Rpb24sIHNraXBwaW5nIikKICAgICAgICAgICAgY29udGludWUKICAgICAgICBpZiBmInt0aWQ6MDRkfS5wbmciIGluIGRvbmU6CiAgICAgICAgICAgIGFscmVhZHlfZG9uZSArPSAxCiAgICAgICAgZWxzZToKICAgICAgICAgICAgdG9fZ2VuZXJhdGUuYXBwZW5kKHRpZCkKCiAgICBwcmludChmIkFscmVhZHkgY29tcGxldGVkOiB7YWxyZWFkeV9kb25lfSIpCiAgICBwcmludChmIlRvIGdlbmVyYXRlOiB7bGVuKHRvX2dlbmVyYXRlKX0iKQogICAgcHJpbnQoZiJNb2RlbDoge2FyZ3MubW9kZWx9IikKICAgIHByaW50KGYiQ29uY3VycmVuY3k6IHthcmdzLmNvbmN1cnJlbmN5fSIpCiAgICBwcmludChmIlJhdGUgbGltaXQ6IHthcmdzLnJhdGV9IHJlcS9zIikKICAgIHByaW50KCItIiAqIDUwKQoKICAgIGlmIG5vdCB0b19nZW5lcmF0ZToKICAgICAgICBwcmludCgiTm90aGluZyB0byBnZW5lcmF0ZSDigJQgYWxsIGltYWdlcyBhbHJlYWR5IGV4aXN0ISIpCiAgICAgICAgcmV0dXJuCgogICAgZmFpbGVkX2lkcyA9IGFzeW5jaW8ucnVuKGdlbmVyYXRlX2FsbCh0b19nZW5lcmF0ZSwgYWdlbnRzX2J5X2lkLCBhcmdzLmNvbmN1cnJlbmN5LCBhcmdzLnJhdGUpKQogICAgZmFpbHVyZXMgPSBsZW4oZmFpbGVkX2lkcykKICAgIHN1Y2Nlc3NlcyA9IGxlbih0b19nZW5lcmF0ZSkgLSBmYWlsdXJlcwoKICAgICMg4pSA4pSAIFN1bW1hcnkg4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSA4pSACiAgICBwcmludCgpCiAgICBwcmludCgiPSIgKiA1MCkKICAgIHByaW50KCJHRU5FUkFUSU9OIENPTVBMRVRFIikKICAgIHByaW50KCI9IiAqIDUwKQogICAgcHJpbnQoZiJTdWNjZXNzZnVsOiB7c3VjY2Vzc2VzfSIpCiAgICBwcmludChmIkZhaWxlZDogICAgIHtmYWlsdXJlc30iKQogICAgcHJpbnQoZiJTa2lwcGVkOiAgICB7YWxyZWFkeV9kb25lfSIpCiAgICBpZiBmYWlsZWRfaWRzOgogICAgICAgIGlkc19zdHIgPSAiLCIuam9pbihzdHIoeCkgZm9yIHggaW4gZmFpbGVkX2lkcykKICAgICAgICBwcmludChmIlxuRmFpbGVkIElEcyAocmUtcnVuIHdpdGggLS1yZWRvIHtpZHNfc3RyfSk6IikKICAgICAgICBmb3IgdGlkIGluIGZhaWxlZF9pZHM6CiAgICAgICAgICAgIHByaW50KGYiICAje3RpZDowNGR9IikKCgppZiBfX25hbWVfXyA9PSAiX19tYWluX18iOgogICAgbWFpbigpCg==",
+    "update_metadata_cid.py": "IyEvdXNyL2Jpbi9lbnYgcHl0aG9uMwoiIiIKUmVwbGFjZSBZT1VSX0NJRF9IRVJFIGluIGFsbCBtZXRhZGF0YSBmaWxlcyB3aXRoIGFuIGFjdHVhbCBJUEZTIENJRC4KClVzYWdlOgogICAgcHl0aG9uIHVwZGF0ZV9tZXRhZGF0YV9jaWQucHkgUW1Zb3VyQWN0dWFsQ0lESGVyZQoiIiIKCmltcG9ydCBvcwppbXBvcnQgcmUKaW1wb3J0IHN5cwpmcm9tIGNvbmN1cnJlbnQuZnV0dXJlcyBpbXBvcnQgVGhyZWFkUG9vbEV4ZWN1dG9yCmZyb20gZnVuY3Rvb2xzIGltcG9ydCBwYXJ0aWFsCmZyb20gcGF0aGxpYiBpbXBvcnQgUGF0aApmcm9tIHR5cGluZyBpbXBvcnQgT3B0aW9uYWwKClBMQUNFSE9MREVSID0gYiJZT1VSX0NJRF9IRVJFIgojIElQRlMgQ0lEcyAoYmFzZTU4YnRjIC8gYmFzZTMyKSBhcmUgcGxhaW4gYWxwaGFudW1lcmljczsgYW55dGhpbmcgZWxzZSB3b3VsZAojIG5lZWQgZXNjYXBpbmcgaW5zaWRlIHRoZSBKU09OIHN0cmluZyBhbmQgdGhlIGlwZnM6Ly8gVVJMLgpDSURfUEFUVEVSTiA9IHJlLmNvbXBpbGUociJbQS1aYS16MC05XSsiKQoKCmRlZiByZWFkX2ZpbGUocGF0aDogc3RyKSAtPiBPcHRpb25hbFt0dXBsZV06CiAgICAiIiJSZWFkIG9uZSBtZXRhZGF0YSBmaWxlIGFuZCBjb3VudCBpdHMgcGxhY2Vob2xkZXJzLiBSZXR1cm5zIChwYXRoLCBkYXRhKQogICAgaWYgaXQgbmVlZHMgdXBkYXRpbmcsIE5vbmUgaWYgaXQgZG9lc24ndC4KCiAgICBSYWlzZXMgVmFsdWVFcnJvciBpZiB0aGUgcGxhY2Vob2xkZXIgYXBwZWFycyBtb3JlIHRoYW4gb25jZS4KICAgICIiIgogICAgZGF0YSA9IFBhdGgocGF0aCkucmVhZF9ieXRlcygpCiAgICBjb3VudCA9IGRhdGEuY291bnQoUExBQ0VIT0xERVIpCiAgICBpZiBjb3VudCA9PSAwOgogICAgICAgIHJldHVybiBOb25lCiAgICBpZiBjb3VudCA+IDE6CiAgICAgICAgcmFpc2UgVmFsdWVFcnJvcihmIntwYXRofSBjb250YWlucyB7UExBQ0VIT0xERVIuZGVjb2RlKCl9IHtjb3VudH0gdGltZXMsIGV4cGVjdGVkIG9uY2UiKQogICAgcmV0dXJuIHBhdGgsIGRhdGEKCgpkZWYgd3JpdGVfZmlsZShwZW5kaW5nOiB0dXBsZSwgY2lkOiBieXRlcyk6CiAgICAiIiJTd2FwIHRoZSBwbGFjZWhvbGRlciBDSUQgaW4gb25lIG1ldGFkYXRhIGZpbGUgcmVhZCBieSByZWFkX2ZpbGUoKS4KCiAgICBBIHBsYWluIGJ5dGUgcmVwbGFjZTogbm8gSlNPTiByb3VuZC10cmlwLCBhbmQgZm9ybWF0dGluZyBpcyBsZWZ0IHVudG91Y2hlZC4KICAgICIiIgogICAgcGF0aCwgZGF0YSA9IHBlbmRpbmcKICAgIFBhdGgocGF0aCkud3JpdGVfYnl0ZXMoZGF0YS5yZXBsYWNlKFBMQUNFSE9MREVSLCBjaWQpKQoKCmRlZiBtYWluKCk6CiAgICBpZiBsZW4oc3lzLmFyZ3YpICE9IDI6CiAgICAgICAgcHJpbnQoIlVzYWdlOiBweXRob24gdXBkYXRlX21ldGFkYXRhX2NpZC5weSA8SVBGU19DSUQ+IikKICAgICAgICBwcmludCgiRXhhbXBsZTogcHl0aG9uIHVwZGF0ZV9tZXRhZGF0YV9jaWQucHkgUW1YeTd6Li4uIikKICAgICAgICBzeXMuZXhpdCgxKQoKICAgIGNpZCA9IHN5cy5hcmd2WzFdLnN0cmlwKCkKICAgIG1ldGFkYXRhX2RpciA9ICJvdXRwdXQvbWV0YWRhdGEiCgogICAgaWYgbm90IENJRF9QQVRURVJOLmZ1bGxtYXRjaChjaWQpOgogICAgICAgIHByaW50KGYiRVJST1I6IHtjaWQhcn0gaXMgbm90IGEgdmFsaWQgQ0lEIChleHBlY3RlZCBsZXR0ZXJzIGFuZCBkaWdpdHMgb25seSkuIikKICAgICAgICBzeXMuZXhpdCgxKQoKICAgIGlmIG5vdCBvcy5wYXRoLmlzZGlyKG1ldGFkYXRhX2Rpcik6CiAgICAgICAgcHJpbnQoZiJFUlJPUjoge21ldGFkYXRhX2Rpcn0gbm90IGZvdW5kLiBSdW4gZ2VuZXJhdGVfcHJvbXB0cy5weSBmaXJzdC4iKQogICAgICAgIHN5cy5leGl0KDEpCgogICAgIyBPcmRlciBkb2Vzbid0IG1hdHRlciBoZXJlLCBzbyBza2lwIHNvcnRpbmcgYW5kIHRha2Ugc2NhbmRpcidzIGNhY2hlZCB0eXBlcwogICAgd2l0aCBvcy5zY2FuZGlyKG1ldGFkYXRhX2RpcikgYXMgaXQ6CiAgICAgICAgcGF0aHMgPSBbZW50cnkucGF0aCBmb3IgZW50cnkgaW4gaXQgaWYgZW50cnkubmFtZS5lbmRzd2l0aCgiLmpzb24iKSBhbmQgZW50cnkuaXNfZmlsZSgpXQoKICAgIHdpdGggVGhyZWFkUG9vbEV4ZWN1dG9yKG1heF93b3JrZXJzPTE2KSBhcyBleGVjdXRvcjoKICAgICAgICAjIENoZWNrIGV2ZXJ5IGZpbGUgYmVmb3JlIHdyaXRpbmcgYW55LCBzbyBhIGJhZCBmaWxlIGNhbid0IGxlYXZlIHRoZQogICAgICAgICMgY29sbGVjdGlvbiBoYWxmIHVwZGF0ZWQKICAgICAgICB0cnk6CiAgICAgICAgICAgIHBlbmRpbmcgPSBbcCBmb3IgcCBpbiBleGVjdXRvci5tYXAocmVhZF9maWxlLCBwYXRocykgaWYgcCBpcyBub3QgTm9uZV0KICAgICAgICBleGNlcHQgVmFsdWVFcnJvciBhcyBlOgogICAgICAgICAgICBwcmludChmIkVSUk9SOiB7ZX0iKQogICAgICAgICAgICBwcmludCgiTm8gZmlsZXMgd2VyZSBtb2RpZmllZC4iKQogICAgICAgICAgICBzeXMuZXhpdCgxKQoKICAgICAgICBsaXN0KGV4ZWN1dG9yLm1hcChwYXJ0aWFsKHdyaXRlX2ZpbGUsIGNpZD1jaWQuZW5jb2RlKCkpLCBwZW5kaW5nKSkKICAgIHVwZGF0ZWQgPSBsZW4ocGVuZGluZykKCiAgICBwcmludChmIlVwZGF0ZWQge3VwZGF0ZWR9IG1ldGFkYXRhIGZpbGVzIHdpdGggQ0lEOiB7Y2lkfSIpCiAgICBpZiB1cGRhdGVkID09IDA6CiAgICAgICAgcHJpbnQoIihObyBmaWxlcyBjb250YWluZWQgWU9VUl9DSURfSEVSRSDigJQgd2VyZSB0aGV5IGFscmVhZHkgdXBkYXRlZD8pIikKCgppZiBfX25hbWVfXyA9PSAiX19tYWluX18iOgogICAgbWFpbigpCg==",
 }
 
 os.makedirs(PROJECT, exist_ok=True)
@@ -6,9 +6,42 @@ Usage:
     python update_metadata_cid.py QmYourActualCIDHere
 """
 
-import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+PLACEHOLDER = b"YOUR_CID_HERE"
+# IPFS CIDs (base58btc / base32) are plain alphanumerics; anything else would
+# need escaping inside the JSON string and the ipfs:// URL.
+CID_PATTERN = re.compile(r"[A-Za-z0-9]+")
+
+
+def read_file(path: str) -> Optional[tuple]:
+    """Read one metadata file and count its placeholders. Returns (path, data)
+    if it needs updating, None if it doesn't.
+
+    Raises ValueError if the placeholder appears more than once.
+    """
+    data = Path(path).read_bytes()
+    count = data.count(PLACEHOLDER)
+    if count == 0:
+        return None
+    if count > 1:
+        raise ValueError(f"{path} contains {PLACEHOLDER.decode()} {count} times, expected once")
+    return path, data
+
+
+def write_file(pending: tuple, cid: bytes):
+    """Swap the placeholder CID in one metadata file read by read_file().
+
+    A plain byte replace: no JSON round-trip, and formatting is left untouched.
+    """
+    path, data = pending
+    Path(path).write_bytes(data.replace(PLACEHOLDER, cid))
 
 
 def main():
@@ -20,26 +53,30 @@ def main():
     cid = sys.argv[1].strip()
     metadata_dir = "output/metadata"
 
+    if not CID_PATTERN.fullmatch(cid):
+        print(f"ERROR: {cid!r} is not a valid CID (expected letters and digits only).")
+        sys.exit(1)
+
     if not os.path.isdir(metadata_dir):
         print(f"ERROR: {metadata_dir} not found. Run generate_prompts.py first.")
         sys.exit(1)
 
-    updated = 0
-    for filename in sorted(os.listdir(metadata_dir)):
-        if not filename.endswith(".json"):
-            continue
-        path = os.path.join(metadata_dir, filename)
-        with open(path) as f:
-            data = json.load(f)
-
-        old_image = data.get("image", "")
-        new_image = old_image.replace("YOUR_CID_HERE", cid)
-
-        if new_image != old_image:
-            data["image"] = new_image
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
-            updated += 1
+    # Order doesn't matter here, so skip sorting and take scandir's cached types
+    with os.scandir(metadata_dir) as it:
+        paths = [entry.path for entry in it if entry.name.endswith(".json") and entry.is_file()]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        # Check every file before writing any, so a bad file can't leave the
+        # collection half updated
+        try:
+            pending = [p for p in executor.map(read_file, paths) if p is not None]
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            print("No files were modified.")
+            sys.exit(1)
+
+        list(executor.map(partial(write_file, cid=cid.encode()), pending))
+    updated = len(pending)
 
     print(f"Updated {updated} metadata files with CID: {cid}")
     if updated == 0: